@@ -0,0 +1,139 @@
+"""Time and peak memory of the cell_* methods of all grid types and of the
+polygon areas computed from cell corners
+
+Grid methods cache their results, so every timed call gets a new grid
+instance (number = 1, with a fresh grid created in setup).
+"""
+from ocp_tool import spherical
+from ocp_tool.grids import FullGaussianGrid, RegularLatLonGrid
+from ocp_tool.synthetic import gaussian_latitudes
+
+from .common import ORCA_SHAPES, TRUNCATIONS, domain_cfg, octahedral_grid
+
+
+class ReducedGaussian:
+
+    params = TRUNCATIONS
+    param_names = ['truncation']
+    number = 1
+    repeat = (1, 5, 30.0)
+    timeout = 600
+
+    def setup(self, truncation):
+        self.grid = octahedral_grid(truncation)
+
+    def time_cell_latitudes(self, truncation):
+        self.grid.cell_latitudes()
+
+    def time_cell_longitudes(self, truncation):
+        self.grid.cell_longitudes()
+
+    def time_cell_corners(self, truncation):
+        self.grid.cell_corners()
+
+    def time_cell_areas(self, truncation):
+        self.grid.cell_areas()
+
+    def peakmem_cell_corners(self, truncation):
+        self.grid.cell_corners()
+
+    def peakmem_cell_areas(self, truncation):
+        self.grid.cell_areas()
+
+
+class RegularLatLon:
+
+    # Number of latitudes (with twice as many longitudes)
+    params = (180, 720, 1800, 3600)
+    param_names = ['nlats']
+    number = 1
+    repeat = (1, 5, 30.0)
+    timeout = 600
+
+    def setup(self, nlats):
+        self.grid = RegularLatLonGrid(nlats=nlats, nlons=2*nlats)
+
+    def time_cell_latitudes(self, nlats):
+        self.grid.cell_latitudes()
+
+    def time_cell_longitudes(self, nlats):
+        self.grid.cell_longitudes()
+
+    def time_cell_corners(self, nlats):
+        self.grid.cell_corners()
+
+    def time_cell_areas(self, nlats):
+        self.grid.cell_areas()
+
+    def peakmem_cell_corners(self, nlats):
+        self.grid.cell_corners()
+
+
+class FullGaussian:
+
+    params = TRUNCATIONS
+    param_names = ['truncation']
+    number = 1
+    repeat = (1, 5, 30.0)
+    timeout = 600
+
+    def setup(self, truncation):
+        # Latitudes from south to north, as for the F grids in ocp_tool
+        self.grid = FullGaussianGrid(
+            lats=gaussian_latitudes(truncation+1)[::-1]
+        )
+
+    def time_cell_corners(self, truncation):
+        self.grid.cell_corners()
+
+    def time_cell_areas(self, truncation):
+        self.grid.cell_areas()
+
+    def peakmem_cell_corners(self, truncation):
+        self.grid.cell_corners()
+
+
+class ORCA:
+
+    params = (ORCA_SHAPES, ['t', 'u', 'v'])
+    param_names = ['shape', 'subgrid']
+    number = 1
+    repeat = (1, 5, 30.0)
+    timeout = 600
+
+    def setup(self, shape, subgrid):
+        from ocp_tool.grids import ORCA
+        self.grid = ORCA(domain_cfg(*shape))
+
+    def time_cell_latitudes(self, shape, subgrid):
+        self.grid.cell_latitudes(subgrid)
+
+    def time_cell_areas(self, shape, subgrid):
+        self.grid.cell_areas(subgrid)
+
+    def time_cell_masks(self, shape, subgrid):
+        self.grid.cell_masks(subgrid)
+
+    def time_cell_corners(self, shape, subgrid):
+        self.grid.cell_corners(subgrid)
+
+    def peakmem_cell_corners(self, shape, subgrid):
+        self.grid.cell_corners(subgrid)
+
+
+class PolygonAreas:
+
+    params = TRUNCATIONS
+    param_names = ['truncation']
+    number = 1
+    repeat = (1, 5, 30.0)
+    timeout = 600
+
+    def setup(self, truncation):
+        self.corners = octahedral_grid(truncation).cell_corners()
+
+    def time_corner_areas(self, truncation):
+        spherical.corner_areas(self.corners)
+
+    def peakmem_corner_areas(self, truncation):
+        spherical.corner_areas(self.corners)
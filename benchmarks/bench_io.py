@@ -0,0 +1,120 @@
+"""Time and peak memory of writing the OASIS files and of GRIB file access"""
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+import numpy as np
+
+from ocp_tool import grib, oasis
+
+from .common import TRUNCATIONS, icmgg_init, octahedral_grid
+
+
+class OasisWrite:
+
+    params = TRUNCATIONS
+    param_names = ['truncation']
+    number = 1
+    repeat = (1, 5, 30.0)
+    timeout = 600
+
+    def setup(self, truncation):
+        grid = octahedral_grid(truncation)
+        self.lats = grid.cell_latitudes()
+        self.lons = grid.cell_longitudes()
+        self.corners = grid.cell_corners()
+        self.areas = grid.cell_areas()
+        self.masks = (np.arange(self.lats.size) % 3 == 0).astype('int32')
+        self.path = tempfile.mkdtemp()
+
+    def teardown(self, truncation):
+        shutil.rmtree(self.path)
+
+    def time_write_grid(self, truncation):
+        oasis.write_grid(
+            'ICMx', self.lats, self.lons, self.corners, path=self.path,
+            append=False
+        )
+
+    def time_write_area(self, truncation):
+        oasis.write_area('ICMx', self.areas, path=self.path, append=False)
+
+    def time_write_mask(self, truncation):
+        oasis.write_mask('ICMx', self.masks, path=self.path, append=False)
+
+    def peakmem_write_grid(self, truncation):
+        oasis.write_grid(
+            'ICMx', self.lats, self.lons, self.corners, path=self.path,
+            append=False
+        )
+
+
+class Grib:
+
+    params = TRUNCATIONS
+    param_names = ['truncation']
+    number = 1
+    repeat = (1, 5, 30.0)
+    timeout = 600
+
+    def setup(self, truncation):
+        self.filename = icmgg_init(truncation)
+        self.fields = grib.read(self.filename, ('lsm', 'slt'))
+        self.path = tempfile.mkdtemp()
+
+    def teardown(self, truncation):
+        shutil.rmtree(self.path)
+
+    def time_read(self, truncation):
+        grib.read(self.filename, ('lsm', 'slt', 'cl'))
+
+    def time_read_grid(self, truncation):
+        grib.read_grid(self.filename)
+
+    def time_copy_modify(self, truncation):
+        grib.copy_modify(
+            self.filename, os.path.join(self.path, 'ICMGG'), self.fields
+        )
+
+    def peakmem_read(self, truncation):
+        grib.read(self.filename, ('lsm', 'slt', 'cl'))
+
+    def peakmem_copy_modify(self, truncation):
+        grib.copy_modify(
+            self.filename, os.path.join(self.path, 'ICMGG'), self.fields
+        )
+
+
+# Modules that must not be loaded by importing ocp_tool.grids, as they are
+# only needed for ORCA grids, GRIB files or remapping
+HEAVY_MODULES = ('netCDF4', 'eccodes', 'gribapi', 'scipy')
+
+
+class Import:
+    """Import time of the package in a fresh interpreter"""
+
+    def track_heavy_modules_grids(self):
+        """Number of HEAVY_MODULES loaded by importing ocp_tool.grids, which
+        fails if there are any"""
+        loaded = subprocess.run(
+            [
+                sys.executable, '-c',
+                'import sys, ocp_tool.grids; '
+                f'print(*(m for m in {HEAVY_MODULES!r} if m in sys.modules))'
+            ],
+            check=True, capture_output=True, text=True,
+        ).stdout.split()
+        assert not loaded, \
+            f'Importing ocp_tool.grids loads {", ".join(loaded)}'
+        return len(loaded)
+
+    def timeraw_import_ocp_tool(self):
+        return 'import ocp_tool'
+
+    def timeraw_import_grids(self):
+        return 'import ocp_tool.grids'
+
+    def timeraw_import_pipeline(self):
+        return 'import ocp_tool.pipeline'
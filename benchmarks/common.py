@@ -0,0 +1,49 @@
+"""Synthetic grids and files for the benchmarks
+
+Grids and input files are generated with ocp_tool.synthetic, not read from
+the packaged definitions, so that the benchmarks cover the whole ladder of
+resolutions, up to TCO1279 and ORCA025.
+"""
+import os
+
+from ocp_tool import synthetic
+
+
+# Cubic octahedral truncations of the benchmark ladder
+TRUNCATIONS = (95, 199, 399, 639, 1279)
+
+# Shapes (nx, ny) of ORCA grids (ORCA1, ORCA025)
+ORCA_SHAPES = ((362, 292), (1442, 1021))
+
+
+def octahedral_grid(truncation):
+    """A new (uncached) TCO<truncation> ReducedGaussianGrid"""
+    return synthetic.octahedral_grid(truncation)
+
+
+def data_file(name):
+    """Path of a benchmark data file in a temporary directory that is kept
+    for the whole benchmark run"""
+    directory = os.path.join(
+        os.environ.get('TMPDIR', '/tmp'), 'ocp_tool_benchmarks'
+    )
+    os.makedirs(directory, exist_ok=True)
+    return os.path.join(directory, name)
+
+
+def icmgg_init(truncation):
+    """Name of a TCO<truncation> ICMGG INIT file, written if necessary"""
+    filename = data_file(f'ICMGGTCO{truncation}INIT')
+    if not os.path.exists(filename):
+        synthetic.write_icmgg_init(
+            filename, synthetic.octahedral_grid(truncation)
+        )
+    return filename
+
+
+def domain_cfg(nx, ny):
+    """Name of an ORCA-like domain_cfg file, written if necessary"""
+    filename = data_file(f'domain_cfg_{nx}x{ny}.nc')
+    if not os.path.exists(filename):
+        synthetic.write_domain_cfg(filename, nx, ny)
+    return filename
@@ -40,14 +40,23 @@ from __future__ import division
 import os
 import sys
 import numpy as np
-import matplotlib.pyplot as plt
-import gribapi
 import csv
 
-from mpl_toolkits.basemap import Basemap
+from concurrent.futures import ProcessPoolExecutor
 from netCDF4 import Dataset
 from shutil import copy2
 
+from ocp_tool import diagnostics
+from ocp_tool import grib
+from ocp_tool import instrument
+from ocp_tool import oasis
+from ocp_tool import regions
+from ocp_tool import runoff
+from ocp_tool.grib import read_grid as read_gaussian_grid
+from ocp_tool.grids import ReducedGaussianGrid
+from ocp_tool.grids import legacy as legacy_grids
+from ocp_tool.grids import red_points
+
 #-----------------------------------------------------------------------------
 # Setup
 #-----------------------------------------------------------------------------
@@ -56,6 +65,10 @@ from shutil import copy2
 earth_radius = 6371. * 1e3 #[m]
 longline = ' \n ==================================================  \n'
 
+# Diagnostic plots are written by background processes, which are joined at
+# the end of the main program
+background_plots = []
+
 
 #-----------------------------------------------------------------------------
 # Function definitions
@@ -96,71 +109,12 @@ def read_grid_file(res_num, input_path_reduced_grid, input_path_full_grid, trunc
 def read_grid_from_icmgg(icmfile, NN, truncation_type):
    """
    Read lon, lats from grib template file
-   Uses CDO to get grid description from a GRIB file
+   Reads the grid description from the header of the first GRIB message
    """
    
-   latitudes = []
-   nlongitudes = []
-   
-   file=icmfile
-   
-   # write grid description to file
-   # only need to do this once
-   os.system('cdo griddes %s > griddes.txt' % (file,))
-   
-   # read data from text file
-   f = open('griddes.txt','r')
-   lines = f.readlines()   
-   for i in range(0,len(lines)):      
-      if 'yvals' in lines[i]:
-         yline = i
-      elif 'rowlon' in lines[i] or 'reducedPoints' in lines[i]:
-         rline = i
-   
-   # read from yvals until we hit rowlon   
-   for i in range(yline,len(lines)):
-      line = lines[i]
-      print(line)
-      if 'rowlon' in line or 'reducedPoints' in line:
-         break
-      if i == yline:
-         # convert data to floats
-         tmp_lat = [float(lat) for lat in line.split()[2:]]
-      else:
-         tmp_lat = [float(lat) for lat in line.split()]
-      # append data to latitudes list
-      for lat in tmp_lat: latitudes.append(lat) 
-      
-   for i in range(rline,len(lines)):
-      line = lines[i]
-      if 'scanningMode' in line: 
-         break 
-      if i == rline:
-         # convert to integers
-         tmp_nlon = [int(nlon) for nlon in line.split()[2:]]
-      else:
-         tmp_nlon = [int(nlon) for nlon in line.split()]
-      # append data to nlongitudes list
-      for nlon in tmp_nlon: nlongitudes.append(nlon) 
-         
-   f.close()
-   
-   print('nlon: ',nlongitudes)
-   print('lat: ',latitudes)
-   
-   # Now construct the grid
-   lons = []
-   lats = []
-   for ilat in range(0,len(nlongitudes)):
-      
-      lat  = latitudes[ilat]
-      nlon = nlongitudes[ilat]
-      
-      lon1  = np.arange(0,360,360./nlon)
-      
-      for lon in lon1: 
-         lons.append(lon)
-         lats.append(lat)   
+   grid = read_gaussian_grid(icmfile)
+   latitudes = grid.lats
+   nlongitudes = grid.nlons
    
    if truncation_type == 'cubic-octahedral':
       ngrid = 'o%d' % (NN,)
@@ -183,179 +137,6 @@ def read_grid_from_icmgg(icmfile, NN, truncation_type):
    return rfile
 
 
-def extract_grid_data(lines):
-    '''
-    This function takes the raw reduced gaussian coordinate list and returns
-    coordinate and neighbour distrance lists for latitude and
-    longitude of every grindpoint, as well as the number of latitudes and
-    longitudes
-    '''
-    gridsize = 0
-    lons_list       = []  # longitudes of each gridpoint
-    lats_list       = []  # latitudes of each gridpoint
-    numlons_list    = []  # number of longitude points for each latitude
-    dlon_list       = []  # longitude distance in degree at each latitude
-    lat_list        = []  # list of latitudes
-
-    for line in lines[3:]:
-        # read latitude number, number of longitudes for red. Gaussian and regular Gauss grids
-        # convert from strings to floats
-        print(line)
-        _, red_points, _, lat = (float(z) for z in line.split())
-
-        # longitudes for reduced Gaussian grid
-        dlon = float(360)/red_points
-        #The -0.000000001 deals with rounding errors a la 360./644*360=359.9999999999994
-        lons = np.arange(0, 360-0.000000001, dlon)
-        numlons_list.append(int(red_points))
-        dlon_list.append(dlon)
-        lat_list.append(lat)
-
-        # set longitudes/latitudes for reduced Gaussian grid on this latitude
-        lons_list.extend(lons)
-        lats_list.extend([lat]*len(lons))
-        gridsize += len(lons)
-
-    return (lons_list, lats_list, numlons_list, dlon_list, lat_list)
-
-
-def calculate_corner_latlon(lats_list, lons_list, numlons_list, dlon_list,
-                            lat_list):
-    '''
-    This function calculates the latitude and longitude values at the corners
-    of the gridcells based on the center values. It also saves both the corner
-    and center coordinates into a float32 arrays with oasis3-mct compatible
-    structure
-    '''
-
-    # OASIS requires grids to be 2D, but IFS grid is 1D, so we give it an
-    # extra dimension.
-    center_lons = np.array(lons_list, dtype='float32')[np.newaxis, :]
-    center_lats = np.array(lats_list, dtype='float32')[np.newaxis, :]
-    nx = center_lons.shape[1]
-    ny = 1
-
-    print(' Size of grid: nx = %d, ny = %d' % (nx, ny))
-
-    # Now we calculate longitudes/latitudes of corner points for each grid cell
-    crn_lons = np.zeros((4, ny, nx))
-    crn_lats = np.zeros((4, ny, nx))
-
-    kk = 0 # cell index
-    for ii, ni in enumerate(numlons_list):
-        '''
-        Layout of the four corners
-
-        2 ---------- 1
-        |            |
-        |            |
-        |            |
-        3 -----------4
-
-        ^ y
-        |
-        |
-        |
-        ----> x
-        '''
-
-        dlon = dlon_list[ii]
-        lat  = lat_list[ii]
-        lons = np.arange(0, 360, dlon)
-
-        #     NP --- j=1 ---|--- j=2 ---|--- j=3 ---|--- j=n --- SP
-        #                           <-dlat_n-> <-dlat_s->
-
-        # if first latitude, the previous point was north pole
-        if ii == 0:
-            dlat_n = 90 - lat
-            dlat_s = (lat - lat_list[ii+1]) / 2.
-
-        # if last latitude, the next point is south pole
-        elif ii == len(numlons_list)-1:
-            dlat_n = (lat_list[ii-1] - lat) / 2.
-            dlat_s = lat + 90
-
-        else:
-            dlat_n = (lat_list[ii-1] - lat) / 2.
-            dlat_s = (lat - lat_list[ii+1]) / 2.
-
-        for jj in range(ni):
-            # corner 1: north-east
-            crn_lons[0, 0, kk] = lons[jj] + dlon/2.
-            crn_lats[0, 0, kk] = lat + dlat_n/2.
-
-            # corner 2: north-west
-            crn_lons[1, 0, kk] = lons[jj] - dlon/2.
-            crn_lats[1, 0, kk] = lat + dlat_n/2.
-
-            # corner 3: south-west
-            crn_lons[2, 0, kk] = lons[jj] - dlon/2.
-            crn_lats[2, 0, kk] = lat - dlat_s/2.
-
-            # corner 4: south-east
-            crn_lons[3, 0, kk] = lons[jj] + dlon/2.
-            crn_lats[3, 0, kk] = lat - dlat_s/2.
-
-            kk += 1
-
-    # Make sure that longitudes are [-180, 180] and not [0, 360]
-    center_lons = np.where( center_lons > 180, center_lons - 360, center_lons )
-    crn_lons    = np.where( crn_lons > 180, crn_lons - 360, crn_lons )
-
-    return (center_lats, center_lons, crn_lats, crn_lons)
-
-
-def calculate_area(center_lons, numlons_list, dlon_list, lat_list):
-    '''
-    This function calculates the area of the gridcells based on the center
-    values and saves them into a float32 array with oasis3-mct compatible
-    structure
-    '''
-
-    # OASIS requires grids to be 2D, but IFS grid is 1D, so we give it an
-    # extra dimension.
-    nx = center_lons.shape[1]
-    ny = 1
-
-     # Now we calculate the cell area of each cell
-    gridcell_area = np.zeros((ny, nx))
-
-    kk = 0 # cell index
-    for ii, ni in enumerate(numlons_list):
-
-        dlon = dlon_list[ii]
-        lat  = lat_list[ii]
-        lons = np.arange(0, 360, dlon)
-
-        #     NP --- j=1 ---|--- j=2 ---|--- j=3 ---|--- j=n --- SP
-        #                           <-dlat_n-> <-dlat_s->
-
-        # if first latitude, the previous point was north pole
-        if ii == 0:
-            dlat_n = 90 - lat
-            dlat_s = (lat - lat_list[ii+1]) / 2.
-
-        # if last latitude, the next point is south pole
-        elif ii == len(numlons_list)-1:
-            dlat_n = (lat_list[ii-1] - lat) / 2.
-            dlat_s = lat + 90
-
-        else:
-            dlat_n = (lat_list[ii-1] - lat) / 2.
-            dlat_s = (lat - lat_list[ii+1]) / 2.
-
-        # Grid cell areas in m2 width in latitude of cell is dlat_n + dlat_s
-        dx = dlon * np.pi/180. * earth_radius * np.cos( np.pi/180. * lat )
-        dy = (dlat_n + dlat_s) * np.pi/180. * earth_radius
-        area = dx * dy
-
-        for jj in range(ni):
-            gridcell_area[0, kk] = area
-            kk += 1
-
-    return(gridcell_area)
-
 def write_red_point_file(lats_list, lons_list, output_path_oifs, truncation_type, NN):
     '''
     This function write the red_point.txt file for OpenIFS
@@ -366,52 +147,28 @@ def write_red_point_file(lats_list, lons_list, output_path_oifs, truncation_type
     elif truncation_type == "cubic-octahedral":
         redpoint_txt = '%s/TCO%d_red_points.txt' % (output_path_oifs,NN-1)
 
-    with open(redpoint_txt, 'w') as f:
-        f.write("gridtype  = cell\n")
-        f.write("gridsize  = " + str(len(lons_list)) + "\n")
-        f.write("xvals     = ")
-        for item in lons_list:
-            f.write("%s\n" % item)
-        f.write("yvals     = ")
-        for item in lats_list:
-            f.write("%s\n" % item)
+    # Shortest representation that reads back exactly, as written by str()
+    # in the original loop (see ocp_tool.grids.red_points)
+    red_points.write(redpoint_txt, lats_list, lons_list)
 
 
-def read_lsm(res_num, input_path_oifs, output_path_oifs, exp_name_oifs, num_fields):
+def read_lsm(res_num, input_path_oifs, output_path_oifs, exp_name_oifs):
     '''
-    This function reads the oifs input file in grib format and save it into a
-    list of numpy arrays.
+    This function reads the land sea mask, soil type and lake cover fields
+    from the oifs input file in grib format into a dict of numpy arrays,
+    keyed by shortName. All other messages are skipped without decoding
+    their values.
     '''
     print(' Opening Grib input file: %s ' % (input_path_oifs,))
     input_file_oifs = input_path_oifs + 'ICMGG' + exp_name_oifs + 'INIT'
-    gid = [None] * num_fields
-    gribfield = [None] * num_fields
-    with open(input_file_oifs, 'r') as f:
-        keys = ['N', 'shortName']
-
-        for i in range(num_fields):
-            gid[i] = gribapi.grib_new_from_file(f)
-            if gid[i] is None:
-                break
-
-            for key in keys:
-                if not gribapi.grib_is_defined(gid[i], key):
-                    raise ValueError("Key '%s' was not defined" % key)
-                print('%s=%s' % (key, gribapi.grib_get(gid[i], key)))
-
-            shortName = gribapi.grib_get(gid[i], 'shortName')
+    gribfield = grib.read(input_file_oifs, ('lsm', 'slt', 'cl'))
+    for shortName, values in gribfield.items():
+        if values is None:
+            raise ValueError("Field '%s' not found in %s"
+                             % (shortName, input_file_oifs))
+        print('shortName=%s, size=%d' % (shortName, values.size))
 
-            if shortName == 'lsm':
-                lsm_id = i
-            if shortName == 'slt':
-                slt_id = i
-            if shortName == 'cl':
-                cl_id = i
-
-            nres = gribapi.grib_get(gid[i], 'N')
-            gribfield[i] = gribapi.grib_get_values(gid[i])
-
-    return (gribfield, lsm_id, slt_id, cl_id, gid)
+    return gribfield
 
 
 def autoselect_basins(grid_name_oce):
@@ -446,8 +203,34 @@ def autoselect_coastline(grid_name_oce, truncation_type, res_num):
         return []
 
 
-def modify_lsm(gribfield, manual_basin_removal, manual_coastline_addition, 
-               lsm_id, slt_id, cl_id, lons_list, center_lats, center_lons):
+def remove_lakes_but_caspian(fields, center_lats, center_lons):
+    '''
+    This function turns all lakes into land, except for the Caspian Sea,
+    which becomes part of the ocean. It returns the new lsm, the lsm without
+    any lakes (used for runoff) and the lake fraction of the Caspian Sea
+    '''
+    # The lake mask is fractional [0,1], where 1 is lake, 0 is no lakes
+    # The lsm is fractional [0,1], where 1 is land, 0 is sea
+    # We need to select the Caspian Sea, any fraction of lake around the
+    # Caspian is selected (we could also do > 0.5, i.e. only pick points
+    # with >50% lake)
+    points = regions.Points(center_lats[0, :], center_lons[0, :])
+    caspian = points.mask(
+        regions.REGIONS['caspian-sea'].shape.indices(points)
+    )
+    caspian_lsm = np.where(caspian & (fields['cl'] > 0), fields['cl'], 0)
+
+    # Remove all lakes by adding lake mask to lsm
+    # Areas with big lakes will be > 1, ensure lsm [0,1]
+    # The lsm with no lakes whatsoever is used for runoff
+    lsm_no_lakes = np.minimum(fields['lsm'] + fields['cl'], 1)
+    # Now remove the Caspian Sea from lsm, i.e. make it part of the ocean
+    return lsm_no_lakes - caspian_lsm, lsm_no_lakes, caspian_lsm
+
+
+def modify_lsm(res_num, gribfield, manual_basin_removal, manual_coastline_addition, 
+               lsm_id, slt_id, cl_id, lons_list, center_lats, center_lons,
+               output_path_plots):
     '''
     This function firstly uses the lake mask to remove lakes from the land sea
     mask and secondly, if set, uses a preselected list of basins to manually
@@ -460,143 +243,43 @@ def modify_lsm(gribfield, manual_basin_removal, manual_coastline_addition,
     lsm_binary_l = lsm_binary_l[np.newaxis, :]
     lsm_binary_r = lsm_binary_l.copy()
 
-    # Automatic lake removal with lakes mask
-    gribfield_mod = gribfield[:]
-    # Soil class of removed lakes is set to SANDY CLAY LOAM
-    for i in np.arange (0, len(gribfield_mod[slt_id])-1):
-        if gribfield_mod[cl_id][i] >= 0.5:
-            gribfield_mod[slt_id][i] = 6
-            gribfield_mod[lsm_id][i] = 1
-
+    # Automatic lake removal with lakes mask, then the manual basin removal
+    # and coastline addition, in this order. The regions and their edits
+    # (e.g. lsm=1 and soil class SANDY CLAY LOAM for removed lakes) are
+    # defined in ocp_tool.regions. 'all-but-caspian-sea' is not a region but
+    # combines the lsm with the lake mask, so it is applied at its position
+    # in the list, and the region edits before and after it are applied in
+    # one pass each.
+    gribfield_mod = dict(gribfield)
+    fields = {'lsm': gribfield_mod[lsm_id], 'slt': gribfield_mod[slt_id],
+              'cl': gribfield_mod[cl_id]}
     print('Removing: ', manual_basin_removal)
-    for basin in manual_basin_removal:
-
-        if basin == 'caspian-sea':
-            for ia in range(len(lons_list)):
-               if center_lats[0, ia] > 36 and center_lats[0, ia] < 47 and center_lons[0, ia] > 46 and center_lons[0, ia] < 56:
-                  gribfield_mod[lsm_id][ia] = 1
-                  gribfield_mod[slt_id][ia] = 6
-
-        if basin == 'black-sea':
-            for ia in range(len(lons_list)):
-               if center_lats[0, ia] > 40.5 and center_lats[0, ia] < 48 and center_lons[0, ia] > 27 and center_lons[0, ia] < 43:
-                  gribfield_mod[lsm_id][ia] = 1
-                  gribfield_mod[slt_id][ia] = 6
-
-        if basin == 'white-sea':
-            for ia in range(len(lons_list)):
-               if center_lats[0, ia] > 63 and center_lats[0, ia] < 67 and center_lons[0, ia] > 31 and center_lons[0, ia] < 41:
-                  gribfield_mod[lsm_id][ia] = 1
-                  gribfield_mod[slt_id][ia] = 6
-
-        if basin == 'gulf-of-ob':
-            for ia in range(len(lons_list)):
-               if center_lats[0, ia] > 65 and center_lats[0, ia] < 71 and center_lons[0, ia] > 70 and center_lons[0, ia] < 79:
-                  print('gulf-of-ob lat, lon:',center_lats[0, ia], center_lons[0, ia])
-                  gribfield_mod[lsm_id][ia] = 1
-                  gribfield_mod[slt_id][ia] = 6
-
-        if basin == 'persian-gulf':
-            for ia in range(len(lons_list)):
-               if center_lats[0, ia] > 21 and center_lats[0, ia] < 31 and center_lons[0, ia] > 46 and center_lons[0, ia] < 59:
-                  gribfield_mod[lsm_id][ia] = 1
-                  gribfield_mod[slt_id][ia] = 6
-
-        if basin == 'coronation-queen-maude':
-            for ia in range(len(lons_list)):
-               if center_lats[0, ia] > 48 and center_lats[0, ia] < 55 and center_lons[0, ia] > -102 and center_lons[0, ia] < -94:
-                  print('coronation-queen-maude lat, lon:',center_lats[0, ia], center_lons[0, ia])
-                  gribfield_mod[lsm_id][ia] = 1
-                  gribfield_mod[slt_id][ia] = 6
-        
-        if basin == 'all-but-caspian-sea':
-            # The lake mask is fractional [0,1], where 1 is lake, 0 is no lakes
-            # The lsm is fractional [0,1], where 1 is land, 0 is sea
-            # We need to select the Caspian Sea
-            caspian_lsm = np.zeros(gribfield_mod[cl_id].shape)
-            for ia in range(len(lons_list)):
-               if center_lats[0, ia] > 36 and center_lats[0, ia] < 47 and center_lons[0, ia] > 46 and center_lons[0, ia] < 56:
-                  print(' caspian lake mask ',gribfield_mod[cl_id][ia])
-                  # Select any fraction of lake around the Caspian
-                  # We could also do > 0.5, i.e. only pick points with >50% lake
-                  if gribfield_mod[cl_id][ia] > 0:
-                     caspian_lsm[ia] = gribfield_mod[cl_id][ia]
-                  
-            # Remove all lakes by adding lake mask to lsm
-            # Areas with big lakes will be > 1
-            gribfield_mod[lsm_id][:] = gribfield_mod[lsm_id][:] + gribfield_mod[cl_id][:]
-            # Ensure lsm [0,1]
-            gribfield_mod[lsm_id][gribfield_mod[lsm_id] > 1] = 1
-            # The lsm with no lakes whatsoever is used for runoff
-            lsm_binary_r[0,:] = gribfield_mod[lsm_id][:]
-            # Now remove the Caspian Sea from lsm, i.e. make it part of the ocean
-            gribfield_mod[lsm_id][:] = gribfield_mod[lsm_id][:] - caspian_lsm[:]
-            
-            fig, ax = plt.subplots(1,3)
-            ax[0].scatter(center_lons.flatten(), center_lats.flatten(), c=gribfield_mod[cl_id][:], s=1.5)
-            ax[0].set_title('cl')
-            ax[1].scatter(center_lons.flatten(), center_lats.flatten(), c=gribfield_mod[lsm_id][:], s=1.5)
-            ax[1].set_title('lsm')
-            ax[2].scatter(center_lons.flatten(), center_lats.flatten(), c=caspian_lsm[:], s=1.5)
-            ax[2].set_title('caspian lsm')
-            figname = 'output/plots/lsm_modifications_T%d.png' % (res_num,)
-            fig.savefig(figname, format='png')
-                 
-                  
     print('Adding: ', manual_coastline_addition)
-    if manual_coastline_addition: 
-        for coastline in manual_coastline_addition:
-            
-            if coastline == 'tanquary-fiord':
-                for ia in range(len(lons_list)):
-                   if center_lats[0, ia] > 79.5 and center_lats[0, ia] < 81.5 and center_lons[0, ia] > -102 and center_lons[0, ia] < -98:
-                      print('tanquary-fiord lat, lon:',center_lats[0, ia], center_lons[0, ia])
-                      gribfield_mod[lsm_id][ia] = 0
-                      gribfield_mod[slt_id][ia] = 0
-    
-            if coastline == 'spencer-golf':
-                for ia in range(len(lons_list)):
-                   if center_lats[0, ia] > -35 and center_lats[0, ia] < -34 and center_lons[0, ia] > 137 and center_lons[0, ia] < 137.5:
-                      print('spencer-golf lat, lon:',center_lats[0, ia], center_lons[0, ia])
-                      gribfield_mod[lsm_id][ia] = 0
-                      gribfield_mod[slt_id][ia] = 0
-                      
-            if coastline == 'ingrid-christensen-coast':
-                for ia in range(len(lons_list)):
-                   if center_lats[0, ia] > -67 and center_lats[0, ia] < -65 and center_lons[0, ia] > 97 and center_lons[0, ia] < 100:
-                      print('ingrid-christensen-coast lat, lon:',center_lats[0, ia], center_lons[0, ia])
-                      gribfield_mod[lsm_id][ia] = 0
-                      gribfield_mod[slt_id][ia] = 0    
-                      
-            if coastline == 'jennings-promontory':
-                for ia in range(len(lons_list)):
-                   if center_lats[0, ia] > -71 and center_lats[0, ia] < -68 and center_lons[0, ia] > 68.5 and center_lons[0, ia] < 71.6:
-                      print('jennings-promontory lat, lon:',center_lats[0, ia], center_lons[0, ia])
-                      gribfield_mod[lsm_id][ia] = 0
-                      gribfield_mod[slt_id][ia] = 0   
-                      
-            if coastline == 'princess-martha-coast-east':
-                for ia in range(len(lons_list)):
-                   if center_lats[0, ia] > -71.5 and center_lats[0, ia] < -68 and center_lons[0, ia] > 25 and center_lons[0, ia] < 27:
-                      print('princess-martha-coast-east lat, lon:',center_lats[0, ia], center_lons[0, ia])
-                      gribfield_mod[lsm_id][ia] = 0
-                      gribfield_mod[slt_id][ia] = 0   
-                      
-            if coastline == 'princess-martha-coast-center':
-                for ia in range(len(lons_list)):
-                   if center_lats[0, ia] > -70.5 and center_lats[0, ia] < -68 and center_lons[0, ia] > 16 and center_lons[0, ia] < 19:
-                      print('princess-martha-coast-center lat, lon:',center_lats[0, ia], center_lons[0, ia])
-                      gribfield_mod[lsm_id][ia] = 0
-                      gribfield_mod[slt_id][ia] = 0  
-                      
-            if coastline == 'princess-martha-coast-west':
-                for ia in range(len(lons_list)):
-                   if center_lats[0, ia] > -72 and center_lats[0, ia] < -70 and center_lons[0, ia] > -2.5 and center_lons[0, ia] < 2.5:
-                      print('princess-martha-coast-west lat, lon:',center_lats[0, ia], center_lons[0, ia])
-                      gribfield_mod[lsm_id][ia] = 0
-                      gribfield_mod[slt_id][ia] = 0  
-        
-
+    edits = ['lakes'] + list(manual_basin_removal) \
+        + list(manual_coastline_addition or [])
+    while edits:
+        if 'all-but-caspian-sea' in edits:
+            split = edits.index('all-but-caspian-sea')
+        else:
+            split = len(edits)
+        if split > 0:
+            fields = regions.apply(
+                fields, edits[:split], center_lats[0, :], center_lons[0, :]
+            )
+        if split < len(edits):
+            fields['lsm'], lsm_binary_r[0, :], caspian_lsm = \
+                remove_lakes_but_caspian(fields, center_lats, center_lons)
+            # Panels: cl, lsm, caspian lsm
+            figname = '%slsm_modifications_T%d.png' % (output_path_plots,
+                                                        res_num)
+            background_plots.append(diagnostics.in_background(
+                diagnostics.plot_fields, figname,
+                center_lats[0, :], center_lons[0, :],
+                [fields['cl'], fields['lsm'], caspian_lsm]
+            ))
+        edits = edits[split+1:]
+    gribfield_mod[lsm_id] = fields['lsm']
+    gribfield_mod[slt_id] = fields['slt']
 
     # Mask with lakes counting as land in correct format for oasis3-mct file
     lsm_binary_a = gribfield_mod[lsm_id]
@@ -606,77 +289,88 @@ def modify_lsm(gribfield, manual_basin_removal, manual_coastline_addition,
 
 
 def write_lsm(gribfield_mod, input_path_oifs, output_path_oifs, exp_name_oifs,
-              grid_name_oce, num_fields, gid):
+              grid_name_oce):
     '''
-    This function copies the input gribfile to the output folder and modifies
-    it by writing the whole gribfield_mod, including the altered land sea mask
-    and soil type fields into the new file
+    This function copies the input gribfile to the output folder in a single
+    pass, replacing the values of the altered land sea mask and soil type
+    fields. All other messages are copied unchanged.
     '''
 
     input_file_oifs = input_path_oifs + 'ICMGG' + exp_name_oifs + 'INIT'
     output_file_oifs = output_path_oifs + 'ICMGG' + exp_name_oifs + 'INIT_' + grid_name_oce
-    copy2(input_file_oifs, output_file_oifs)
-
-    with open(output_file_oifs, 'r+b') as f:
-        for i in range(num_fields):
-            gribapi.grib_set_values(gid[i], gribfield_mod[i])
-            gribapi.grib_write(gid[i], f)
-            gribapi.grib_release(gid[i])
+    grib.copy_modify(input_file_oifs, output_file_oifs,
+                     {'lsm': gribfield_mod['lsm'],
+                      'slt': gribfield_mod['slt']})
 
 
-def plotting_lsm(res_num, lsm_binary_l, lsm_binary_a, center_lats, center_lons):
+def plotting_lsm(res_num, lsm_binary_l, lsm_binary_a, center_lats, center_lons,
+                 output_path_plots):
     '''
     This function plots the final land sea mask
     '''
 
-    fig3 = plt.figure(figsize=(12, 7))
-    ax3  = fig3.add_subplot(111)
-    xptsa = center_lons[np.round(lsm_binary_a[:, :])<1]
-    yptsa = center_lats[np.round(lsm_binary_a[:, :])<1]
-    xptsl = center_lons[np.round(lsm_binary_l[:, :])<1]
-    yptsl = center_lats[np.round(lsm_binary_l[:, :])<1]
-    ax3.scatter(xptsl, yptsl, s=1.5, color='red', label='L wet points')
-    ax3.scatter(xptsa, yptsa, s=2, label='A wet points')
-    ax3.legend()
-    figname = 'output/plots/land_points_T%d.png' % (res_num,)
-    fig3.savefig(figname, format='png')
+    # Land white, L wet points red, A wet points blue
+    wet_points = np.where(np.round(lsm_binary_a[0, :]) < 1, 2,
+                          np.where(np.round(lsm_binary_l[0, :]) < 1, 1, 0))
+    figname = '%sland_points_T%d.png' % (output_path_plots, res_num)
+    background_plots.append(diagnostics.in_background(
+        diagnostics.plot_fields, figname,
+        center_lats[0, :], center_lons[0, :], [wet_points],
+        categorical=True,
+        palette=((255, 255, 255), (214, 39, 40), (31, 119, 180))
+    ))
 
 
-def generate_coord_area(res_num, input_path_reduced_grid, input_path_full_grid, truncation_type):
+def generate_coord_area(res_num, input_path_reduced_grid, input_path_full_grid, truncation_type,
+                        output_path_oifs):
     '''
     This function generates coordinate and areas fields based on
     the full and reduced gaussian gridfiles for a given truncation number.
     '''
 
     lines, NN = read_grid_file(res_num, input_path_reduced_grid, input_path_full_grid, truncation_type)
-    lons_list, lats_list, numlons_list, dlon_list, lat_list = extract_grid_data(lines)
-    center_lats, center_lons, crn_lats, crn_lons = calculate_corner_latlon(lats_list, lons_list, numlons_list, dlon_list, lat_list)
-    gridcell_area = calculate_area(center_lons, numlons_list, dlon_list, lat_list)
+    # Columns: latitude number, reduced points, regular points, latitude
+    grid_table = np.loadtxt(lines[3:], ndmin=2)
+    grid = ReducedGaussianGrid(lats=grid_table[:, 3],
+                               nlons=grid_table[:, 1].astype(int))
+    print(' Size of grid: nx = %d, ny = %d' % (grid.nlons.sum(), 1))
+
+    # Centers (float32) and corners with longitudes in [-180, 180] and the
+    # areas, as computed by the original cell-by-cell loops
+    geometry = legacy_grids.geometry(grid)
+    center_lats, center_lons = geometry.center_lats, geometry.center_lons
+    crn_lats, crn_lons = geometry.crn_lats, geometry.crn_lons
+    gridcell_area = geometry.areas
+    lats_list, lons_list = legacy_grids.point_coordinates(grid)
     write_red_point_file(lats_list, lons_list, output_path_oifs, truncation_type, NN)
 
     return (center_lats, center_lons, crn_lats, crn_lons, gridcell_area, lons_list, NN)
 
 
 def process_lsm(res_num, input_path_oifs, output_path_oifs, exp_name_oifs,
-                grid_name_oce, num_fields, manual_basin_removal, 
-                manual_coastline_addition, lons_list, center_lats, center_lons):
+                grid_name_oce, manual_basin_removal, 
+                manual_coastline_addition, lons_list, center_lats, center_lons,
+                output_path_plots):
     '''
     This function first reads, modifies and finally saves the new land
     sea mask. Every step is mirrored for the soil type file as it has to be
     modified in the exact same locations
     '''
 
-    gribfield, lsm_id, slt_id, cl_id, gid = read_lsm(res_num, input_path_oifs, 
-                                                     output_path_oifs, 
-                                                     exp_name_oifs, num_fields)
-    lsm_binary_a, lsm_binary_l, lsm_binary_r, gribfield_mod = modify_lsm(gribfield, 
+    gribfield = read_lsm(res_num, input_path_oifs, output_path_oifs,
+                         exp_name_oifs)
+    # The fields are keyed by their shortName
+    lsm_id, slt_id, cl_id = 'lsm', 'slt', 'cl'
+    lsm_binary_a, lsm_binary_l, lsm_binary_r, gribfield_mod = modify_lsm(res_num,
+                                                           gribfield, 
                                                            manual_basin_removal, 
                                                            manual_coastline_addition, 
                                                            lsm_id, slt_id, cl_id, 
                                                            lons_list, center_lats, 
-                                                           center_lons)
-    write_lsm(gribfield_mod, input_path_oifs, output_path_oifs, exp_name_oifs, 
-              grid_name_oce, num_fields, gid)
+                                                           center_lons,
+                                                           output_path_plots)
+    write_lsm(gribfield_mod, input_path_oifs, output_path_oifs, exp_name_oifs,
+              grid_name_oce)
     return (lsm_binary_a,lsm_binary_l,lsm_binary_r)
 
 
@@ -782,19 +476,10 @@ def write_oasis_files(res_num, output_path_oasis, dir_path, grid_name_oce, cente
 
         # Copying runoff mapper grids and areas into oasis3-mct files
 
+        # Variables are streamed in bounded blocks, with their attributes
         input_file_rnf = '%srunoff_%s.nc' % (input_path_runoff, filebase)
-        rnffile = Dataset(input_file_rnf, 'r')
-
-        nc.setncatts(rnffile.__dict__)
-        for name, dimension in rnffile.dimensions.items():
-            nc.createDimension(name, len(dimension) if not dimension.isunlimited() else None)
+        oasis.copy_netcdf(input_file_rnf, nc)
 
-        for name, variable in rnffile.variables.items():
-            var_out = nc.createVariable(name, variable.datatype, variable.dimensions)
-            var_out.setncatts({k: variable.getncattr(k) for k in variable.ncattrs()})
-            var_out[:] = variable[:]
-
-        rnffile.close()
         nc.close()
         print(' Wrote %s ' % (filename,))
 
@@ -802,7 +487,7 @@ def write_oasis_files(res_num, output_path_oasis, dir_path, grid_name_oce, cente
 
 
 def modify_runoff_map(res_num, input_path_runoff, output_path_runoff,
-                      grid_name_oce, manual_basin_removal):
+                      grid_name_oce, manual_basin_removal, output_path_plots):
     '''
     This function generates coordinate and areas fields based on
     the full and reduced gaussian gridfiles for a given truncation number.
@@ -813,113 +498,39 @@ def modify_runoff_map(res_num, input_path_runoff, output_path_runoff,
         os.remove(output_file_rnf)
     copy2(input_file_rnf, output_file_rnf)
 
-    rnffile = Dataset(output_file_rnf, 'r+')
-    print (rnffile.variables.keys())
+    # Drainage basins and arrival points of the removed basins are edited
+    # by ocp_tool.runoff, using the basin boxes of ocp_tool.regions
+    runoff.edit_maps(output_file_rnf, manual_basin_removal)
 
+    rnffile = Dataset(output_file_rnf, 'r')
     drainage = rnffile.variables[u'drainage_basin_id'][:]
     arrival = rnffile.variables[u'arrival_point_id'][:]
-
-    # Set projection
     lons = rnffile.variables[u'lon'][:]
     lats = rnffile.variables[u'lat'][:]
-
-    for basin in manual_basin_removal:
-
-        if basin == 'caspian-sea':
-            for lo, lon in enumerate(lons):
-                if lon > 46 and lon < 56:
-                    for la, lat in enumerate(lats):
-                        if lat > 36 and lat < 47:
-                            if drainage[la, lo] == -2:
-                                drainage[la, lo] = 18
-                                arrival[la, lo] = -1
-                # adding artifical arrival points in the amazon discharge area
-                # to close the global water budget
-                if lon > 313 and lon < 314.5:
-                    for la, lat in enumerate(lats):
-                        if lat > 1 and lat < 2:
-                            if arrival[la, lo] != -1:
-                                arrival[la, lo] = 18
-
-        if basin == 'black-sea':
-            for lo, lon in enumerate(lons):
-                #removing old basin
-                if lon > 27 and lon < 43:
-                    for la, lat in enumerate(lats):
-                        if lat > 40.5 and lat < 48:
-                            if drainage[la, lo] == -2:
-                                drainage[la, lo] = 23
-                                arrival[la, lo] = -1
-                # adding new arrival points
-                if lon > 25 and lon < 26.5:
-                    for la, lat in enumerate(lats):
-                        if lat > 38.5 and lat < 41:
-                            if arrival[la, lo] != -1:
-                                arrival[la, lo] = 23
-                if lon > 23.5 and lon < 25:
-                    for la, lat in enumerate(lats):
-                        if lat > 38.5 and lat < 41:
-                            if arrival[la, lo] != -1:
-                                arrival[la, lo] = 28
-
-    # Saving results
-    rnffile.variables[u'drainage_basin_id'][:] = drainage
-    rnffile.variables[u'arrival_point_id'][:] = arrival
     rnffile.close()
 
-    plotting_runoff(drainage, arrival, lons, lats)
+    plotting_runoff(drainage, arrival, lons, lats, output_path_plots)
 
     return (lons, lats)
 
 
-def plotting_runoff(drainage, arrival, lons, lats):
-
-    # Split data and concatenate in reverse order to turn by 180° to Prime meridian
-    ds1, ds2 = np.hsplit(np.squeeze(drainage), 2)
-    drainage_cat = np.concatenate((ds2, ds1), axis=1)
-    ds1, ds2 = np.hsplit(np.squeeze(arrival), 2)
-    arrival_cat = np.concatenate((ds2, ds1), axis=1)
-
-    lons = lons-180
-    lon_0 = lons.mean()
-    lat_0 = lats.mean()
-
-    m = Basemap(llcrnrlon=-60., llcrnrlat=-10, urcrnrlon=-30., urcrnrlat=20., \
-            resolution='l', area_thresh=1000., projection='cyl')
-
-    #Use meshgrid to create 2D arrays from coordinates
-    lon, lat = np.meshgrid(lons, lats)
-    xi, yi = m(lon, lat)
-
-    fig1 = plt.figure(figsize=(12, 8))
-    cmap = plt.cm.flag
-    cs = m.pcolor(xi, yi, arrival_cat, cmap=cmap)
-    m.drawcoastlines()
-    m.drawparallels(np.arange(-90., 120., 45.))
-    m.drawmeridians(np.arange(0., 360., 90.))
-
-    lon_0 = lons.mean()
-    lat_0 = lats.mean()
-
-    m = Basemap(llcrnrlon=20., llcrnrlat=30, urcrnrlon=80., urcrnrlat=50., \
-            resolution='l', area_thresh=1000., projection='poly', \
-            lat_0=0., lon_0=20.)
-
-    #Use meshgrid to create 2D arrays from coordinates
+def plotting_runoff(drainage, arrival, lons, lats, output_path_plots):
+    '''
+    This function plots the arrival points off the Amazon estuary and the
+    drainage basins and arrival points around the Black and Caspian Sea
+    '''
     lon, lat = np.meshgrid(lons, lats)
-    xi, yi = m(lon, lat)
-
-    fig1 = plt.figure(figsize=(12, 8))
-    cs = m.pcolor(xi, yi, drainage_cat, cmap=cmap)
-    m.drawcoastlines()
-    m.drawparallels(np.arange(-90., 120., 45.))
-    m.drawmeridians(np.arange(0., 360., 90.))
-
-    fig1 = plt.figure(figsize=(12, 8))
-    cs = m.pcolor(xi, yi, arrival_cat, cmap=cmap)
-    m.drawcoastlines()
-    m.drawparallels(np.arange(-90., 120., 45.))
-    m.drawmeridians(np.arange(0., 360., 90.))
+    for figname, field, extent in (
+            ('runoff_arrival_points_amazon.png', arrival,
+             (-10, 20, -60, -30)),
+            ('runoff_drainage_basins_caspian.png', drainage,
+             (30, 50, 20, 80)),
+            ('runoff_arrival_points_caspian.png', arrival,
+             (30, 50, 20, 80))):
+        background_plots.append(diagnostics.in_background(
+            diagnostics.plot_fields, output_path_plots + figname, lat, lon,
+            [np.squeeze(field)], categorical=True, extent=extent
+        ))
 
 
 def modify_runoff_lsm(res_num, grid_name_oce, manual_basin_removal, lons, lats,
@@ -931,25 +542,109 @@ def modify_runoff_lsm(res_num, grid_name_oce, manual_basin_removal, lons, lats,
 
     # Editing runoff mapper lsm in oasis3-mct masks file
     filename = '%smasks.nc' % (output_path_oasis,)
-    oasis = Dataset(filename, 'r+')
-
-    RnfA = oasis.variables[u'RnfA.msk'][:]
-    RnfO = oasis.variables[u'RnfO.msk'][:]
-
-    for basin in manual_basin_removal:
+    runoff.edit_masks(filename, manual_basin_removal, lats, lons)
+
+
+def resolution_path(path, res_num):
+    '''
+    This function returns the output directory of one atmosphere resolution
+    below the given output directory, so that resolutions processed side by
+    side do not overwrite each other's files
+    '''
+    return '%sT%d/' % (path, res_num)
+
+
+def process_resolution(res_num, config):
+    '''
+    This function runs the whole tool for one atmosphere resolution, with all
+    output written to the resolution's own directories. It returns the wall
+    times of the stages as ocp_tool.instrument records.
+    '''
+    recorder = instrument.Recorder('T%d' % (res_num,))
+    output_path_oifs = resolution_path(config['output_path_oifs'], res_num)
+    output_path_runoff = resolution_path(config['output_path_runoff'], res_num)
+    output_path_oasis = resolution_path(config['output_path_oasis'], res_num)
+    output_path_plots = resolution_path(config['output_path_plots'], res_num)
+    for path in (output_path_oifs, output_path_runoff, output_path_plots,
+                 output_path_oasis,
+                 os.path.join(config['dir_path'], output_path_oasis)):
+        os.makedirs(path, exist_ok=True)
+
+    center_lats, center_lons, \
+    crn_lats, crn_lons, \
+    gridcell_area, lons_list, \
+    NN = recorder.call('generate_coord_area', generate_coord_area, res_num,
+                       config['input_path_reduced_grid'],
+                       config['input_path_full_grid'],
+                       config['truncation_type'], output_path_oifs)
+
+    manual_coastline_addition = config['manual_coastline_addition']
+    if manual_coastline_addition is None:
+        manual_coastline_addition = autoselect_coastline(
+            config['grid_name_oce'], config['truncation_type'], res_num)
+
+    lsm_binary_a,lsm_binary_l,lsm_binary_r = recorder.call(
+        'process_lsm', process_lsm, res_num, config['input_path_oifs'],
+        output_path_oifs, config['exp_name_oifs'], config['grid_name_oce'],
+        config['manual_basin_removal'], manual_coastline_addition,
+        lons_list, center_lats, center_lons, output_path_plots)
+
+    recorder.call('write_oasis_files', write_oasis_files, res_num,
+                  output_path_oasis, config['dir_path'], config['grid_name_oce'],
+                  center_lats, center_lons, crn_lats, crn_lons, gridcell_area,
+                  lsm_binary_a, lsm_binary_l, lsm_binary_r, NN,
+                  config['input_path_runoff'])
+
+    lons, lats = recorder.call('modify_runoff_map', modify_runoff_map, res_num,
+                               config['input_path_runoff'], output_path_runoff,
+                               config['grid_name_oce'],
+                               config['manual_basin_removal'], output_path_plots)
+
+    recorder.call('modify_runoff_lsm', modify_runoff_lsm, res_num,
+                  config['grid_name_oce'], config['manual_basin_removal'],
+                  lons, lats, output_path_oasis)
+
+    recorder.call('plotting_lsm', plotting_lsm, res_num, lsm_binary_l,
+                  lsm_binary_a, center_lats, center_lons, output_path_plots)
+
+    # Plots are written in the background while the later stages run
+    with recorder.stage('wait for plots'):
+        for process in background_plots:
+            process.join()
+        failed = sum(process.exitcode != 0 for process in background_plots)
+        num_plots = len(background_plots)
+        del background_plots[:]
+    if failed:
+        raise RuntimeError('%d of %d diagnostic plots failed'
+                           % (failed, num_plots))
+
+    return recorder.records
+
+
+def print_timings(records):
+    '''
+    This function prints a table of the wall time of every stage (rows) for
+    every resolution (columns)
+    '''
+    resolutions = sorted({record['component'] for record in records},
+                         key=lambda name: int(name[1:]))
+    stages = []
+    for record in records:
+        if record['stage'] not in stages:
+            stages.append(record['stage'])
+    wall = {(record['component'], record['stage']): record['wall_time']
+            for record in records}
 
-        if basin == 'caspian-sea':
-            for lo, lon in enumerate(lons):
-                if lon > 46 and lon < 56:
-                    for la, lat in enumerate(lats):
-                        if lat > 36 and lat < 47:
-                            RnfA[la, lo] = 0
-                            RnfO[la, lo] = 1
-
-    # Saving altered runoff mapper lsm
-    oasis.variables[u'RnfA.msk'][:] = RnfA
-    oasis.variables[u'RnfO.msk'][:] = RnfO
-    oasis.close()
+    print(longline)
+    print(' Wall time per stage [s]')
+    print(' %-20s' % ('stage',) + ''.join('%10s' % (r,) for r in resolutions))
+    for stage in stages + ['total']:
+        times = [sum(t for (r, _), t in wall.items() if r == res)
+                 if stage == 'total' else wall.get((res, stage))
+                 for res in resolutions]
+        print(' %-20s' % (stage,) + ''.join(
+            '%10s' % ('-',) if t is None else '%10.2f' % (t,) for t in times))
+    print(longline)
 
 
 #-----------------------------------------------------------------------------
@@ -973,10 +668,6 @@ if __name__ == '__main__':
     # ICMGG????INIT file you got from EMCWF
     #exp_name_oifs = 'h6mv' #default for linear
     exp_name_oifs = 'hagw'#default for cubic-octahedral
-    # I have not yet found a way to determine automatically the number of
-    # fields in the ICMGG????INIT file. Set it correctly or stuff will break!
-    num_fields = 50
-
     # Name of ocean model grid. So far supported are:
     # FESOM2: CORE2, MR, HR;  NEMO:
     # Important: If you chose a supported ocean grid, manual removal of basins
@@ -998,10 +689,9 @@ if __name__ == '__main__':
     # Certain resolution configurations have slightly missmatch coastline, 
     # whereby the atmosphere acutally needs more ocean points. 
     # If you have chosen a known combination of grid_name_oce and atmospheric 
-    # resolution, the coastlines in question will be selected for you.
-    manual_coastline_addition = autoselect_coastline(grid_name_oce, 
-                                                     truncation_type, 
-                                                     resolution_list[0])
+    # resolution, the coastlines in question will be selected for you (for
+    # each resolution, if set to None).
+    manual_coastline_addition = None
 
 
     # Find working directory
@@ -1018,38 +708,46 @@ if __name__ == '__main__':
     input_path_oifs = 'input/openifs_input_default/'
     input_path_runoff = 'input/runoff_map_default/'
 
-    # Output file directories.
+    # Output file directories. Every resolution writes to its own
+    # subdirectory, e.g. output/oasis_mct3_input/T95/
     output_path_oifs = 'output/openifs_input_modified/'
     output_path_runoff = 'output/runoff_map_modified/'
     output_path_oasis = 'output/oasis_mct3_input/'
+    output_path_plots = 'output/plots/'
+
+    # Number of resolutions processed side by side (None: as many as there
+    # are resolutions, limited by the number of CPUs). With 1, resolutions
+    # are processed one after the other in this process.
+    num_workers = None
+
+    config = dict(
+        truncation_type=truncation_type,
+        exp_name_oifs=exp_name_oifs,
+        grid_name_oce=grid_name_oce,
+        manual_basin_removal=manual_basin_removal,
+        manual_coastline_addition=manual_coastline_addition,
+        dir_path=dir_path,
+        input_path_reduced_grid=input_path_reduced_grid,
+        input_path_full_grid=input_path_full_grid,
+        input_path_oifs=input_path_oifs,
+        input_path_runoff=input_path_runoff,
+        output_path_oifs=output_path_oifs,
+        output_path_runoff=output_path_runoff,
+        output_path_oasis=output_path_oasis,
+        output_path_plots=output_path_plots,
+    )
+
+    # Todo: select correct exp_name_oifs for each resolution
+    num_workers = num_workers or min(len(resolution_list), os.cpu_count() or 1)
+    records = []
+    if num_workers == 1:
+        for res_num in resolution_list:
+            records += process_resolution(res_num, config)
+    else:
+        with ProcessPoolExecutor(max_workers=num_workers) as pool:
+            futures = [pool.submit(process_resolution, res_num, config)
+                       for res_num in resolution_list]
+            for future in futures:
+                records += future.result()
 
-    # Loop over atmosphere resolutions. Todo: select correct exp_name_oifs
-    for res_num in resolution_list:
-
-        center_lats, center_lons, \
-        crn_lats, crn_lons, \
-        gridcell_area, lons_list, \
-        NN = generate_coord_area(res_num,
-                                 input_path_reduced_grid, input_path_full_grid,
-                                 truncation_type)
-
-        lsm_binary_a,lsm_binary_l,lsm_binary_r = process_lsm(res_num, input_path_oifs, output_path_oifs,
-                                 exp_name_oifs, grid_name_oce, num_fields,
-                                 manual_basin_removal, manual_coastline_addition, lons_list,
-                                 center_lats, center_lons)
-
-        write_oasis_files(res_num,
-                          output_path_oasis, dir_path, grid_name_oce,
-                          center_lats, center_lons, crn_lats, crn_lons, gridcell_area,
-                          lsm_binary_a, lsm_binary_l, lsm_binary_r, NN, input_path_runoff)
-
-        lons, lats = modify_runoff_map(res_num, input_path_runoff, output_path_runoff,
-                                       grid_name_oce, manual_basin_removal)
-
-        modify_runoff_lsm(res_num, grid_name_oce, manual_basin_removal, lons, lats,
-                          output_path_oasis)
-
-        plotting_lsm(res_num, lsm_binary_l, lsm_binary_a, center_lats, center_lons)
-
-
-
+    print_timings(records)
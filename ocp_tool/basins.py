@@ -0,0 +1,184 @@
+"""Detection of enclosed basins by connected-component labelling
+
+Wet cells of a land-sea mask are labelled by the connected components of the
+cell adjacency graph (scipy.sparse.csgraph). For reduced Gaussian grids, two
+cells are adjacent if they are neighbours in the same latitude row or if
+they overlap in longitude in neighbouring rows. For 2-D grids (regular
+lat/lon, ORCA), cells are adjacent along their edges, with a periodic
+east-west boundary (skipping the halo columns of ORCA grids). The ORCA
+north fold is not connected, which may only split components at the
+northern boundary.
+
+Comparing the components of the OpenIFS mask with the ocean-grid mask
+reveals water bodies without counterpart in the ocean model (such as the
+Caspian Sea for many ocean grids), which can be reported or filled, see
+inland_basins().
+"""
+from collections import namedtuple
+
+import numpy as np
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+from scipy.spatial import cKDTree
+
+from . import spherical
+
+
+def _row_pairs(n1, n2, start1, start2):
+    """Edges between the cells of two neighbouring latitude rows with n1 and
+    n2 cells, starting at the global cell indices start1 and start2. Cell j
+    of a row with n cells is centered at j*360/n and is 360/n wide, cells
+    are adjacent if they overlap in longitude. In units of 360/(n1*n2),
+    centers are at j*n2 and k*n1, and the half widths are n2/2 and n1/2."""
+    j = np.arange(n1)
+    kmin = (2*j*n2 - n1 - n2)//(2*n1) + 1
+    kmax = -((-(2*j*n2 + n1 + n2))//(2*n1)) - 1
+    counts = kmax - kmin + 1
+    first = np.repeat(j, counts)
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts)-counts,
+                                                  counts)
+    second = (np.repeat(kmin, counts) + offsets) % n2
+    return start1 + first, start2 + second
+
+
+def reduced_gaussian_adjacency(grid):
+    """Returns the cell adjacency of a ReducedGaussianGrid as a sparse matrix
+    (one direction per edge)"""
+    nlons = np.asarray(grid.nlons, dtype='int64')
+    starts = np.cumsum(nlons) - nlons
+    ncells = nlons.sum()
+
+    # East-west neighbours, including the last and first cell of each row
+    cells = np.arange(ncells)
+    east = cells + 1
+    last = starts + nlons - 1
+    east[last] = starts
+    first, second = [cells], [east]
+
+    # North-south neighbours between consecutive rows
+    for row in range(nlons.size-1):
+        f, s = _row_pairs(
+            nlons[row], nlons[row+1], starts[row], starts[row+1]
+        )
+        first.append(f)
+        second.append(s)
+
+    first = np.concatenate(first)
+    second = np.concatenate(second)
+    return coo_matrix(
+        (np.ones(first.size, dtype='int8'), (first, second)),
+        shape=(ncells, ncells)
+    ).tocsr()
+
+
+def structured_adjacency(shape, periodic=True, halo=0):
+    """Returns the edge adjacency of a 2-D (ny, nx) grid as a sparse matrix.
+    If periodic, the last column (excluding 'halo' columns on each side) is
+    connected to the first."""
+    ny, nx = shape
+    index = np.arange(ny*nx).reshape(shape)
+    first = [index[:-1, :].ravel(), index[:, :-1].ravel()]
+    second = [index[1:, :].ravel(), index[:, 1:].ravel()]
+    if periodic:
+        first.append(index[:, nx-1-halo])
+        second.append(index[:, halo])
+    first = np.concatenate(first)
+    second = np.concatenate(second)
+    return coo_matrix(
+        (np.ones(first.size, dtype='int8'), (first, second)),
+        shape=(ny*nx, ny*nx)
+    ).tocsr()
+
+
+def adjacency(grid):
+    """Returns the cell adjacency of a reduced Gaussian, regular lat/lon or
+    ORCA grid (the ORCA halo columns are skipped). Grids are recognised by
+    their attributes, so that instrumented grids work as well."""
+    if np.ndim(getattr(grid, 'nlons', None)) == 1:
+        return reduced_gaussian_adjacency(grid)
+    halo = 1 if hasattr(grid, 'domain_cfg') else 0
+    return structured_adjacency(np.shape(grid.cell_latitudes()), halo=halo)
+
+
+def label(adjacency, wet):
+    """Labels the connected components of the wet cells. Returns an integer
+    array with the shape of 'wet', with -1 for dry cells and labels 0, 1,
+    ... for the wet components, ordered by decreasing size, and the sizes
+    of the components."""
+    wet_cells = np.ravel(wet).astype(bool)
+    adjacency = adjacency.tocoo()
+    keep = wet_cells[adjacency.row] & wet_cells[adjacency.col]
+    graph = coo_matrix(
+        (adjacency.data[keep], (adjacency.row[keep], adjacency.col[keep])),
+        shape=adjacency.shape
+    )
+    ncomponents, components = connected_components(graph, directed=False)
+
+    # Relabel wet components by size, dry cells get -1
+    sizes = np.bincount(components[wet_cells], minlength=ncomponents)
+    wet_components = np.flatnonzero(sizes)
+    order = wet_components[np.argsort(-sizes[wet_components], kind='stable')]
+    relabel = np.full(sizes.size, -1)
+    relabel[order] = np.arange(order.size)
+    labels = np.where(wet_cells, relabel[components], -1)
+    return labels.reshape(np.shape(wet)), sizes[order]
+
+
+# A connected water body of the atmosphere grid: its label, number of cells,
+# the indices of its cells (into the flattened grid), the location of one of
+# its cells and the label of the matching ocean component (None if there is
+# none)
+Basin = namedtuple('Basin', 'label size cells lat lon ocean_label')
+
+
+def inland_basins(atm_grid, atm_wet, ocean_grid, ocean_wet):
+    """Labels the water bodies of the atmosphere and the ocean grid and
+    returns a list of Basins (of the atmosphere grid) ordered by size. A
+    basin matches an ocean component if the ocean cell nearest to any of its
+    cells is wet, inland basins without ocean counterpart have
+    ocean_label=None."""
+    atm_labels, atm_sizes = label(adjacency(atm_grid), atm_wet)
+    ocean_labels, _ = label(adjacency(ocean_grid), ocean_wet)
+
+    atm_lats = np.ravel(atm_grid.cell_latitudes())
+    atm_lons = np.ravel(atm_grid.cell_longitudes())
+    atm_labels = np.ravel(atm_labels)
+    wet_cells = np.flatnonzero(atm_labels >= 0)
+
+    ocean_lats = np.ravel(ocean_grid.cell_latitudes())
+    ocean_lons = np.ravel(ocean_grid.cell_longitudes())
+    ocean_labels = np.ravel(ocean_labels)
+    _, nearest = cKDTree(spherical.to_xyz(ocean_lats, ocean_lons)).query(
+        spherical.to_xyz(atm_lats[wet_cells], atm_lons[wet_cells]),
+        workers=-1
+    )
+    nearest_labels = ocean_labels[nearest]
+
+    # Most frequent ocean label (among wet nearest ocean cells) per basin
+    matched = nearest_labels >= 0
+    pairs, counts = np.unique(
+        np.stack(
+            (atm_labels[wet_cells][matched], nearest_labels[matched])
+        ),
+        axis=1, return_counts=True
+    )
+    ocean_label = {}
+    for (atm_label, label_), count in zip(pairs.T, counts):
+        if count > ocean_label.get(atm_label, (None, 0))[1]:
+            ocean_label[atm_label] = (label_, count)
+
+    cells = np.split(
+        wet_cells[np.argsort(atm_labels[wet_cells], kind='stable')],
+        np.cumsum(atm_sizes)[:-1]
+    )
+    return [
+        Basin(
+            label=n,
+            size=int(atm_sizes[n]),
+            cells=cells[n],
+            lat=float(atm_lats[cells[n][0]]),
+            lon=float(atm_lons[cells[n][0]]),
+            ocean_label=int(ocean_label[n][0]) if n in ocean_label else None,
+        )
+        for n in range(atm_sizes.size)
+    ]
@@ -0,0 +1,189 @@
+"""Raster images of masks and fields for diagnostics
+
+Cell values of any grid (given by the cell centers) are binned onto a fixed
+size latitude/longitude raster with a vectorized histogram, so the cost
+grows with the number of cells and pixels, not with the number of drawing
+operations. Pixels without cell centers (where cells are larger than
+pixels) take the value of the nearest binned pixel. Images are written as
+PNG files with zlib, without matplotlib or Basemap, and can be rendered in a
+background process (see in_background).
+"""
+import multiprocessing
+import struct
+import zlib
+
+import numpy as np
+from scipy.ndimage import distance_transform_edt
+
+
+# Extent (south, north, west, east) of a global raster
+GLOBAL = (-90, 90, -180, 180)
+
+# Anchor colours of the sequential palette (dark blue to yellow)
+SEQUENTIAL = (
+    (68, 1, 84), (59, 82, 139), (33, 145, 140), (94, 201, 98), (253, 231, 37)
+)
+# Colours for categorical values (e.g. basin ids), cycled
+CATEGORICAL = (
+    (31, 119, 180), (255, 127, 14), (44, 160, 44), (214, 39, 40),
+    (148, 103, 189), (140, 86, 75), (227, 119, 194), (127, 127, 127),
+    (188, 189, 34), (23, 190, 207), (0, 0, 0), (255, 255, 255),
+)
+MISSING = (200, 200, 200)
+
+
+class Raster:
+    """Maps the cell centers of a grid to the pixels of a raster image with
+    'shape' (rows, columns) covering 'extent' (south, north, west, east). The
+    pixel of each cell is computed once and shared by all fields of the
+    grid."""
+
+    def __init__(self, lats, lons, shape=(360, 720), extent=GLOBAL):
+        self.shape = tuple(shape)
+        south, north, west, east = extent
+        lats = np.ravel(lats)
+        lons = west + (np.ravel(lons)-west) % 360
+        rows = np.floor((north-lats)/(north-south)*self.shape[0])
+        cols = np.floor((lons-west)/(east-west)*self.shape[1])
+        rows[lats == south] = self.shape[0] - 1
+        self.inside = (rows >= 0) & (rows < self.shape[0]) \
+            & (cols >= 0) & (cols < self.shape[1])
+        self.pixels = (
+            rows[self.inside]*self.shape[1] + cols[self.inside]
+        ).astype('int64')
+        self.counts = np.bincount(self.pixels, minlength=np.prod(self.shape))
+        self._nearest = None
+
+    def nearest(self):
+        """Indices of the nearest pixel with at least one cell, for all
+        pixels"""
+        if self._nearest is None:
+            self._nearest = np.ravel_multi_index(
+                distance_transform_edt(
+                    self.counts.reshape(self.shape) == 0,
+                    return_distances=False,
+                    return_indices=True,
+                ),
+                self.shape
+            )
+        return self._nearest
+
+    def bin(self, values, reduce='mean', fill=True):
+        """Returns the image of 'values' (one per cell) as float array, with
+        the mean ('mean') or maximum ('max', e.g. for ids) of the values in
+        each pixel. Empty pixels are filled from the nearest pixel, or set to
+        NaN if not 'fill'."""
+        values = np.ravel(values).astype('float64')[self.inside]
+        if reduce == 'mean':
+            with np.errstate(divide='ignore', invalid='ignore'):
+                image = np.bincount(
+                    self.pixels, values, minlength=self.counts.size
+                ) / self.counts
+        elif reduce == 'max':
+            image = np.full(self.counts.size, -np.inf)
+            np.maximum.at(image, self.pixels, values)
+        else:
+            raise ValueError(f'Invalid reduction: {reduce}')
+        image[self.counts == 0] = np.nan
+        if fill and self.counts.any():
+            image = image[self.nearest()]
+        return image.reshape(self.shape)
+
+
+def colorize(image, vmin=None, vmax=None, palette=SEQUENTIAL):
+    """Maps a float image to RGB, linear between vmin and vmax (default: the
+    range of the image), NaN as MISSING"""
+    valid = np.isfinite(image)
+    if vmin is None:
+        vmin = image[valid].min() if valid.any() else 0
+    if vmax is None:
+        vmax = image[valid].max() if valid.any() else 1
+    scaled = (np.where(valid, image, vmin)-vmin) / ((vmax-vmin) or 1)
+    anchors = np.linspace(0, 1, len(palette))
+    rgb = np.stack(
+        [np.interp(scaled, anchors, channel) for channel in zip(*palette)],
+        axis=-1
+    )
+    rgb[~valid] = MISSING
+    return np.round(rgb).astype('uint8')
+
+
+def categorize(image, palette=CATEGORICAL):
+    """Maps an image of integer categories to RGB, cycling through the
+    palette, NaN as MISSING"""
+    valid = np.isfinite(image)
+    colors = np.array(palette + (MISSING,), dtype='uint8')
+    index = np.where(
+        valid, np.where(valid, image, 0).astype('int64') % len(palette),
+        len(palette)
+    )
+    return colors[index]
+
+
+def side_by_side(images, separator=4):
+    """Joins RGB images horizontally, separated by white columns"""
+    height = max(image.shape[0] for image in images)
+    parts = []
+    for image in images:
+        if parts:
+            parts.append(np.full((height, separator, 3), 255, dtype='uint8'))
+        padded = np.full((height, *image.shape[1:]), 255, dtype='uint8')
+        padded[:image.shape[0]] = image
+        parts.append(padded)
+    return np.concatenate(parts, axis=1)
+
+
+def _png_chunk(tag, data):
+    return struct.pack('>I', len(data)) + tag + data \
+        + struct.pack('>I', zlib.crc32(tag + data) & 0xffffffff)
+
+
+def write_png(filename, rgb, level=6):
+    """Writes an RGB image (uint8 array of shape (rows, columns, 3)) as PNG"""
+    rgb = np.ascontiguousarray(rgb, dtype='uint8')
+    height, width = rgb.shape[:2]
+    # Each scanline starts with its filter type (0, no filter)
+    scanlines = np.zeros((height, 1 + 3*width), dtype='uint8')
+    scanlines[:, 1:] = rgb.reshape(height, 3*width)
+    with open(filename, 'wb') as f:
+        f.write(b'\x89PNG\r\n\x1a\n')
+        f.write(
+            _png_chunk(
+                b'IHDR', struct.pack('>2I5B', width, height, 8, 2, 0, 0, 0)
+            )
+        )
+        f.write(_png_chunk(b'IDAT', zlib.compress(scanlines.tobytes(), level)))
+        f.write(_png_chunk(b'IEND', b''))
+
+
+def plot_fields(filename, lats, lons, fields, categorical=False,
+                shape=(360, 720), extent=GLOBAL, vmin=None, vmax=None,
+                palette=None):
+    """Writes a PNG with one panel per field (arrays of cell values on the
+    grid given by the cell centers lats and lons), side by side. Categorical
+    fields (e.g. masks or ids) are binned with the maximum and coloured by
+    category, other fields are binned with the mean and coloured linearly
+    between vmin and vmax."""
+    raster = Raster(lats, lons, shape=shape, extent=extent)
+    if categorical:
+        panels = [
+            categorize(raster.bin(values, reduce='max'),
+                       palette=palette or CATEGORICAL)
+            for values in fields
+        ]
+    else:
+        panels = [
+            colorize(raster.bin(values), vmin=vmin, vmax=vmax,
+                     palette=palette or SEQUENTIAL)
+            for values in fields
+        ]
+    write_png(filename, side_by_side(panels))
+
+
+def in_background(func, *args, **kwargs):
+    """Runs func(*args, **kwargs) in a separate process, e.g. to write plots
+    while the main process continues. Returns the started
+    multiprocessing.Process, which should be joined before exiting."""
+    process = multiprocessing.Process(target=func, args=args, kwargs=kwargs)
+    process.start()
+    return process
@@ -1,7 +1,10 @@
 """GRIB file handling with ecCodes
 """
+import numpy as np
 import eccodes as ecc
 
+from .grids import ReducedGaussianGrid
+
 
 def read(file, shortnames):
     """Reads all messages in a grib file, checks the 'shortName' grib key
@@ -53,3 +56,33 @@ def copy_modify(infile, outfile, data=None):
                     ecc.codes_set_values(gid, data[name])
             ecc.codes_write(gid, fout)
             ecc.codes_release(gid)
+
+
+def read_grid(file):
+    """Returns the reduced Gaussian grid of the first message in a GRIB file
+    (e.g. an ICMGG????INIT file), using the N, pl and distinctLatitudes keys
+    of the message header. Only the header is decoded, not the data.
+    Raises ValueError for other grid types and for grids that are not
+    scanned from north to south.
+    """
+    with open(file, 'rb') as f:
+        gid = ecc.codes_grib_new_from_file(f)
+    if gid is None:
+        raise ValueError(f'No GRIB message found in {file}')
+    try:
+        grid_type = ecc.codes_get(gid, 'gridType')
+        if grid_type != 'reduced_gg':
+            raise ValueError(
+                f'Expected a reduced Gaussian grid in {file}, '
+                f'found {grid_type}'
+            )
+        if ecc.codes_get(gid, 'jScansPositively'):
+            raise ValueError(f'Grid in {file} is not scanned north to south')
+        N = ecc.codes_get(gid, 'N')
+        nlons = ecc.codes_get_array(gid, 'pl')
+        lats = ecc.codes_get_array(gid, 'distinctLatitudes')
+    finally:
+        ecc.codes_release(gid)
+    if not nlons.size == lats.size == 2*N:
+        raise ValueError(f'Inconsistent Gaussian grid definition in {file}')
+    return ReducedGaussianGrid(lats=np.sort(lats)[::-1], nlons=nlons)
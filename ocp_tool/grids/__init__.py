@@ -1,49 +1,86 @@
+import functools
+import inspect
+
 from .regular import RegularLatLonGrid, FullGaussianGrid
-from .orca import ORCA
 from .gaussian import ReducedGaussianGrid
-from .oifs import F128, TL159, TCO95, TL255, TCO159, TCO199
+from . import oifs
 
 
-def factory(grid_name, *args, **kwargs):
+# Kinds of the grids that are not described in the OIFS grid store. The
+# ORCA module (and hence netCDF4) is only imported when such a grid is
+# requested.
+_grid_kinds = {
+    'orca': 'orca',
+    'ORCA': 'orca',
+    'regular_latlon': 'regular_latlon',
+}
+
 
-    reduced_gaussian_grids = {
-        'TL159': TL159,
-        'TCO95': TCO95,
-        'TL255': TL255,
-        'TCO159': TCO159,
-        'TCO199': TCO199,
-    }
+def _grid_kind(grid_name):
+    """Returns the kind of grid 'grid_name', or None for unknown names. The
+    kind of OIFS grids is derived from their description in the packaged
+    grid store: reduced Gaussian if it lists reducedpoints, full Gaussian
+    otherwise."""
+    if grid_name in _grid_kinds:
+        return _grid_kinds[grid_name]
+    if grid_name in oifs.names():
+        if 'reducedpoints' in oifs.definition(grid_name)._fields:
+            return 'reduced_gaussian'
+        return 'full_gaussian'
+    return None
 
-    full_gaussian_grids = {
-        'F128': F128,
-    }
 
-    orca_grids = {
-        'orca': ORCA,
-        'ORCA': ORCA,
-    }
+def __getattr__(name):
+    if name == 'ORCA':
+        from .orca import ORCA
+        return ORCA
+    if name in oifs.names():
+        return oifs.definition(name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
-    regular_latlon_grids = {
-        'regular_latlon': RegularLatLonGrid,
-    }
 
-    if grid_name in reduced_gaussian_grids:
+@functools.lru_cache(maxsize=32)
+def _cached_grid(kind, grid_name, arguments):
+
+    if kind == 'reduced_gaussian':
+        definition = oifs.definition(grid_name)
         return ReducedGaussianGrid(
-            lats=reduced_gaussian_grids[grid_name].yvals,
-            nlons=reduced_gaussian_grids[grid_name].reducedpoints,
+            lats=definition.yvals,
+            nlons=definition.reducedpoints,
         )
 
-    elif grid_name in full_gaussian_grids:
+    elif kind == 'full_gaussian':
         return FullGaussianGrid(
             # Note that we want a full Gaussian grid with latitudes starting at
             # the South pole, hence we have to reverse the FXXX lats
-            lats=full_gaussian_grids[grid_name].yvals[::-1],
+            lats=oifs.definition(grid_name).yvals[::-1],
         )
 
-    elif grid_name in orca_grids:
+    elif kind == 'regular_latlon':
+        return RegularLatLonGrid(**dict(arguments))
+
+
+def factory(grid_name, *args, **kwargs):
+    """Returns the grid 'grid_name'. Apart from ORCA grids, which are read
+    from files, grids are immutable and shared: the same instance is returned
+    for the same name and arguments (e.g. nlats/nlons for 'regular_latlon'),
+    as long as it is kept in the cache. Raises NotImplementedError for names
+    that are neither registered nor in the OIFS grid store."""
+
+    kind = _grid_kind(grid_name)
+
+    if kind in ('reduced_gaussian', 'full_gaussian'):
+        return _cached_grid(kind, grid_name, ())
+
+    elif kind == 'orca':
+        from .orca import ORCA
         return ORCA(*args, **kwargs)
 
-    elif grid_name in regular_latlon_grids:
-        return RegularLatLonGrid(*args, **kwargs)
+    elif kind == 'regular_latlon':
+        # Normalise the arguments, so that positional and keyword arguments
+        # (and omitted defaults) map to the same cached grid
+        bound = inspect.signature(RegularLatLonGrid).bind(*args, **kwargs)
+        bound.apply_defaults()
+        return _cached_grid(kind, grid_name, tuple(bound.arguments.items()))
 
     raise NotImplementedError(f'Unknown grid type: {grid_name}')
@@ -1,6 +1,7 @@
 import numpy as np
 
 from .earth import RADIUS as EARTH_RADIUS
+from .immutable import cached, readonly
 
 
 def _longitudes(N, *, loc='c'):
@@ -25,8 +26,8 @@ def _latitude_bounds(lats, *, loc):
 class ReducedGaussianGrid:
 
     def __init__(self, lats, nlons):
-        self.lats = np.array(lats)
-        self.nlons = nlons
+        self.lats = readonly(np.array(lats))
+        self.nlons = readonly(np.array(nlons))
 
     def _repeat(self, values):
         """Repeats the values of a list (one value per latitude row), according
@@ -45,9 +46,11 @@ class ReducedGaussianGrid:
             [func(n, *args, **kwargs) for n in self.nlons]
         )
 
+    @cached
     def cell_latitudes(self):
         return self._repeat(self.lats)
 
+    @cached
     def cell_longitudes(self):
         return self._tile(_longitudes)
 
@@ -71,11 +74,13 @@ class ReducedGaussianGrid:
             ]
         )
 
+    @cached
     def cell_corners(self):
         return np.array(
             [self._cell_corner_latitudes(), self._cell_corner_longitudes()]
         )
 
+    @cached
     def cell_areas(self):
         areas = 2*np.pi*EARTH_RADIUS**2*np.abs(
             np.sin(np.radians(_latitude_bounds(self.lats, loc='n')))
@@ -0,0 +1,29 @@
+"""Helpers for immutable grids
+
+Grids returned by ocp_tool.grids.factory are shared between callers, hence
+their defining arrays and the results of their cell_* methods are read-only.
+The cell_* results are computed only once per grid instance.
+"""
+import functools
+
+import numpy as np
+
+
+def readonly(array):
+    """Returns 'array' as an ndarray that can not be written to"""
+    array = np.asarray(array)
+    array.flags.writeable = False
+    return array
+
+
+def cached(method):
+    """Decorator for the cell_* methods of immutable grids: the result is
+    computed once per grid instance (and arguments) and returned read-only"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        cache = self.__dict__.setdefault('_cell_cache', {})
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        if key not in cache:
+            cache[key] = readonly(method(self, *args, **kwargs))
+        return cache[key]
+    return wrapper
@@ -0,0 +1,94 @@
+"""Reduced Gaussian grid geometry in the layout of the original ocp-tool.py
+
+The original tool (ocp-tool.py) computed cell centers, corners and areas
+cell by cell. The functions below return the same arrays, vectorized:
+
+    - centers as float32 arrays of shape (1, N),
+    - corners as float64 arrays of shape (4, 1, N), in the order north-east,
+      north-west, south-west, south-east,
+    - areas as float64 array of shape (1, N),
+    - longitudes in [-180, 180] rather than [0, 360).
+
+Note that the original corner latitudes are placed at a quarter of the
+distance to the neighbouring latitude (and half way to the pole for the
+first and last latitude), and the areas are computed as dx*dy from these
+distances. With legacy_bounds=False, the corners and areas of the grid
+itself (ReducedGaussianGrid.cell_corners and cell_areas) are used instead.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+from .earth import RADIUS as EARTH_RADIUS
+
+
+Geometry = namedtuple(
+    'Geometry', 'center_lats center_lons crn_lats crn_lons areas'
+)
+
+
+def point_coordinates(grid):
+    """Returns the latitudes and longitudes (in [0, 360)) of all cells as
+    float64 vectors, exactly as listed by the original tool"""
+    nlons = np.asarray(grid.nlons)
+    dlon = 360/nlons
+    row_starts = np.cumsum(nlons) - nlons
+    # Same values as np.arange(0, 360, dlon) for each row
+    index = np.arange(nlons.sum()) - np.repeat(row_starts, nlons)
+    return np.repeat(grid.lats, nlons), index*np.repeat(dlon, nlons)
+
+
+def _signed(lons):
+    return np.where(lons > 180, lons-360, lons)
+
+
+def geometry(grid, legacy_bounds=True, signed_longitudes=True,
+             center_dtype='float32'):
+    """Returns the Geometry of a ReducedGaussianGrid (latitudes from north to
+    south) in the layout of the original tool. The options select the
+    original corner latitudes and areas (legacy_bounds), the longitude
+    convention ([-180, 180] if signed_longitudes, else [0, 360)) and the
+    data type of the centers."""
+    lats = np.asarray(grid.lats, dtype='float64')
+    nlons = np.asarray(grid.nlons)
+    point_lats, point_lons = point_coordinates(grid)
+
+    if legacy_bounds:
+        half_spacing = (lats[:-1]-lats[1:])/2
+        dlat_n = np.concatenate(([90-lats[0]], half_spacing))
+        dlat_s = np.concatenate((half_spacing, [lats[-1]+90]))
+        dlon = 360/nlons
+
+        north = np.repeat(lats + dlat_n/2, nlons)
+        south = np.repeat(lats - dlat_s/2, nlons)
+        half_dlon = np.repeat(dlon/2, nlons)
+        crn_lats = np.array((north, north, south, south))
+        crn_lons = np.array(
+            (
+                point_lons + half_dlon,
+                point_lons - half_dlon,
+                point_lons - half_dlon,
+                point_lons + half_dlon,
+            )
+        )
+        # Same order of operations as the original tool, which gives
+        # bitwise identical areas
+        dx = dlon*np.pi/180.*EARTH_RADIUS*np.cos(np.pi/180.*lats)
+        dy = (dlat_n+dlat_s)*np.pi/180.*EARTH_RADIUS
+        areas = np.repeat(dx*dy, nlons)
+    else:
+        crn_lats, crn_lons = grid.cell_corners()
+        areas = grid.cell_areas()
+
+    center_lons = point_lons.astype(center_dtype)
+    if signed_longitudes:
+        center_lons = _signed(center_lons)
+        crn_lons = _signed(crn_lons)
+
+    return Geometry(
+        center_lats=point_lats.astype(center_dtype)[np.newaxis, :],
+        center_lons=center_lons[np.newaxis, :],
+        crn_lats=np.asarray(crn_lats)[:, np.newaxis, :],
+        crn_lons=np.asarray(crn_lons)[:, np.newaxis, :],
+        areas=np.asarray(areas)[np.newaxis, :],
+    )
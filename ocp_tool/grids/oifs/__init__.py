@@ -1,7 +1,52 @@
-from .tq21 import TQ21
-from .f128 import F128
-from .tl159 import TL159
-from .tco95 import TCO95
-from .tl255 import TL255
-from .tco159 import TCO159
-from .tco199 import TCO199
+"""Grid descriptions of OpenIFS grids
+
+The descriptions are kept in the packaged grid store definitions.npz (see
+ocp_tool.grids.store), which is memory-mapped and only opened when a
+description is accessed, e.g. as ocp_tool.grids.oifs.TCO95. Grids taken from
+'cdo griddes' carry the full description, while grids converted from the
+reduced Gaussian grid tables in input/ only have gridtype, gridsize, ysize,
+yvals and reducedpoints.
+"""
+import functools
+import os
+
+from .utils import namedtuple_from_dict
+
+
+_DEFINITIONS = os.path.join(os.path.dirname(__file__), 'definitions.npz')
+
+# The F128 full Gaussian grid uses the same latitudes as TL255 (N128)
+_ALIASES = {
+    'F128': ('TL255', ('yvals',)),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _store():
+    from ..store import GridStore
+    return GridStore(_DEFINITIONS)
+
+
+@functools.lru_cache(maxsize=None)
+def names():
+    """Returns the names of all available grid descriptions"""
+    return tuple(sorted(set(_store().names()) | set(_ALIASES)))
+
+
+@functools.lru_cache(maxsize=None)
+def definition(name):
+    """Returns the grid description 'name' as a namedtuple"""
+    if name in _ALIASES:
+        base, fields = _ALIASES[name]
+        base = definition(base)._asdict()
+        return namedtuple_from_dict(name, {f: base[f] for f in fields})
+    try:
+        return namedtuple_from_dict(name, _store().definition(name))
+    except KeyError:
+        raise KeyError(f'Unknown OIFS grid: {name}')
+
+
+def __getattr__(name):
+    if name in names():
+        return definition(name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
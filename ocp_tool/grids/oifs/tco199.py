@@ -1,188 +0,0 @@
-from .utils import namedtuple_from_dict
-
-
-TCO199 = namedtuple_from_dict(
-    'TCO199',
-    {
-        'gridtype': 'gaussian_reduced',
-        'gridsize': 167200,
-        'xsize': 2,
-        'ysize': 400,
-        'numlpe': 200,
-        'xname': 'lon',
-        'xlongname': 'longitude',
-        'xunits': 'degrees_east',
-        'yname': 'lat',
-        'ylongname': 'latitude',
-        'yunits': 'degrees_north',
-        'xvals': [0.0, 359.558],
-        'yvals': [
-            89.6559642468709, 89.2102943916542, 88.7619926150759,
-            88.313096175209, 87.8639741655228, 87.4147430020613,
-            86.9654508372181, 86.5161211563435, 86.0667667688679,
-            85.6173952520439, 85.1680113735614, 84.7186182827308,
-            84.2692181432142, 83.8198124905248, 83.3704024444936,
-            82.9209888409815, 82.4715723165064, 82.0221533643148,
-            81.5727323725375, 81.1233096507705, 80.6738854489796,
-            80.2244599711957, 79.7750333856012, 79.3256058320718,
-            78.8761774278904, 78.4267482721316, 77.9773184490628,
-            77.5278880308108, 77.0784570794721, 76.6290256487977,
-            76.1795937855498, 75.7301615306014, 75.2807289198357,
-            74.8312959848845, 74.3818627537402, 73.9324292512642,
-            73.4829954996129, 73.0335615185961, 72.5841273259793,
-            72.1346929377412, 71.6852583682927, 71.2358236306642,
-            70.786388736668, 70.3369536970365, 69.8875185215434,
-            69.4380832191083, 68.9886477978879, 68.5392122653563,
-            68.0897766283745, 67.6403408932521, 67.1909050658021,
-            66.7414691513882, 66.2920331549678, 65.8425970811297,
-            65.3931609341278, 64.9437247179109, 64.49428843615,
-            64.0448520922619, 63.5954156894312, 63.1459792306296,
-            62.6965427186332, 62.2471061560387, 61.7976695452776,
-            61.3482328886288, 60.8987961882311, 60.4493594460931,
-            59.9999226641034, 59.5504858440393, 59.1010489875752,
-            58.6516120962893, 58.2021751716711, 57.7527382151272,
-            57.3033012279872, 56.8538642115089, 56.4044271668827,
-            55.9549900952366, 55.5055529976402, 55.056115875108,
-            54.6066787286035, 54.1572415590419, 53.7078043672933,
-            53.2583671541856, 52.8089299205069, 52.3594926670079,
-            51.9100553944039, 51.4606181033774, 51.0111807945793,
-            50.5617434686315, 50.1123061261277, 49.6628687676357,
-            49.2134313936982, 48.7639940048347, 48.3145566015425,
-            47.865119184298, 47.4156817535574, 46.9662443097585,
-            46.516806853321, 46.0673693846477, 45.6179319041253,
-            45.1684944121255, 44.719056909005, 44.2696193951072,
-            43.8201818707621, 43.3707443362873, 42.9213067919885,
-            42.4718692381602, 42.0224316750859, 41.5729941030391,
-            41.1235565222834, 40.6741189330728, 40.2246813356527,
-            39.7752437302599, 39.325806117123, 38.8763684964629,
-            38.4269308684929, 37.9774932334194, 37.5280555914419,
-            37.0786179427535, 36.6291802875407, 36.1797426259846,
-            35.7303049582601, 35.280867284537, 34.8314296049795,
-            34.381991919747, 33.9325542289942, 33.4831165328708,
-            33.0336788315223, 32.5842411250899, 32.1348034137107,
-            31.6853656975179, 31.235927976641, 30.7864902512056,
-            30.3370525213342, 29.8876147871455, 29.4381770487555,
-            28.9887393062767, 28.5393015598187, 28.0898638094885,
-            27.64042605539, 27.1909882976246, 26.7415505362913,
-            26.2921127714864, 25.8426750033039, 25.3932372318357,
-            24.9437994571713, 24.4943616793982, 24.0449238986018,
-            23.5954861148658, 23.1460483282716, 22.6966105388991,
-            22.2471727468263, 21.7977349521298, 21.3482971548841,
-            20.8988593551626, 20.449421553037, 19.9999837485776,
-            19.5505459418531, 19.1011081329313, 18.6516703218784,
-            18.2022325087594, 17.752794693638, 17.3033568765772,
-            16.8539190576383, 16.404481236882, 15.9550434143677,
-            15.5056055901541, 15.0561677642986, 14.6067299368581,
-            14.1572921078883, 13.7078542774442, 13.25841644558,
-            12.8089786123492, 12.3595407778045, 11.9101029419979,
-            11.4606651049808, 11.0112272668038, 10.5617894275172,
-            10.1123515871703, 9.66291374581228, 9.21347590349152,
-            8.76403806025596, 8.31460021615315, 7.86516237123012,
-            7.41572452553356, 6.96628667910967, 6.51684883200431,
-            6.0674109842631, 5.61797313593115, 5.1685352870535,
-            4.71909743767474, 4.26965958783926, 3.82022173759126,
-            3.37078388697471, 2.92134603603336, 2.4719081848109,
-            2.02247033335074, 1.57303248169632, 1.12359462989089,
-            0.67415677797764, 0.224718925999737, -0.224718925999737,
-            -0.67415677797764, -1.12359462989089, -1.57303248169632,
-            -2.02247033335074, -2.4719081848109, -2.92134603603336,
-            -3.37078388697471, -3.82022173759126, -4.26965958783926,
-            -4.71909743767474, -5.1685352870535, -5.61797313593115,
-            -6.0674109842631, -6.51684883200431, -6.96628667910967,
-            -7.41572452553356, -7.86516237123012, -8.31460021615315,
-            -8.76403806025596, -9.21347590349152, -9.66291374581228,
-            -10.1123515871703, -10.5617894275172, -11.0112272668038,
-            -11.4606651049808, -11.9101029419979, -12.3595407778045,
-            -12.8089786123492, -13.25841644558, -13.7078542774442,
-            -14.1572921078883, -14.6067299368581, -15.0561677642986,
-            -15.5056055901541, -15.9550434143677, -16.404481236882,
-            -16.8539190576383, -17.3033568765772, -17.752794693638,
-            -18.2022325087594, -18.6516703218784, -19.1011081329313,
-            -19.5505459418531, -19.9999837485776, -20.449421553037,
-            -20.8988593551626, -21.3482971548841, -21.7977349521298,
-            -22.2471727468263, -22.6966105388991, -23.1460483282716,
-            -23.5954861148658, -24.0449238986018, -24.4943616793982,
-            -24.9437994571713, -25.3932372318357, -25.8426750033039,
-            -26.2921127714864, -26.7415505362913, -27.1909882976246,
-            -27.64042605539, -28.0898638094885, -28.5393015598187,
-            -28.9887393062767, -29.4381770487555, -29.8876147871455,
-            -30.3370525213342, -30.7864902512056, -31.235927976641,
-            -31.6853656975179, -32.1348034137107, -32.5842411250899,
-            -33.0336788315223, -33.4831165328708, -33.9325542289942,
-            -34.381991919747, -34.8314296049795, -35.280867284537,
-            -35.7303049582601, -36.1797426259846, -36.6291802875407,
-            -37.0786179427535, -37.5280555914419, -37.9774932334194,
-            -38.4269308684929, -38.8763684964629, -39.325806117123,
-            -39.7752437302599, -40.2246813356527, -40.6741189330728,
-            -41.1235565222834, -41.5729941030391, -42.0224316750859,
-            -42.4718692381602, -42.9213067919885, -43.3707443362873,
-            -43.8201818707621, -44.2696193951072, -44.719056909005,
-            -45.1684944121255, -45.6179319041253, -46.0673693846477,
-            -46.516806853321, -46.9662443097585, -47.4156817535574,
-            -47.865119184298, -48.3145566015425, -48.7639940048347,
-            -49.2134313936982, -49.6628687676357, -50.1123061261277,
-            -50.5617434686315, -51.0111807945793, -51.4606181033774,
-            -51.9100553944039, -52.3594926670079, -52.8089299205069,
-            -53.2583671541856, -53.7078043672933, -54.1572415590419,
-            -54.6066787286035, -55.056115875108, -55.5055529976402,
-            -55.9549900952366, -56.4044271668827, -56.8538642115089,
-            -57.3033012279872, -57.7527382151272, -58.2021751716711,
-            -58.6516120962893, -59.1010489875752, -59.5504858440393,
-            -59.9999226641034, -60.4493594460931, -60.8987961882311,
-            -61.3482328886288, -61.7976695452776, -62.2471061560387,
-            -62.6965427186332, -63.1459792306296, -63.5954156894312,
-            -64.0448520922619, -64.49428843615, -64.9437247179109,
-            -65.3931609341278, -65.8425970811297, -66.2920331549678,
-            -66.7414691513882, -67.1909050658021, -67.6403408932521,
-            -68.0897766283745, -68.5392122653563, -68.9886477978879,
-            -69.4380832191083, -69.8875185215434, -70.3369536970365,
-            -70.786388736668, -71.2358236306642, -71.6852583682927,
-            -72.1346929377412, -72.5841273259793, -73.0335615185961,
-            -73.4829954996129, -73.9324292512642, -74.3818627537402,
-            -74.8312959848845, -75.2807289198357, -75.7301615306014,
-            -76.1795937855498, -76.6290256487977, -77.0784570794721,
-            -77.5278880308108, -77.9773184490628, -78.4267482721316,
-            -78.8761774278904, -79.3256058320718, -79.7750333856012,
-            -80.2244599711957, -80.6738854489796, -81.1233096507705,
-            -81.5727323725375, -82.0221533643148, -82.4715723165064,
-            -82.9209888409815, -83.3704024444936, -83.8198124905248,
-            -84.2692181432142, -84.7186182827308, -85.1680113735614,
-            -85.6173952520439, -86.0667667688679, -86.5161211563435,
-            -86.9654508372181, -87.4147430020613, -87.8639741655228,
-            -88.313096175209, -88.7619926150759, -89.2102943916542,
-            -89.6559642468709
-        ],
-        'reducedpoints': [
-            20, 24, 28, 32, 36, 40, 44, 48, 52, 56, 60, 64, 68, 72, 76, 80, 84,
-            88, 92, 96, 100, 104, 108, 112, 116, 120, 124, 128, 132, 136, 140,
-            144, 148, 152, 156, 160, 164, 168, 172, 176, 180, 184, 188, 192,
-            196, 200, 204, 208, 212, 216, 220, 224, 228, 232, 236, 240, 244,
-            248, 252, 256, 260, 264, 268, 272, 276, 280, 284, 288, 292, 296,
-            300, 304, 308, 312, 316, 320, 324, 328, 332, 336, 340, 344, 348,
-            352, 356, 360, 364, 368, 372, 376, 380, 384, 388, 392, 396, 400,
-            404, 408, 412, 416, 420, 424, 428, 432, 436, 440, 444, 448, 452,
-            456, 460, 464, 468, 472, 476, 480, 484, 488, 492, 496, 500, 504,
-            508, 512, 516, 520, 524, 528, 532, 536, 540, 544, 548, 552, 556,
-            560, 564, 568, 572, 576, 580, 584, 588, 592, 596, 600, 604, 608,
-            612, 616, 620, 624, 628, 632, 636, 640, 644, 648, 652, 656, 660,
-            664, 668, 672, 676, 680, 684, 688, 692, 696, 700, 704, 708, 712,
-            716, 720, 724, 728, 732, 736, 740, 744, 748, 752, 756, 760, 764,
-            768, 772, 776, 780, 784, 788, 792, 796, 800, 804, 808, 812, 816,
-            816, 812, 808, 804, 800, 796, 792, 788, 784, 780, 776, 772, 768,
-            764, 760, 756, 752, 748, 744, 740, 736, 732, 728, 724, 720, 716,
-            712, 708, 704, 700, 696, 692, 688, 684, 680, 676, 672, 668, 664,
-            660, 656, 652, 648, 644, 640, 636, 632, 628, 624, 620, 616, 612,
-            608, 604, 600, 596, 592, 588, 584, 580, 576, 572, 568, 564, 560,
-            556, 552, 548, 544, 540, 536, 532, 528, 524, 520, 516, 512, 508,
-            504, 500, 496, 492, 488, 484, 480, 476, 472, 468, 464, 460, 456,
-            452, 448, 444, 440, 436, 432, 428, 424, 420, 416, 412, 408, 404,
-            400, 396, 392, 388, 384, 380, 376, 372, 368, 364, 360, 356, 352,
-            348, 344, 340, 336, 332, 328, 324, 320, 316, 312, 308, 304, 300,
-            296, 292, 288, 284, 280, 276, 272, 268, 264, 260, 256, 252, 248,
-            244, 240, 236, 232, 228, 224, 220, 216, 212, 208, 204, 200, 196,
-            192, 188, 184, 180, 176, 172, 168, 164, 160, 156, 152, 148, 144,
-            140, 136, 132, 128, 124, 120, 116, 112, 108, 104, 100, 96, 92, 88,
-            84, 80, 76, 72, 68, 64, 60, 56, 52, 48, 44, 40, 36, 32, 28, 24, 20
-        ],
-    }
-)
@@ -1,102 +0,0 @@
-from .utils import namedtuple_from_dict
-
-
-TCO95 = namedtuple_from_dict(
-    'TCO95',
-    {
-        'gridtype': 'gaussian_reduced',
-        'gridsize': 40320,
-        'xsize': 2,
-        'ysize': 192,
-        'numlpe': 96,
-        'xname': 'lon',
-        'xlongname': 'longitude',
-        'xunits': 'degrees_east',
-        'yname': 'lat',
-        'ylongname': 'latitude',
-        'yunits': 'degrees_north',
-        'xvals': [0, 359.1],
-        'yvals': [
-            89.2842275325136, 88.3570035186649, 87.4243037460699,
-            86.4903667662812, 85.5559604848927, 84.6213271076488,
-            83.6865668165639, 82.7517284734307, 81.8168387286032,
-            80.8819133467975, 79.9469622473857, 79.0119919826722,
-            78.0770070543037, 77.1420106570536, 76.2070051208607,
-            75.2719921848602, 74.336973173452, 73.4019491129572,
-            72.4669208110036, 71.5318889118272, 70.5968539356029,
-            69.6618163069383, 68.7267763758595, 67.7917344335006,
-            66.8566907239931, 65.9216454535868, 64.9865987977267,
-            64.0515509066005, 63.1165019095293, 62.1814519184735,
-            61.2464010308544, 60.3113493318435, 59.3762968962322,
-            58.4412437899697, 57.5061900714349, 56.5711357924953,
-            55.6360809993933, 54.7010257334911, 53.765970031901,
-            52.8309139280201, 51.8958574519866, 50.9608006310702,
-            50.0257434900084, 49.0906860512962, 48.1556283354368,
-            47.2205703611601, 46.2855121456128, 45.3504537045245,
-            44.4153950523538, 43.4803362024163, 42.5452771669981,
-            41.6102179574557, 40.6751585843046, 39.7400990572982,
-            38.8050393854982, 37.8699795773369, 36.934919640674,
-            35.999859582846, 35.064799410712, 34.1297391306945,
-            33.1946787488156, 32.2596182707304, 31.3245577017573,
-            30.3894970469048, 29.4544363108967, 28.5193754981943,
-            27.5843146130172, 26.649253659362, 25.7141926410194,
-            24.7791315615903, 23.8440704244996, 22.9090092330105,
-            21.9739479902356, 21.0388866991495, 20.1038253625982,
-            19.1687639833093, 18.2337025639012, 17.2986411068909,
-            16.3635796147026, 15.4285180896742, 14.4934565340649,
-            13.5583949500608, 12.6233333397819, 11.6882717052868,
-            10.7532100485791, 9.81814837161153, 8.88308667629158,
-            7.94802496448584, 7.01296323802433, 6.07790149870503,
-            5.14283974829786, 4.20777798854868, 3.27271622118319,
-            2.33765444791074, 1.40259267042804, 0.467530890422775,
-            -0.467530890422775, -1.40259267042804, -2.33765444791074,
-            -3.27271622118319, -4.20777798854868, -5.14283974829786,
-            -6.07790149870503, -7.01296323802433, -7.94802496448584,
-            -8.88308667629158, -9.81814837161153, -10.7532100485791,
-            -11.6882717052868, -12.6233333397819, -13.5583949500608,
-            -14.4934565340649, -15.4285180896742, -16.3635796147026,
-            -17.2986411068909, -18.2337025639012, -19.1687639833093,
-            -20.1038253625982, -21.0388866991495, -21.9739479902356,
-            -22.9090092330105, -23.8440704244996, -24.7791315615903,
-            -25.7141926410194, -26.649253659362, -27.5843146130172,
-            -28.5193754981943, -29.4544363108967, -30.3894970469048,
-            -31.3245577017573, -32.2596182707304, -33.1946787488156,
-            -34.1297391306945, -35.064799410712, -35.999859582846,
-            -36.934919640674, -37.8699795773369, -38.8050393854982,
-            -39.7400990572982, -40.6751585843046, -41.6102179574557,
-            -42.5452771669981, -43.4803362024163, -44.4153950523538,
-            -45.3504537045245, -46.2855121456128, -47.2205703611601,
-            -48.1556283354368, -49.0906860512962, -50.0257434900084,
-            -50.9608006310702, -51.8958574519866, -52.8309139280201,
-            -53.765970031901, -54.7010257334911, -55.6360809993933,
-            -56.5711357924953, -57.5061900714349, -58.4412437899697,
-            -59.3762968962322, -60.3113493318435, -61.2464010308544,
-            -62.1814519184735, -63.1165019095293, -64.0515509066005,
-            -64.9865987977267, -65.9216454535868, -66.8566907239931,
-            -67.7917344335006, -68.7267763758595, -69.6618163069383,
-            -70.5968539356029, -71.5318889118272, -72.4669208110036,
-            -73.4019491129572, -74.336973173452, -75.2719921848602,
-            -76.2070051208607, -77.1420106570536, -78.0770070543037,
-            -79.0119919826722, -79.9469622473857, -80.8819133467975,
-            -81.8168387286032, -82.7517284734307, -83.6865668165639,
-            -84.6213271076488, -85.5559604848927, -86.4903667662812,
-            -87.4243037460699, -88.3570035186649, -89.2842275325136
-        ],
-        'reducedpoints': [
-            20, 24, 28, 32, 36, 40, 44, 48, 52, 56, 60, 64, 68, 72, 76, 80, 84,
-            88, 92, 96, 100, 104, 108, 112, 116, 120, 124, 128, 132, 136, 140,
-            144, 148, 152, 156, 160, 164, 168, 172, 176, 180, 184, 188, 192,
-            196, 200, 204, 208, 212, 216, 220, 224, 228, 232, 236, 240, 244,
-            248, 252, 256, 260, 264, 268, 272, 276, 280, 284, 288, 292, 296,
-            300, 304, 308, 312, 316, 320, 324, 328, 332, 336, 340, 344, 348,
-            352, 356, 360, 364, 368, 372, 376, 380, 384, 388, 392, 396, 400,
-            400, 396, 392, 388, 384, 380, 376, 372, 368, 364, 360, 356, 352,
-            348, 344, 340, 336, 332, 328, 324, 320, 316, 312, 308, 304, 300,
-            296, 292, 288, 284, 280, 276, 272, 268, 264, 260, 256, 252, 248,
-            244, 240, 236, 232, 228, 224, 220, 216, 212, 208, 204, 200, 196,
-            192, 188, 184, 180, 176, 172, 168, 164, 160, 156, 152, 148, 144,
-            140, 136, 132, 128, 124, 120, 116, 112, 108, 104, 100, 96, 92, 88,
-            84, 80, 76, 72, 68, 64, 60, 56, 52, 48, 44, 40, 36, 32, 28, 24, 20
-        ]
-    }
-)
@@ -1,130 +0,0 @@
-from .utils import namedtuple_from_dict
-
-
-TL255 = namedtuple_from_dict(
-    'TL255',
-    {
-        'gridtype': 'gaussian_reduced',
-        'gridsize': 88838,
-        'xsize': 2,
-        'ysize': 256,
-        'numlpe': 128,
-        'xname': 'lon',
-        'xlongname': 'longitude',
-        'xunits': 'degrees_east',
-        'yname': 'lat',
-        'ylongname': 'latitude',
-        'yunits': 'degrees_north',
-        'xvals': [0, 359.296],
-        'yvals': [
-            89.4628215685774, 88.7669513528422, 88.0669716474306,
-            87.366063433082, 86.6648030134408, 85.9633721608804,
-            85.2618460607126, 84.5602613830534, 83.8586381286076,
-            83.1569881285417, 82.4553188271638, 81.7536351418384,
-            81.0519404509364, 80.3502371520357, 79.6485269936663,
-            78.9468112809667, 78.2450910078212, 77.543366944409,
-            76.8416396967821, 76.1399097483681, 75.4381774894878,
-            74.7364432387392, 74.0347072587468, 73.3329697679366,
-            72.6312309494589, 71.9294909580333, 71.2277499252598,
-            70.5260079637821, 69.8242651705826, 69.1225216296136,
-            68.4207774139149, 67.7190325873316, 67.0172872059174,
-            66.3155413190886, 65.6137949705788, 64.9120481992332,
-            64.2103010396741, 63.5085535228595, 62.8068056765562,
-            62.1050575257411, 61.4033090929433, 60.7015603985375,
-            59.9998114609959, 59.2980622971053, 58.596312922156,
-            57.8945633501051, 57.1928135937188, 56.4910636646978,
-            55.789313573786, 55.0875633308672, 54.3858129450494,
-            53.6840624247402, 52.982311777713, 52.2805610111665,
-            51.5788101317764, 50.8770591457431, 50.1753080588334,
-            49.4735568764181, 48.7718056035057, 48.0700542447729,
-            47.3683028045918, 46.6665512870549, 45.9647996959973,
-            45.263048035017, 44.5612963074929, 43.8595445166024,
-            43.1577926653356, 42.45604075651, 41.7542887927827,
-            41.0525367766618, 40.3507847105177, 39.649032596592,
-            38.9472804370071, 38.2455282337738, 37.5437759887994,
-            36.8420237038942, 36.1402713807781, 35.4385190210863,
-            34.7367666263753, 34.0350141981274, 33.3332617377555,
-            32.6315092466078, 31.9297567259713, 31.2280041770759,
-            30.5262516010979, 29.8244989991631, 29.1227463723498,
-            28.4209937216919, 27.719241048181, 27.0174883527696,
-            26.3157356363728, 25.6139828998707, 24.9122301441104,
-            24.2104773699079, 23.50872457805, 22.8069717692958,
-            22.1052189443783, 21.403466104006, 20.7017132488643,
-            19.9999603796168, 19.2982074969063, 18.5964546013566,
-            17.8947016935729, 17.1929487741434, 16.4911958436402,
-            15.7894429026201, 15.0876899516255, 14.3859369911856,
-            13.6841840218169, 12.9824310440241, 12.2806780583011,
-            11.5789250651313, 10.8771720649885, 10.1754190583378,
-            9.47366604563595, 8.77191302733199, 8.07016000386811,
-            7.36840697568002, 6.66665394319756, 5.96490090684534,
-            5.26314786704318, 4.56139482420674, 3.85964177874799,
-            3.15788873107563, 2.45613568159578, 1.75438263071239,
-            1.05262957882764, 0.350876526342549, -0.350876526342549,
-            -1.05262957882764, -1.75438263071239, -2.45613568159578,
-            -3.15788873107563, -3.85964177874799, -4.56139482420674,
-            -5.26314786704318, -5.96490090684534, -6.66665394319756,
-            -7.36840697568002, -8.07016000386811, -8.77191302733199,
-            -9.47366604563595, -10.1754190583378, -10.8771720649885,
-            -11.5789250651313, -12.2806780583011, -12.9824310440241,
-            -13.6841840218169, -14.3859369911856, -15.0876899516255,
-            -15.7894429026201, -16.4911958436402, -17.1929487741434,
-            -17.8947016935729, -18.5964546013566, -19.2982074969063,
-            -19.9999603796168, -20.7017132488643, -21.403466104006,
-            -22.1052189443783, -22.8069717692958, -23.50872457805,
-            -24.2104773699079, -24.9122301441104, -25.6139828998707,
-            -26.3157356363728, -27.0174883527696, -27.719241048181,
-            -28.4209937216919, -29.1227463723498, -29.8244989991631,
-            -30.5262516010979, -31.2280041770759, -31.9297567259713,
-            -32.6315092466078, -33.3332617377555, -34.0350141981274,
-            -34.7367666263753, -35.4385190210863, -36.1402713807781,
-            -36.8420237038942, -37.5437759887994, -38.2455282337738,
-            -38.9472804370071, -39.649032596592, -40.3507847105177,
-            -41.0525367766618, -41.7542887927827, -42.45604075651,
-            -43.1577926653356, -43.8595445166024, -44.5612963074929,
-            -45.263048035017, -45.9647996959973, -46.6665512870549,
-            -47.3683028045918, -48.0700542447729, -48.7718056035057,
-            -49.4735568764181, -50.1753080588334, -50.8770591457431,
-            -51.5788101317764, -52.2805610111665, -52.982311777713,
-            -53.6840624247402, -54.3858129450494, -55.0875633308672,
-            -55.789313573786, -56.4910636646978, -57.1928135937188,
-            -57.8945633501051, -58.596312922156, -59.2980622971053,
-            -59.9998114609959, -60.7015603985375, -61.4033090929433,
-            -62.1050575257411, -62.8068056765562, -63.5085535228595,
-            -64.2103010396741, -64.9120481992332, -65.6137949705788,
-            -66.3155413190886, -67.0172872059174, -67.7190325873316,
-            -68.4207774139149, -69.1225216296136, -69.8242651705826,
-            -70.5260079637821, -71.2277499252598, -71.9294909580333,
-            -72.6312309494589, -73.3329697679366, -74.0347072587468,
-            -74.7364432387392, -75.4381774894878, -76.1399097483681,
-            -76.8416396967821, -77.543366944409, -78.2450910078212,
-            -78.9468112809667, -79.6485269936663, -80.3502371520357,
-            -81.0519404509364, -81.7536351418384, -82.4553188271638,
-            -83.1569881285417, -83.8586381286076, -84.5602613830534,
-            -85.2618460607126, -85.9633721608804, -86.6648030134408,
-            -87.366063433082, -88.0669716474306, -88.7669513528422,
-            -89.4628215685774
-        ],
-        'reducedpoints': [
-            18, 25, 36, 40, 45, 50, 60, 64, 72, 72, 80, 90, 90, 100, 108, 120,
-            120, 125, 128, 144, 144, 150, 160, 160, 180, 180, 180, 192, 192,
-            200, 216, 216, 216, 225, 240, 240, 240, 250, 250, 256, 270, 270,
-            288, 288, 288, 300, 300, 320, 320, 320, 320, 324, 360, 360, 360,
-            360, 360, 360, 360, 375, 375, 375, 375, 384, 384, 400, 400, 400,
-            400, 405, 432, 432, 432, 432, 432, 432, 432, 450, 450, 450, 450,
-            450, 480, 480, 480, 480, 480, 480, 480, 480, 480, 480, 486, 486,
-            486, 500, 500, 500, 500, 500, 500, 500, 512, 512, 512, 512, 512,
-            512, 512, 512, 512, 512, 512, 512, 512, 512, 512, 512, 512, 512,
-            512, 512, 512, 512, 512, 512, 512, 512, 512, 512, 512, 512, 512,
-            512, 512, 512, 512, 512, 512, 512, 512, 512, 512, 512, 512, 512,
-            512, 512, 512, 512, 512, 512, 512, 512, 500, 500, 500, 500, 500,
-            500, 500, 486, 486, 486, 480, 480, 480, 480, 480, 480, 480, 480,
-            480, 480, 450, 450, 450, 450, 450, 432, 432, 432, 432, 432, 432,
-            432, 405, 400, 400, 400, 400, 384, 384, 375, 375, 375, 375, 360,
-            360, 360, 360, 360, 360, 360, 324, 320, 320, 320, 320, 300, 300,
-            288, 288, 288, 270, 270, 256, 250, 250, 240, 240, 240, 225, 216,
-            216, 216, 200, 192, 192, 180, 180, 180, 160, 160, 150, 144, 144,
-            128, 125, 120, 120, 108, 100, 90, 90, 80, 72, 72, 64, 60, 50, 45,
-            40, 36, 25, 18
-        ]
-    }
-)
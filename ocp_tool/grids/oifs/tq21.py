@@ -1,31 +0,0 @@
-from .utils import namedtuple_from_dict
-
-
-TQ21 = namedtuple_from_dict(
-    'TQ21',
-    {
-        'gridtyp': 'gaussian',
-        'gridsize': 2048,
-        'xsize': 64,
-        'ysize': 32,
-        'xname': 'lon',
-        'xlongname': 'longitude',
-        'xunits': 'degrees_east',
-        'yname': 'lat',
-        'ylongname': 'latitude',
-        'yunits': 'degrees_north',
-        'numlpe': 16,
-        'xfirst': 0,
-        'xinc': 5.625,
-        'yvals': [
-            85.7605871204438, 80.26877907225, 74.7445403686358, 69.2129761693708, 63.6786355610969,
-            58.1429540492033, 52.6065260343453, 47.0696420596877, 41.5324612466561, 35.9950784112716,
-            30.4575539611521, 24.9199286299486, 19.3822313464344, 13.8444837343849, 8.3067028565188,
-            2.76890300773601, -2.76890300773601, -8.3067028565188, -13.8444837343849,
-            -19.3822313464344, -24.9199286299486, -30.4575539611521, -35.9950784112716,
-            -41.5324612466561, -47.0696420596877, -52.6065260343453, -58.1429540492033,
-            -63.6786355610969, -69.2129761693708, -74.7445403686358, -80.26877907225,
-            -85.7605871204438
-        ]
-    }
-)
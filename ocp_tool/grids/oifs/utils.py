@@ -1,65 +1,101 @@
-import re
-import configparser
-
+import io
 from collections import namedtuple
 
+import numpy as np
+
+
+def _unquote(s):
+    return s[1:-1] if s[:1] == s[-1:] == '"' else s
+
 
-def parse_griddes(griddes_string):
+# This is what `cdo -s griddes` supposedly returns from ICMGG???INIT files.
+# The callables on the right hand sides are used to cast the values to their
+# correct types, values of other keys are kept as strings.
+_GRIDDES_TYPES = dict(
+    gridtype=str,
+    gridsize=int,
+    xsize=int,
+    ysize=int,
+    numlpe=int,
+    xname=str,
+    xlongname=_unquote,
+    xunits=_unquote,
+    yname=str,
+    ylongname=_unquote,
+    yunits=_unquote,
+)
+
+# Numeric blocks, which can span many lines, are converted to NumPy arrays
+_GRIDDES_ARRAYS = dict(
+    xvals='float64',
+    yvals='float64',
+    xbounds='float64',
+    ybounds='float64',
+    reducedpoints='int64',
+    rowlon='int64',
+)
+
+
+def parse_griddes(griddes):
     """Helper function to provide grid descriptions as returned by 'cdo griddes'
-    in a form that can be used to add new grids hardcoded in
+    in a form that can be used to add new grids to the grid store of
     ocp_tool.grids.oifs.
     To use this function, pass it the output of
        cdo -s griddes <ICMGG????INIT>
-    (as a string). The resulting dictionary contains one or more grid
-    descriptions (depending on the number of grids in the ICMGG file). The grid
-    description of interest can be pretty printed with, for example
-        pp = pprint.PrettyPrinter(width=80, compact=True)
-        pp.pprint(d)
-    to be close to what is needed in the hard-coded grid description files.
+    either as a string or as an iterable of lines (e.g. an open file), which
+    is processed line by line. The resulting dictionary contains one grid
+    description for each gridID in the output. Keys are lower case, numeric
+    blocks (xvals, yvals, reducedpoints, ...) are returned as NumPy arrays,
+    which can be passed directly to the grid classes, e.g.
+       ReducedGaussianGrid(lats=desc['yvals'], nlons=desc['reducedpoints'])
+    The grid descriptions can be converted with
+    ocp_tool.grids.store.from_griddes and added to the store with
+    ocp_tool.grids.store.write, or directly with
+       python -m ocp_tool.grids.store --append <store> <NAME>=<griddes file>
     To further aid the process, a Jupyter Notebook is provided together with
     this code."""
 
-    # This is what `cdo -s griddes` supposedly returns from ICMGG???INIT files.
-    # The callable on the right hand sides are used to cast the values to their
-    # correct types.
-    griddes_types = dict(
-        gridtype=str,
-        gridsize=int,
-        xsize=int,
-        ysize=int,
-        numlpe=int,
-        xname=str,
-        xlongname=lambda s: str(s[1:-1]),  # strip quotes
-        xunits=lambda s: str(s[1:-1]),
-        yname=str,
-        ylongname=lambda s: str(s[1:-1]),
-        yunits=lambda s: str(s[1:-1]),
-        xvals=lambda s: [*map(float, s.split())],  # list of floats
-        yvals=lambda s: [*map(float, s.split())],
-        reducedpoints=lambda s: [*map(int, s.split())],  # list of ints
-        rowlon=lambda s: [*map(int, s.split())],  # list of ints
-    )
+    if isinstance(griddes, str):
+        griddes = io.StringIO(griddes)
+
+    descriptions = dict()
+    section = key = None
+    block = []
 
-    cfg = configparser.ConfigParser()
-    cfg.read_string(
-        re.sub(
-            r'#\s*\n#\s+(.*)\n#\s*\n',  # Matches the cdo griddes headers
-            r'[\1]\n',             # and replaces by configparser headers
-            griddes_string,
-            re.MULTILINE
-        )
-    )
+    def finish_block():
+        if block:
+            descriptions[section][key] = np.fromstring(
+                ' '.join(block), dtype=_GRIDDES_ARRAYS[key], sep=' '
+            )
+            block.clear()
 
-    griddes = dict()
-    for sec in cfg.sections():
-        griddes[sec] = dict()
-        for key, val in cfg[sec].items():
-            try:
-                griddes[sec][key] = griddes_types[key](val)
-            except KeyError:
-                griddes[sec][key] = val
+    for line in griddes:
+        if line.startswith('#'):
+            # Section headers look like "#\n# gridID 1\n#"
+            finish_block()
+            header = line.strip('#').strip()
+            if header:
+                section = header
+                descriptions[section] = dict()
+            continue
+        if '=' in line:
+            finish_block()
+            if section is None:
+                raise ValueError('Missing gridID header in griddes output')
+            key, _, val = line.partition('=')
+            key = key.strip().lower()
+            val = val.strip()
+            if key in _GRIDDES_ARRAYS:
+                block.append(val)
+            else:
+                descriptions[section][key] = _GRIDDES_TYPES.get(key, str)(val)
+        elif line.strip():
+            if key not in _GRIDDES_ARRAYS:
+                raise ValueError(f'Unexpected continuation line: {line!r}')
+            block.append(line)
+    finish_block()
 
-    return griddes
+    return descriptions
 
 
 def namedtuple_from_dict(name, dict_):
@@ -10,6 +10,7 @@ class ORCA:
 
     _orca_names = {
         (362, 292, 75): 'ORCA1L75',
+        (1442, 1021, 75): 'ORCA025L75',
     }
 
     def __init__(self, domain_cfg, masks=None):
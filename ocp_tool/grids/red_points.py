@@ -0,0 +1,104 @@
+"""Reading and writing red_points files
+
+A red_points file lists the longitudes and latitudes of all cells of a
+reduced Gaussian grid in the 'cdo griddes' format for unstructured cells:
+
+    gridtype  = cell
+    gridsize  = <number of cells>
+    xvals     = <one longitude per line>
+    yvals     = <one latitude per line>
+
+Each column is formatted as a whole (with integer array arithmetic for
+fixed-point output) and written through a buffered stream. Optionally, a
+binary sidecar (the same name with suffix .npy) holds the longitudes and
+latitudes as a float64 array of shape (2, gridsize), which can be
+memory-mapped (np.load(..., mmap_mode='r')) and is read instead of the text
+file if present.
+"""
+import os
+
+import numpy as np
+
+
+_BUFFER_SIZE = 1 << 20
+
+
+def sidecar(filename):
+    """Name of the binary sidecar of a red_points file"""
+    return os.path.splitext(filename)[0] + '.npy'
+
+
+def _fixed(values, decimals):
+    """Formats values with 'decimals' digits after the decimal point (like
+    '%.{decimals}f'), one per line. All digits are computed with integer
+    array arithmetic in a (values, characters) byte matrix, the padding of
+    shorter numbers is removed at the end. Values within rounding error of
+    a tie in the last digit may be rounded differently than by printf."""
+    scaled = np.round(np.abs(values) * 10**decimals).astype('int64')
+    integer, fraction = np.divmod(scaled, 10**decimals)
+    nint = len(str(integer.max())) if integer.size else 1
+    chars = np.zeros((values.size, 2 + nint + decimals + 1), dtype='uint8')
+    chars[:, 0] = np.where(np.signbit(values), ord('-'), 0)
+    for k in range(nint):
+        place = 10**(nint-1-k)
+        digit = integer // place % 10
+        # Leading zeros are padding, except for the last integer digit
+        leading = (integer < place) & (k < nint-1)
+        chars[:, 1+k] = np.where(leading, 0, ord('0') + digit)
+    chars[:, 1+nint] = ord('.')
+    for k in range(decimals):
+        chars[:, 2+nint+k] = ord('0') + fraction // 10**(decimals-1-k) % 10
+    chars[:, -1] = ord('\n')
+    if decimals == 0:
+        chars = np.delete(chars, 1+nint, axis=1)
+    chars = chars.ravel()
+    return chars[chars != 0].tobytes().decode('ascii')
+
+
+def _format(values, decimals):
+    if decimals is None:
+        # Shortest representation that reads back exactly, as written by the
+        # original ocp-tool.py ("%s" % item)
+        return '\n'.join(map(repr, values.tolist())) + '\n'
+    return _fixed(values, decimals)
+
+
+def write(filename, lats, lons, decimals=None, binary=False):
+    """Writes the cell latitudes and longitudes to a red_points file. With
+    'decimals', values are written in fixed-point notation (as '%.6f' for
+    decimals=6, the format of the files in input/gaussian_grids_full), which
+    is vectorized and fast for large grids. By default, the shortest
+    representation that reads back exactly is used. With 'binary', the
+    sidecar is written as well."""
+    lats = np.ravel(lats).astype('float64')
+    lons = np.ravel(lons).astype('float64')
+    if lats.size != lons.size:
+        raise ValueError('Latitudes and longitudes differ in size')
+    with open(filename, 'w', buffering=_BUFFER_SIZE) as f:
+        f.write('gridtype  = cell\n')
+        f.write(f'gridsize  = {lons.size}\n')
+        f.write('xvals     = ')
+        f.write(_format(lons, decimals))
+        f.write('yvals     = ')
+        f.write(_format(lats, decimals))
+    if binary:
+        np.save(sidecar(filename), np.stack((lons, lats)))
+
+
+def read(filename):
+    """Returns the cell latitudes and longitudes of a red_points file, from
+    the binary sidecar if it exists and is not older than the file"""
+    binary = sidecar(filename)
+    if os.path.exists(binary) and \
+            os.path.getmtime(binary) >= os.path.getmtime(filename):
+        lons, lats = np.load(binary, mmap_mode='r')
+        return lats, lons
+    with open(filename) as f:
+        text = f.read()
+    xstart = text.index('xvals')
+    ystart = text.index('yvals')
+    lons = np.array(text[text.index('=', xstart)+1:ystart].split(), float)
+    lats = np.array(text[text.index('=', ystart)+1:].split(), float)
+    if lons.size != lats.size:
+        raise ValueError(f'Inconsistent number of cells in {filename}')
+    return lats, lons
@@ -1,6 +1,7 @@
 import numpy as np
 
 from .earth import RADIUS as EARTH_RADIUS
+from .immutable import cached, readonly
 
 
 def _equidistant(start, end, N, *, first_at_start=False):
@@ -55,8 +56,8 @@ class LatLonGrid:
             raise ValueError('Non-monotonic longitude values')
 
         self._OP = first_lat
-        self.lats = np.array(lats)
-        self.lons = np.array(lons)
+        self.lats = readonly(np.array(lats))
+        self.lons = readonly(np.array(lons))
 
     @property
     def nlats(self):
@@ -66,9 +67,11 @@ class LatLonGrid:
     def nlons(self):
         return len(self.lons)
 
+    @cached
     def cell_latitudes(self):
         return _col_distribute(self.lats, len(self.lons))
 
+    @cached
     def cell_longitudes(self):
         return _row_distribute(self.lons, len(self.lats))
 
@@ -96,11 +99,13 @@ class LatLonGrid:
             ]
         )
 
+    @cached
     def cell_corners(self):
         return np.array(
             [self._cell_corner_latitudes(), self._cell_corner_longitudes()]
         )
 
+    @cached
     def cell_areas(self):
         upper_lats = _interval_bounds(self._OP, self.lats, -self._OP, loc='u')
         lower_lats = _interval_bounds(self._OP, self.lats, -self._OP, loc='l')
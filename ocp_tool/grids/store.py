@@ -0,0 +1,230 @@
+"""Binary store for grid definitions
+
+A grid store is an uncompressed NumPy .npz file with one member per array,
+named '<grid>/<field>' (e.g. 'TCO95/yvals', 'TCO95/reducedpoints'). Scalar
+metadata, such as 'gridtype', are stored as zero-dimensional arrays. Since
+the members are not compressed, the arrays are memory-mapped directly from
+the file instead of being read, so opening a store is cheap regardless of its
+size. Stores can still be read with plain np.load().
+
+Optionally, precomputed cell centers and areas ('<grid>/cell_latitudes',
+'<grid>/cell_longitudes', '<grid>/cell_areas') can be added for reduced
+Gaussian grids.
+
+Converters are provided for 'cdo griddes' output, for the reduced Gaussian
+grid tables (input/gaussian_grids_*_reduced/*_reduced.txt) and for the
+red_points files (input/gaussian_grids_full/*_red_points.txt), see also the
+command line interface:
+
+    python -m ocp_tool.grids.store --help
+"""
+import argparse
+import struct
+import zipfile
+
+import numpy as np
+
+from .red_points import read as read_red_points
+from .gaussian import ReducedGaussianGrid
+from .oifs.utils import parse_griddes
+
+
+# Size of the fixed part of a local file header in a ZIP archive
+_ZIP_LOCAL_HEADER = struct.Struct('<4s5H3L2H')
+
+
+def _read_npy_header(f):
+    version = np.lib.format.read_magic(f)
+    if version == (1, 0):
+        return np.lib.format.read_array_header_1_0(f)
+    return np.lib.format.read_array_header_2_0(f)
+
+
+class GridStore:
+    """Read access to a grid store, with memory-mapped arrays"""
+
+    def __init__(self, path):
+        self.path = path
+        self._members = {}
+        with zipfile.ZipFile(path) as zf, open(path, 'rb') as f:
+            for info in zf.infolist():
+                if not info.filename.endswith('.npy'):
+                    continue
+                if info.compress_type != zipfile.ZIP_STORED:
+                    raise ValueError(
+                        f'Compressed member {info.filename} in grid store '
+                        f'{path}, can not be memory-mapped'
+                    )
+                f.seek(info.header_offset)
+                header = _ZIP_LOCAL_HEADER.unpack(
+                    f.read(_ZIP_LOCAL_HEADER.size)
+                )
+                name_length, extra_length = header[-2:]
+                f.seek(name_length+extra_length, 1)
+                shape, fortran_order, dtype = _read_npy_header(f)
+                self._members[info.filename[:-4]] = (
+                    shape, fortran_order, dtype, f.tell()
+                )
+
+    def __contains__(self, key):
+        return key in self._members
+
+    def __getitem__(self, key):
+        """Returns the array stored as 'key' (memory-mapped, read-only)"""
+        shape, fortran_order, dtype, offset = self._members[key]
+        if dtype.hasobject:
+            raise ValueError(f'Object array {key} can not be memory-mapped')
+        if 0 in shape:
+            return np.empty(shape, dtype=dtype)
+        return np.memmap(
+            self.path,
+            dtype=dtype,
+            mode='r',
+            offset=offset,
+            shape=shape,
+            order='F' if fortran_order else 'C',
+        )
+
+    def keys(self):
+        return self._members.keys()
+
+    def names(self):
+        """Names of all grids in the store"""
+        return sorted({key.split('/')[0] for key in self._members})
+
+    def definition(self, name):
+        """Returns all fields of grid 'name' as a dict. Scalars are returned
+        as Python objects, arrays as read-only memory maps."""
+        prefix = f'{name}/'
+        fields = {
+            key[len(prefix):]: self[key]
+            for key in self._members if key.startswith(prefix)
+        }
+        if not fields:
+            raise KeyError(f'Grid {name} not found in store {self.path}')
+        return {
+            key: val.item() if val.ndim == 0 else val
+            for key, val in fields.items()
+        }
+
+
+def write(path, definitions, precompute=False):
+    """Writes a grid store. 'definitions' maps grid names to dicts of fields
+    (arrays or scalars). If 'precompute' is True, cell centers and areas are
+    added for all grids with 'yvals' and 'reducedpoints'."""
+    arrays = {}
+    for name, fields in definitions.items():
+        for key, val in fields.items():
+            arrays[f'{name}/{key}'] = np.asarray(val)
+        if precompute and {'yvals', 'reducedpoints'}.issubset(fields):
+            grid = ReducedGaussianGrid(
+                lats=fields['yvals'], nlons=fields['reducedpoints']
+            )
+            arrays[f'{name}/cell_latitudes'] = grid.cell_latitudes()
+            arrays[f'{name}/cell_longitudes'] = grid.cell_longitudes()
+            arrays[f'{name}/cell_areas'] = grid.cell_areas()
+    np.savez(path, **arrays)
+
+
+def update(path, definitions, precompute=False):
+    """Adds (or replaces) grids in an existing grid store. Precomputed cell
+    centers and areas of existing grids are only kept with 'precompute'."""
+    store = GridStore(path)
+    merged = {
+        name: {
+            # Copy into memory, since the file is overwritten below
+            key: np.array(val) for key, val in store.definition(name).items()
+            if precompute or not key.startswith('cell_')
+        }
+        for name in store.names()
+    }
+    merged.update(definitions)
+    write(path, merged, precompute=precompute)
+
+
+def from_griddes(griddes_string):
+    """Converts 'cdo griddes' output into a dict of grid definitions, one for
+    each gridID in the output."""
+    return {
+        section: {key: np.asarray(val) for key, val in desc.items()}
+        for section, desc in parse_griddes(griddes_string).items()
+    }
+
+
+def from_reduced_table(filename):
+    """Converts a reduced Gaussian grid table (three header lines, then one
+    line per latitude with: number, reduced points, regular points,
+    latitude) into a grid definition."""
+    table = np.loadtxt(filename, skiprows=3, ndmin=2)
+    return {
+        'gridtype': 'gaussian_reduced',
+        'gridsize': int(table[:, 1].sum()),
+        'ysize': table.shape[0],
+        'yvals': table[:, 3],
+        'reducedpoints': table[:, 1].astype('int64'),
+    }
+
+
+def from_red_points(filename):
+    """Converts a red_points file (as written by ocp-tool.py, with one
+    longitude/latitude per line for all cells, see red_points) into a grid
+    definition. The latitudes of the rows and the number of cells per row are
+    recovered from the cell latitudes."""
+    lats, _ = read_red_points(filename)
+    row_starts = np.flatnonzero(np.diff(lats, prepend=np.nan) != 0)
+    return {
+        'gridtype': 'gaussian_reduced',
+        'gridsize': lats.size,
+        'ysize': row_starts.size,
+        'yvals': np.array(lats[row_starts]),
+        'reducedpoints': np.diff(np.append(row_starts, lats.size)),
+    }
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m ocp_tool.grids.store',
+        description='Convert grid descriptions into a grid store',
+    )
+    parser.add_argument('store', help='grid store (.npz) to write')
+    parser.add_argument(
+        'grids', nargs='+', metavar='NAME=FILE',
+        help='grid name and input file; the format is detected from the '
+             'file name (*_reduced.txt, *_red_points.txt) or else assumed to '
+             'be cdo griddes output (with a single grid)'
+    )
+    parser.add_argument(
+        '--append', action='store_true',
+        help='keep the grids of an existing store'
+    )
+    parser.add_argument(
+        '--precompute', action='store_true',
+        help='add precomputed cell centers and areas'
+    )
+    args = parser.parse_args(args)
+
+    definitions = {}
+    for spec in args.grids:
+        name, _, filename = spec.partition('=')
+        if filename.endswith('_reduced.txt'):
+            definitions[name] = from_reduced_table(filename)
+        elif filename.endswith('_red_points.txt'):
+            definitions[name] = from_red_points(filename)
+        else:
+            with open(filename) as f:
+                griddes = from_griddes(f.read())
+            if len(griddes) != 1:
+                raise ValueError(
+                    f'Expected exactly one grid in {filename}, '
+                    f'found {len(griddes)}'
+                )
+            definitions[name], = griddes.values()
+
+    if args.append:
+        update(args.store, definitions, precompute=args.precompute)
+    else:
+        write(args.store, definitions, precompute=args.precompute)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+"""Per-stage timing and memory instrumentation
+
+A Recorder collects one record per instrumented stage, containing wall time,
+CPU time, the increase of the peak resident set size and the number of bytes
+written by the process during the stage (None where the platform does not
+provide the information, e.g. on Windows). Recorders from different processes
+can be merged, and the collected records written to a JSON report.
+"""
+import json
+import time
+import sys
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+def _peak_rss():
+    """Peak resident set size of the current process in bytes, or None if
+    the information is not available on this platform"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is given in bytes on macOS, but in kilobytes on Linux
+    return peak if sys.platform == 'darwin' else 1024*peak
+
+
+def _bytes_written():
+    """Number of bytes written by the current process, or None if the
+    information is not available on this platform"""
+    try:
+        with open('/proc/self/io') as f:
+            for line in f:
+                if line.startswith('wchar:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+class Recorder:
+
+    def __init__(self, component=None):
+        self.component = component
+        self.records = []
+
+    @contextmanager
+    def stage(self, name):
+        """Context manager that records the enclosed code as stage 'name'"""
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        rss = _peak_rss()
+        written = _bytes_written()
+        try:
+            yield
+        finally:
+            written_after = _bytes_written()
+            self.records.append(
+                dict(
+                    component=self.component,
+                    stage=name,
+                    wall_time=time.perf_counter()-wall,
+                    cpu_time=time.process_time()-cpu,
+                    peak_rss_delta=None if rss is None
+                    else _peak_rss()-rss,
+                    bytes_written=None if written is None
+                    else written_after-written,
+                )
+            )
+
+    def call(self, stage, func, *args, **kwargs):
+        """Calls func(*args, **kwargs), recorded as 'stage'"""
+        with self.stage(stage):
+            return func(*args, **kwargs)
+
+    def instrument(self, obj, prefix):
+        """Returns a proxy for obj (typically a grid), on which every call to
+        a cell_* method is recorded as stage '<prefix>.<method>'"""
+        return _Instrumented(obj, self, prefix)
+
+    def extend(self, records):
+        self.records.extend(records)
+
+    def report(self):
+        return {'stages': list(self.records)}
+
+    def write(self, filename):
+        with open(filename, 'w') as f:
+            json.dump(self.report(), f, indent=2)
+
+
+class _Instrumented:
+
+    def __init__(self, obj, recorder, prefix):
+        self._obj = obj
+        self._recorder = recorder
+        self._prefix = prefix
+
+    def __getattr__(self, name):
+        attr = getattr(self._obj, name)
+        if not (name.startswith('cell_') and callable(attr)):
+            return attr
+
+        def recorded(*args, **kwargs):
+            label = ','.join(
+                [*map(str, args), *(f'{k}={v}' for k, v in kwargs.items())]
+            )
+            return self._recorder.call(
+                f'{self._prefix}.{name}({label})', attr, *args, **kwargs
+            )
+        return recorded
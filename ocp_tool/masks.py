@@ -0,0 +1,49 @@
+"""Land-sea masks derived from the ocean model grid
+
+Instead of thresholding the atmosphere's own land-sea mask, the ocean fraction
+of every atmosphere cell is computed as the exact area covered by unmasked
+ocean cells, using the overlap engine of the conservative remapping. Binary
+masks derived from this fraction are consistent with the ocean grid by
+construction.
+"""
+import numpy as np
+
+from . import spherical
+from .remap import overlap_areas
+
+
+def ocean_fraction(atm_grid, ocean_grid, ocean_mask=None, workers=1,
+                   chunk_size=20000):
+    """Computes, for every cell of atm_grid, the fraction of its area that is
+    covered by unmasked cells of ocean_grid (e.g. the ORCA T-grid). The ocean
+    mask follows the OASIS convention (1 is land) and defaults to
+    ocean_grid.cell_masks(). The overlaps are computed in the calling process
+    unless 'workers' asks for more processes (None for all CPUs). Returns an
+    array with the shape of atm_grid.cell_latitudes()."""
+    atm_corners = atm_grid.cell_corners()
+    ocean_corners = ocean_grid.cell_corners()
+    if ocean_mask is None:
+        ocean_mask = ocean_grid.cell_masks()
+
+    atm_polys = spherical.polygons(atm_corners)
+    atm_area = spherical.polygon_areas(atm_polys)
+
+    atm_address, _, areas = overlap_areas(
+        spherical.polygons(ocean_corners),
+        atm_polys,
+        src_active=spherical.valid_corners(ocean_corners)
+        & (np.ravel(ocean_mask) == 0),
+        workers=workers,
+        chunk_size=chunk_size,
+    )
+
+    fraction = np.bincount(atm_address, areas, minlength=atm_area.size)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        fraction = np.where(atm_area > 0, fraction/atm_area, 0)
+    return np.clip(fraction, 0, 1).reshape(atm_corners.shape[2:])
+
+
+def binary_ocean(fraction, threshold=0.5):
+    """Returns 1 for cells with an ocean fraction of at least 'threshold' and
+    0 otherwise."""
+    return np.where(fraction >= threshold, 1, 0)
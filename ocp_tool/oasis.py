@@ -1,8 +1,17 @@
+import itertools
 import os
+from collections import namedtuple
+from contextlib import ExitStack
 
 import numpy as np
 from netCDF4 import Dataset as NCDataset
 
+from . import spherical
+from .grids.earth import RADIUS as EARTH_RADIUS
+
+# Relative differences between two sets of cell areas
+AreaDifference = namedtuple('AreaDifference', 'max mean total')
+
 
 def _get_var(nc, name, type_, dim):
     """Return variable with 'name' from Dataset 'nc', creating it if it does
@@ -77,7 +86,43 @@ def write_grid(name, lats, lons, corners=None, path=None, append=True):
                 clo_id[:, 0, :] = np.transpose(corners[1, ...])
 
 
-def write_area(name, areas, path=None, append=True):
+def polygon_areas(corners, areas=None):
+    """Cell areas (m2) of the spherical polygons given by the cell corners
+    (the output of a grid's cell_corners() method). Cells with undefined
+    corners take the value of 'areas' (e.g. the grid's own cell_areas()) if
+    given, otherwise NaN."""
+    polygon = spherical.corner_areas(corners) * EARTH_RADIUS**2
+    if areas is not None:
+        undefined = np.isnan(polygon)
+        polygon[undefined] = np.asarray(areas)[undefined]
+    return polygon
+
+
+def area_difference(areas, reference):
+    """Relative difference of cell areas from reference areas (e.g. polygon
+    areas from polygon_areas() and a grid's cell_areas()): maximum and
+    mean of the absolute cell-wise differences and the difference of the
+    totals, over all cells with finite areas and positive reference areas"""
+    areas = np.ravel(areas)
+    reference = np.ravel(reference)
+    valid = np.isfinite(areas) & np.isfinite(reference) & (reference > 0)
+    if not valid.any():
+        return AreaDifference(np.nan, np.nan, np.nan)
+    relative = np.abs(areas[valid]/reference[valid] - 1)
+    return AreaDifference(
+        max=relative.max(),
+        mean=relative.mean(),
+        total=areas[valid].sum()/reference[valid].sum() - 1,
+    )
+
+
+def write_area(name, areas, path=None, append=True, corners=None):
+    """Writes the cell areas of grid 'name'. If 'corners' are given, the
+    areas are computed from the cell corners instead (consistent with the
+    polygons used for conservative remapping), see polygon_areas()."""
+
+    if corners is not None:
+        areas = polygon_areas(corners, areas)
 
     if areas.ndim not in (1, 2):
         raise ValueError('Invalid dimensions, must be one or two dimensional')
@@ -133,3 +178,216 @@ def write_mask(name, masks, path=None, append=True):
 
         masks_id = _get_var(nc, masks_v, 'int32', (row_d, col_d))
         masks_id[...] = masks if two_dim else [masks]
+
+
+def _block_shape(shape, itemsize, chunks, block_bytes):
+    """Shape of the blocks in which a variable is copied: whole trailing
+    axes as long as they fit into block_bytes, a part of the next axis and
+    single indices (or single chunks) of the leading axes. If the variable is
+    chunked, blocks are aligned to the chunks, so that each chunk is read
+    and decompressed only once. Empty axes get blocks of length 1, so that
+    the blocks of an empty variable are empty ranges."""
+    block = list(shape)
+    size = itemsize
+    for axis in reversed(range(len(shape))):
+        if size*shape[axis] <= block_bytes:
+            size *= shape[axis]
+            continue
+        n = max(1, block_bytes // size)
+        if chunks:
+            n = max(chunks[axis], n // chunks[axis] * chunks[axis])
+        block[axis] = min(n, shape[axis])
+        for leading in range(axis):
+            block[leading] = chunks[leading] if chunks else 1
+        break
+    return [max(1, b) for b in block]
+
+
+def _storage(variable, nc):
+    """Keyword arguments for createVariable that reproduce the compression,
+    chunking and fill value of 'variable' (if supported by 'nc')"""
+    kwargs = {}
+    if '_FillValue' in variable.ncattrs():
+        kwargs['fill_value'] = variable.getncattr('_FillValue')
+    if not nc.data_model.startswith('NETCDF4'):
+        return kwargs
+    filters = variable.filters() or {}
+    kwargs.update(
+        zlib=filters.get('zlib', False),
+        complevel=filters.get('complevel', 4) or 4,
+        shuffle=filters.get('shuffle', False),
+        fletcher32=filters.get('fletcher32', False),
+    )
+    chunking = variable.chunking()
+    if chunking == 'contiguous':
+        kwargs['contiguous'] = True
+    elif chunking:
+        kwargs['chunksizes'] = chunking
+    return kwargs
+
+
+def copy_netcdf(src, dst, global_attributes=True, block_bytes=64*2**20):
+    """Copies all dimensions and variables, with their attributes, of the
+    netCDF file 'src' into 'dst' (file names or open Datasets, a dst file
+    is created or appended to). Unlimited dimensions stay unlimited,
+    compression and chunking are preserved where the format of dst allows.
+    Dimensions that already exist in dst are reused if their size matches.
+    Data are copied raw (without masking and scaling) in blocks of about
+    block_bytes, so the memory needed does not depend on the variable
+    sizes."""
+    with ExitStack() as stack:
+        if isinstance(src, (str, os.PathLike)):
+            src = stack.enter_context(NCDataset(src, mode='r'))
+        if isinstance(dst, (str, os.PathLike)):
+            dst = stack.enter_context(NCDataset(dst, mode='a'))
+
+        if global_attributes:
+            dst.setncatts({key: src.getncattr(key) for key in src.ncattrs()})
+
+        for name, dimension in src.dimensions.items():
+            size = None if dimension.isunlimited() else len(dimension)
+            if name not in dst.dimensions:
+                dst.createDimension(name, size)
+            elif size is not None and len(dst.dimensions[name]) != size:
+                raise ValueError(
+                    f'Dimension {name} exists with a different size'
+                )
+
+        for name, variable in src.variables.items():
+            out = dst.createVariable(
+                name, variable.datatype, variable.dimensions,
+                **_storage(variable, dst)
+            )
+            out.setncatts(
+                {
+                    key: variable.getncattr(key)
+                    for key in variable.ncattrs() if key != '_FillValue'
+                }
+            )
+            variable.set_auto_maskandscale(False)
+            out.set_auto_maskandscale(False)
+
+            if variable.ndim == 0:
+                out[...] = variable[...]
+                continue
+            chunking = variable.chunking()
+            block = _block_shape(
+                variable.shape,
+                np.dtype(variable.dtype).itemsize
+                if isinstance(variable.dtype, np.dtype) else 1,
+                chunking if isinstance(chunking, list) else None,
+                block_bytes,
+            )
+            for start in itertools.product(
+                    *(range(0, n, b) for n, b in zip(variable.shape, block))
+            ):
+                index = tuple(
+                    slice(i, i+b) for i, b in zip(start, block)
+                )
+                out[index] = variable[index]
+
+
+def weights_filename(src_name, dst_name, method, normalization=None):
+    """Returns the file name under which OASIS looks for remapping weights,
+    e.g. rmp_ICML_to_NOTM_CONSERV_FRACAREA.nc"""
+    suffix = f'_{normalization.upper()}' if normalization else ''
+    return f'rmp_{src_name}_to_{dst_name}_{method}{suffix}.nc'
+
+
+def write_weights(src_name, dst_name, weights, path=None):
+    """Writes remapping weights (an ocp_tool.remap.Weights object) to a SCRIP
+    formatted rmp_*.nc file that can be read by OASIS. Returns the name of
+    the written file."""
+
+    filename = os.path.join(
+        path or '',
+        weights_filename(
+            src_name, dst_name, weights.method, weights.normalization
+        )
+    )
+
+    with NCDataset(filename, mode='w') as nc:
+
+        nc.title = f'{src_name} to {dst_name} {weights.method}'
+        nc.normalization = weights.normalization or 'none'
+        nc.map_method = weights.map_methods[weights.method]
+        nc.conventions = 'SCRIP'
+        nc.source_grid = src_name
+        nc.dest_grid = dst_name
+
+        nc.createDimension('num_links', weights.num_links)
+        nc.createDimension('num_wgts', 1)
+
+        for prefix, grid, area, frac in (
+                ('src', weights.src, weights.src_area, weights.src_frac),
+                ('dst', weights.dst, weights.dst_area, weights.dst_frac),
+        ):
+            size_d = f'{prefix}_grid_size'
+            rank_d = f'{prefix}_grid_rank'
+            nc.createDimension(size_d, grid.size)
+            nc.createDimension(rank_d, len(grid.dims))
+
+            dims_id = nc.createVariable(
+                f'{prefix}_grid_dims', 'int32', (rank_d,)
+            )
+            dims_id[...] = grid.dims
+
+            lat_id = nc.createVariable(
+                f'{prefix}_grid_center_lat', 'float64', (size_d,)
+            )
+            lat_id.units = 'degrees'
+            lat_id[...] = grid.lats
+
+            lon_id = nc.createVariable(
+                f'{prefix}_grid_center_lon', 'float64', (size_d,)
+            )
+            lon_id.units = 'degrees'
+            lon_id[...] = grid.lons
+
+            # SCRIP masks are 1 for active cells, i.e. the inverse of OASIS
+            imask_id = nc.createVariable(
+                f'{prefix}_grid_imask', 'int32', (size_d,)
+            )
+            imask_id.units = 'unitless'
+            imask_id[...] = 1-grid.mask
+
+            if grid.corners is not None:
+                crn_d = f'{prefix}_grid_corners'
+                nc.createDimension(crn_d, grid.corners.shape[1])
+                cla_id = nc.createVariable(
+                    f'{prefix}_grid_corner_lat', 'float64', (size_d, crn_d)
+                )
+                cla_id.units = 'degrees'
+                cla_id[...] = grid.corners[0].T
+                clo_id = nc.createVariable(
+                    f'{prefix}_grid_corner_lon', 'float64', (size_d, crn_d)
+                )
+                clo_id.units = 'degrees'
+                clo_id[...] = grid.corners[1].T
+
+            if area is not None:
+                area_id = nc.createVariable(
+                    f'{prefix}_grid_area', 'float64', (size_d,)
+                )
+                area_id.units = 'square radians'
+                area_id[...] = area
+
+            if frac is not None:
+                frac_id = nc.createVariable(
+                    f'{prefix}_grid_frac', 'float64', (size_d,)
+                )
+                frac_id.units = 'unitless'
+                frac_id[...] = frac
+
+        # SCRIP addresses are one-based
+        src_id = nc.createVariable('src_address', 'int32', ('num_links',))
+        src_id[...] = weights.src_address + 1
+        dst_id = nc.createVariable('dst_address', 'int32', ('num_links',))
+        dst_id[...] = weights.dst_address + 1
+
+        wgt_id = nc.createVariable(
+            'remap_matrix', 'float64', ('num_links', 'num_wgts')
+        )
+        wgt_id[:, 0] = weights.weights
+
+    return filename
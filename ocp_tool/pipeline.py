@@ -0,0 +1,422 @@
+"""Building and writing the OASIS grids, areas and masks of all components
+
+The geometry and masks of each coupled component (OpenIFS, NEMO, runoff
+mapper, AMIP forcing reader) are built independently by the component
+functions below, which return a list of Products. Components are built
+concurrently in a process pool, while a single writer in the calling process
+appends the products to the OASIS files as they become available.
+"""
+import os
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from . import basins
+from . import grids
+from . import grib
+from . import instrument
+from . import masks
+from . import oasis
+from . import regions
+
+
+# OASIS grid name:
+# <component><component_spec_1><component_spec_2><component_spec_3>
+#
+#   where component is:
+#       I - OpenIFS
+#       N - NEMO/SI3
+#       R - Runoff-mapper
+#       A - AMIP Forcing reader
+#
+# OpenIFS component spec:
+# <grid_type><mask_type><resolution>
+#   where grid_type is:
+#       L - linear (TL) grid
+#       C - cubic octahedral (Tco) grid
+#   and mask_type is:
+#       A - all atmosphere, nothing masked
+#       L - land, ocean is masked
+#       O - ocean, land is masked
+#   and resolution is:
+#       l - very low resolution
+#       L - low resolution
+#       M - medium (standard) resolution
+#       H - high resolution
+#       h - very high resolution
+#       x - extremely high resolution
+#
+# NEMO componen spec:
+#   <extend><subgrid><resolution>
+#       where extend is
+#           O - standard ORCA grids
+#           E - extended eORCA grids
+#       and subgrid is
+#           T, U, V - t, u, v staggered subgrids
+#       and resolution is
+#           L - low resolution (ORCA2)
+#           M - medium (standard) resolution (ORCA1)
+#           H - high resolution (ORCA025)
+#           h - very high resolution (ORCA012)
+#           x - extremely high resolution (ORCA036)
+
+OASIS_GRID_NAMES = {
+    'TCO199': 'ICH',  # 2nd character to be inserted later
+    'TCO159': 'ICM',
+    'TL255': 'ILM',
+    'TCO95': 'ICL',
+    'TL159': 'ILL',
+    'TQ21': 'IQx',
+    'ORCA1L75t': 'NOTM',
+    'ORCA1L75u': 'NOUM',
+    'ORCA1L75v': 'NOVM',
+    'ORCA025L75t': 'NOTH',
+    'ORCA025L75u': 'NOUH',
+    'ORCA025L75v': 'NOVH',
+    'rnfm-atm': 'RNFA',
+    'amipfr': 'AMIP',
+}
+
+
+def oifs_oasis_grid_name(grid_type, specifier):
+    """Constructs the final name of an OpenIFS grid in OASIS"""
+    try:
+        name = OASIS_GRID_NAMES[grid_type]
+    except KeyError:
+        raise ComponentError(f'No OASIS grid name for OIFS grid {grid_type}')
+    return name[0] + specifier + name[1:]
+
+
+def nemo_oasis_grid_name(grid_name, subgrid):
+    """Constructs the name of a NEMO subgrid in OASIS"""
+    try:
+        return OASIS_GRID_NAMES[grid_name+subgrid]
+    except KeyError:
+        raise ComponentError(
+            f'No OASIS grid name for NEMO grid {grid_name}, '
+            f'subgrid {subgrid}'
+        )
+
+
+# Everything that is written to the OASIS files for one grid
+Product = namedtuple('Product', 'name lats lons corners areas masks')
+
+
+class ComponentError(Exception):
+    """Raised by the component functions for invalid input"""
+
+
+# All component functions accept an ocp_tool.instrument.Recorder, which
+# records the grid construction, all cell_* calls and all file access
+
+
+def _factory(recorder, prefix, *args):
+    return recorder.instrument(
+        recorder.call('grids.factory', grids.factory, *args), prefix
+    )
+
+
+def _nemo_grid(grid_file, mask_file, recorder):
+    try:
+        return _factory(recorder, 'nemo_grid', 'ORCA', grid_file, mask_file)
+    except (FileNotFoundError, PermissionError):
+        raise ComponentError(f'Could not open NEMO grid file "{grid_file}"')
+
+
+def _read_grib(mask_file, shortnames, recorder):
+    try:
+        fields = recorder.call('grib.read', grib.read, mask_file, shortnames)
+    except (FileNotFoundError, PermissionError):
+        raise ComponentError(f'Could not open OIFS mask file "{mask_file}"')
+    missing = [name for name, values in fields.items() if values is None]
+    if missing:
+        raise ComponentError(
+            f'Fields {", ".join(missing)} not found in OIFS mask file '
+            f'"{mask_file}"'
+        )
+    return fields
+
+
+def _apply_edits(fields, edits, oifs_grid, grid_type, mask_file, recorder):
+    """Applies region edits to the OIFS fields, reading further fields from
+    the GRIB mask file as needed"""
+    try:
+        required = regions.required_fields(edits)
+    except ValueError as e:
+        raise ComponentError(str(e))
+    missing = tuple(sorted(required - set(fields)))
+    if missing:
+        fields = {**fields, **_read_grib(mask_file, missing, recorder)}
+    if any(
+        np.size(values) != oifs_grid.cell_latitudes().size
+        for values in fields.values()
+    ):
+        raise ComponentError(
+            f'OIFS mask file "{mask_file}" does not match the OIFS grid '
+            f'{grid_type}'
+        )
+    return recorder.call(
+        'regions.apply',
+        regions.apply,
+        fields,
+        edits,
+        oifs_grid.cell_latitudes(),
+        oifs_grid.cell_longitudes(),
+    )
+
+
+def _binary_ocean(fields, mask_source):
+    """Binary OIFS ocean mask (1 for ocean)"""
+    if mask_source == 'grib':
+        return np.where(
+            np.logical_or(fields['lsm'] > 0.5, fields['cl'] > 0.5), 0, 1
+        )
+    return masks.binary_ocean(1-fields['lsm'])
+
+
+def oifs(grid_type, mask_file, mask_source='grib', nemo_grid_file=None,
+         nemo_mask_file=None, modified_mask_file=None, region_edits=None,
+         fill_inland_basins=False, workers=1, recorder=None):
+    """Products of the OpenIFS component: the same grid with land (L) and
+    ocean (O) masks. The masks are either derived from the lsm and cl fields
+    in the GRIB mask file (mask_source='grib') or from the overlap with the
+    NEMO grid (mask_source='nemo'). In the latter case, the land-sea mask is
+    the fractional land cover. The named regions in 'region_edits' (see
+    ocp_tool.regions) are then applied to the land-sea mask and the other
+    affected fields, e.g. to remove basins. With 'fill_inland_basins', water
+    bodies of the OpenIFS mask that have no counterpart in the NEMO mask are
+    detected (see ocp_tool.basins) and turned into land as well. If the mask
+    has been derived from NEMO or edited, a copy of the GRIB file with the
+    modified fields can be written as well. 'workers' is the number of
+    processes for the overlaps with the NEMO grid, see component_workers()
+    when running under build()."""
+    recorder = recorder or instrument.Recorder()
+    try:
+        oifs_grid = _factory(recorder, 'oifs_grid', grid_type)
+    except NotImplementedError:
+        raise ComponentError(f'Invalid OIFS grid type: {grid_type}')
+    # Grids of the store without an OASIS name fail before any work is done
+    land_name = oifs_oasis_grid_name(grid_type, 'L')
+    ocean_name = oifs_oasis_grid_name(grid_type, 'O')
+
+    if mask_source == 'grib':
+        fields = _read_grib(mask_file, ('lsm', 'cl'), recorder)
+    elif mask_source == 'nemo':
+        if nemo_grid_file is None:
+            raise ComponentError(
+                'The OIFS mask source "nemo" needs a NEMO grid file'
+            )
+        oifs_ocean_fraction = recorder.call(
+            'masks.ocean_fraction',
+            masks.ocean_fraction,
+            oifs_grid,
+            _nemo_grid(nemo_grid_file, nemo_mask_file, recorder),
+            workers=workers
+        )
+        fields = {'lsm': 1-oifs_ocean_fraction}
+    else:
+        raise ComponentError(f'Invalid OIFS mask source: {mask_source}')
+
+    modified_fields = ['lsm'] if mask_source == 'nemo' else []
+    if region_edits:
+        fields = _apply_edits(
+            fields, region_edits, oifs_grid, grid_type, mask_file, recorder
+        )
+        modified_fields += sorted(
+            regions.edited_fields(region_edits) - set(modified_fields)
+        )
+    oifs_lsm = _binary_ocean(fields, mask_source)
+
+    if fill_inland_basins:
+        if nemo_grid_file is None:
+            raise ComponentError(
+                'Filling inland basins needs a NEMO grid file'
+            )
+        nemo_grid = _nemo_grid(nemo_grid_file, nemo_mask_file, recorder)
+        inland = [
+            basin for basin in recorder.call(
+                'basins.inland_basins',
+                basins.inland_basins,
+                oifs_grid,
+                oifs_lsm == 1,
+                nemo_grid,
+                nemo_grid.cell_masks() == 0,
+            )
+            if basin.ocean_label is None
+        ]
+        if inland:
+            fill = [
+                regions.Region(
+                    regions.Cells(basin.cells), regions.REMOVE_WATER
+                )
+                for basin in inland
+            ]
+            fields = _apply_edits(
+                fields, fill, oifs_grid, grid_type, mask_file, recorder
+            )
+            modified_fields += sorted(
+                regions.edited_fields(fill) - set(modified_fields)
+            )
+            oifs_lsm = _binary_ocean(fields, mask_source)
+
+    if modified_mask_file is not None and modified_fields:
+        try:
+            recorder.call(
+                'grib.copy_modify',
+                grib.copy_modify,
+                mask_file,
+                modified_mask_file,
+                {name: fields[name] for name in modified_fields}
+            )
+        except (FileNotFoundError, PermissionError):
+            raise ComponentError(
+                f'Could not copy OIFS mask file "{mask_file}" '
+                f'to "{modified_mask_file}"'
+            )
+
+    lats = oifs_grid.cell_latitudes()
+    lons = oifs_grid.cell_longitudes()
+    corners = oifs_grid.cell_corners()
+    areas = oifs_grid.cell_areas()
+    return [
+        Product(
+            land_name,
+            lats, lons, corners, areas, oifs_lsm
+        ),
+        Product(
+            ocean_name,
+            lats, lons, corners, areas, 1-oifs_lsm
+        ),
+    ]
+
+
+def nemo(grid_file, mask_file=None, recorder=None):
+    """Products of the NEMO component: the t, u and v subgrids"""
+    recorder = recorder or instrument.Recorder()
+    nemo_grid = _nemo_grid(grid_file, mask_file, recorder)
+    return [
+        Product(
+            nemo_oasis_grid_name(nemo_grid.name, subgrid),
+            nemo_grid.cell_latitudes(subgrid=subgrid),
+            nemo_grid.cell_longitudes(subgrid=subgrid),
+            nemo_grid.cell_corners(subgrid=subgrid),
+            nemo_grid.cell_areas(subgrid=subgrid),
+            nemo_grid.cell_masks(subgrid=subgrid),
+        )
+        for subgrid in ('t', 'u', 'v')
+    ]
+
+
+def rnfm(recorder=None):
+    """Products of the runoff-mapper component (F128 grid, nothing masked)"""
+    recorder = recorder or instrument.Recorder()
+    rnfm_grid = _factory(recorder, 'rnfm_grid', 'F128')
+    return [
+        Product(
+            OASIS_GRID_NAMES['rnfm-atm'],
+            rnfm_grid.cell_latitudes(),
+            rnfm_grid.cell_longitudes(),
+            rnfm_grid.cell_corners(),
+            rnfm_grid.cell_areas(),
+            np.zeros((rnfm_grid.nlons, rnfm_grid.nlats)),
+        )
+    ]
+
+
+def amipfr(recorder=None):
+    """Products of the AMIP forcing-reader component (1x1 degree grid,
+    nothing masked)"""
+    recorder = recorder or instrument.Recorder()
+    amipfr_grid = recorder.instrument(
+        recorder.call(
+            'grids.factory',
+            grids.factory, 'regular_latlon', nlats=180, nlons=360
+        ),
+        'amipfr_grid'
+    )
+    return [
+        Product(
+            OASIS_GRID_NAMES['amipfr'],
+            amipfr_grid.cell_latitudes(),
+            amipfr_grid.cell_longitudes(),
+            amipfr_grid.cell_corners(),
+            amipfr_grid.cell_areas(),
+            np.zeros((amipfr_grid.nlats, amipfr_grid.nlons)),
+        )
+    ]
+
+
+def _timed(label, func, kwargs):
+    recorder = instrument.Recorder(label)
+    start = time.perf_counter()
+    products = func(**kwargs, recorder=recorder)
+    return products, time.perf_counter()-start, recorder.records
+
+
+def _pool_size(workers, ncomponents):
+    return min(workers or os.cpu_count() or 1, ncomponents)
+
+
+def component_workers(workers, ncomponents):
+    """Number of processes each component may use itself (e.g. the 'workers'
+    of oifs()) while build() runs 'ncomponents' components with 'workers'
+    (None for all CPUs), such that the total does not exceed 'workers'"""
+    total = workers or os.cpu_count() or 1
+    return max(1, total // _pool_size(workers, ncomponents))
+
+
+def build(components, workers=None):
+    """Builds components concurrently in a pool of 'workers' processes.
+    'components' is a dict mapping a label to a (function, kwargs) tuple.
+    Yields (label, products, elapsed seconds, instrumentation records)
+    tuples in order of completion. With workers=1, everything runs in the
+    calling process."""
+    if workers == 1:
+        for label, (func, kwargs) in components.items():
+            yield (label, *_timed(label, func, kwargs))
+        return
+    with ProcessPoolExecutor(
+            max_workers=_pool_size(workers, len(components))
+         ) as pool:
+        futures = {
+            pool.submit(_timed, label, func, kwargs): label
+            for label, (func, kwargs) in components.items()
+        }
+        for future in as_completed(futures):
+            yield (futures[future], *future.result())
+
+
+def create_files(path=None):
+    """Creates empty OASIS grids, areas and masks files, so that all products
+    can be appended in any order."""
+    for filebase in ('grids', 'areas', 'masks'):
+        with oasis.NCDataset(
+                os.path.join(path or '', f'{filebase}.nc'), mode='w'
+             ):
+            pass
+
+
+def write(product, path=None, recorder=None):
+    """Appends a product to the (existing) OASIS files"""
+    recorder = recorder or instrument.Recorder()
+    recorder.call(
+        f'oasis.write_grid({product.name})',
+        oasis.write_grid,
+        name=product.name,
+        lats=product.lats,
+        lons=product.lons,
+        corners=product.corners,
+        path=path
+    )
+    recorder.call(
+        f'oasis.write_area({product.name})',
+        oasis.write_area,
+        name=product.name, areas=product.areas, path=path
+    )
+    recorder.call(
+        f'oasis.write_mask({product.name})',
+        oasis.write_mask,
+        name=product.name, masks=product.masks, path=path
+    )
@@ -0,0 +1,265 @@
+"""Named regions and edits of the OpenIFS land-sea mask and soil type
+
+The registry below defines regions (lat/lon boxes, polygons or conditions on
+other fields) together with the action that is applied to the cells of the
+region, i.e. new values for GRIB fields given by their shortName. A list of
+regions is compiled into index arrays over the cell centers of a grid, and
+all actions are applied in one vectorized pass over each field. If regions
+overlap, the action of the later region in the list takes precedence.
+Regions that are not in the registry can be given as Region objects or as
+dicts (see from_dict).
+
+The boxes have been taken from the original ocp-tool.py (modify_lsm).
+"""
+from collections import namedtuple
+
+import numpy as np
+
+
+def _normalise_longitudes(lons):
+    """Maps longitudes to [-180, 180)"""
+    return (np.asarray(lons)+180) % 360 - 180
+
+
+class Points:
+    """The cell centers of a grid, sorted by latitude, so that the cells in a
+    latitude band can be found by bisection. This index is shared by all
+    regions that are compiled for the same grid."""
+
+    def __init__(self, lats, lons):
+        self.shape = np.shape(lats)
+        lats = np.ravel(lats)
+        self.order = np.argsort(lats, kind='stable')
+        self.lats = lats[self.order]
+        self.lons = _normalise_longitudes(np.ravel(lons))[self.order]
+
+    def band(self, south, north):
+        """Returns the slice of the sorted points with south <= lat <= north"""
+        return slice(
+            np.searchsorted(self.lats, south, side='left'),
+            np.searchsorted(self.lats, north, side='right'),
+        )
+
+    def indices(self, sorted_indices):
+        """Converts indices into the sorted points to (sorted) indices into
+        the flattened grid"""
+        return np.sort(self.order[sorted_indices])
+
+    def mask(self, indices):
+        """Converts indices into the flattened grid to a boolean mask with
+        the shape of the grid"""
+        mask = np.zeros(self.order.size, dtype=bool)
+        mask[indices] = True
+        return mask.reshape(self.shape)
+
+
+class Box:
+    """Cells with centers strictly inside the latitude and longitude bounds.
+    Longitudes can be given in [-180, 180] or [0, 360], if west > east
+    (after mapping to [-180, 180)), the box crosses the date line."""
+
+    def __init__(self, south, north, west, east):
+        self.south = south
+        self.north = north
+        self.west = west
+        self.east = east
+
+    def indices(self, points, fields=None):
+        band = points.band(self.south, self.north)
+        in_lats, in_lons = self.axes(points.lats[band], points.lons[band])
+        return points.indices(band.start + np.flatnonzero(in_lats & in_lons))
+
+    def axes(self, lats, lons):
+        """For grids that are regular in latitude and longitude: returns the
+        boolean vectors that select the latitudes and longitudes of the box
+        from the coordinate vectors lats and lons"""
+        lats = np.asarray(lats)
+        lons = _normalise_longitudes(lons)
+        west, east = _normalise_longitudes((self.west, self.east))
+        in_lons = (lons > west) & (lons < east) if west <= east \
+            else (lons > west) | (lons < east)
+        return (lats > self.south) & (lats < self.north), in_lons
+
+
+class Polygon:
+    """Cells with centers inside a polygon, given by the latitudes and
+    longitudes of its vertices (the polygon is closed automatically). The
+    test is planar in latitude/longitude (even-odd rule), with straight edges
+    in that plane, which is adequate for regional outlines. Polygons may
+    cross the date line, but must not contain a pole.
+
+    Only cells in the bounding box are tested, and each edge is only tested
+    against the cells in its own latitude band, so the cost grows with the
+    number of cells near the polygon rather than with the grid size."""
+
+    def __init__(self, lats, lons):
+        self.lats = np.asarray(lats, dtype='float64')
+        # Make the outline continuous across the date line
+        self.lons = np.unwrap(
+            np.asarray(lons, dtype='float64'), period=360
+        )
+        if self.lats.shape != self.lons.shape or self.lats.size < 3:
+            raise ValueError('A polygon needs at least three vertices')
+
+    def indices(self, points, fields=None):
+        south, north = self.lats.min(), self.lats.max()
+        west, east = self.lons.min(), self.lons.max()
+        band = points.band(south, north)
+        # Longitudes relative to the western bound, in [west, west+360)
+        lons = west + (points.lons[band]-west) % 360
+        candidates = np.flatnonzero(lons <= east)
+        # Candidates are still sorted by latitude
+        lats = points.lats[band][candidates]
+        lons = lons[candidates]
+
+        inside = np.zeros(candidates.size, dtype=bool)
+        for lat1, lon1, lat2, lon2 in zip(
+                self.lats, self.lons,
+                np.roll(self.lats, -1), np.roll(self.lons, -1)
+             ):
+            if lat1 == lat2:
+                continue
+            # Points with min(lat1, lat2) <= lat < max(lat1, lat2)
+            edge = slice(
+                np.searchsorted(lats, min(lat1, lat2), side='left'),
+                np.searchsorted(lats, max(lat1, lat2), side='left'),
+            )
+            crossing = lon1 + (lats[edge]-lat1)*(lon2-lon1)/(lat2-lat1)
+            inside[edge] ^= lons[edge] < crossing
+
+        return points.indices(band.start + candidates[inside])
+
+
+class Threshold:
+    """Cells where another field (given by its shortName) is at least
+    'threshold', e.g. the lake cover"""
+
+    def __init__(self, field, threshold):
+        self.field = field
+        self.threshold = threshold
+
+    def indices(self, points, fields=None):
+        if fields is None or self.field not in fields:
+            raise ValueError(f'Region needs field {self.field}')
+        return np.flatnonzero(np.ravel(fields[self.field]) >= self.threshold)
+
+
+class Cells:
+    """Cells given by their indices into the flattened grid, e.g. the cells
+    of a basin found by ocp_tool.basins"""
+
+    def __init__(self, indices):
+        self.cells = np.sort(np.asarray(indices, dtype='int64'))
+
+    def indices(self, points, fields=None):
+        return self.cells
+
+
+Region = namedtuple('Region', 'shape action')
+
+# Water (lake or basin) is turned into land with soil type sandy clay loam
+REMOVE_WATER = {'lsm': 1, 'slt': 6}
+# Land is turned into ocean
+ADD_OCEAN = {'lsm': 0, 'slt': 0}
+
+REGIONS = {
+    # Lakes, according to the lake cover field
+    'lakes': Region(Threshold('cl', 0.5), REMOVE_WATER),
+    # Basins that are not resolved by some ocean grids
+    'caspian-sea': Region(Box(36, 47, 46, 56), REMOVE_WATER),
+    'black-sea': Region(Box(40.5, 48, 27, 43), REMOVE_WATER),
+    'white-sea': Region(Box(63, 67, 31, 41), REMOVE_WATER),
+    'gulf-of-ob': Region(Box(65, 71, 70, 79), REMOVE_WATER),
+    'persian-gulf': Region(Box(21, 31, 46, 59), REMOVE_WATER),
+    'coronation-queen-maude': Region(Box(48, 55, -102, -94), REMOVE_WATER),
+    # Coastlines where the ocean grid has wet points on OpenIFS land
+    'tanquary-fiord': Region(Box(79.5, 81.5, -102, -98), ADD_OCEAN),
+    'spencer-golf': Region(Box(-35, -34, 137, 137.5), ADD_OCEAN),
+    'ingrid-christensen-coast': Region(Box(-67, -65, 97, 100), ADD_OCEAN),
+    'jennings-promontory': Region(Box(-71, -68, 68.5, 71.6), ADD_OCEAN),
+    'princess-martha-coast-east': Region(Box(-71.5, -68, 25, 27), ADD_OCEAN),
+    'princess-martha-coast-center': Region(
+        Box(-70.5, -68, 16, 19), ADD_OCEAN
+    ),
+    'princess-martha-coast-west': Region(Box(-72, -70, -2.5, 2.5), ADD_OCEAN),
+}
+
+
+def from_dict(spec):
+    """Creates a Region from a dict (e.g. from a ScriptEngine recipe) with an
+    'action' and either a 'box' ([south, north, west, east]) or a 'polygon'
+    (list of [lat, lon] vertices)"""
+    try:
+        if 'box' in spec:
+            shape = Box(*spec['box'])
+        elif 'polygon' in spec:
+            lats, lons = np.asarray(spec['polygon'], dtype='float64').T
+            shape = Polygon(lats, lons)
+        else:
+            raise ValueError(f'Region without box or polygon: {spec}')
+        return Region(shape, dict(spec['action']))
+    except (KeyError, TypeError) as e:
+        raise ValueError(f'Invalid region definition {spec}: {e}')
+
+
+def _regions(names, regions):
+    """Looks up regions by name, Regions and dicts are used as given"""
+    try:
+        return [
+            name if isinstance(name, Region)
+            else from_dict(name) if isinstance(name, dict)
+            else regions[name]
+            for name in names
+        ]
+    except KeyError as e:
+        raise ValueError(f'Unknown region: {e.args[0]}')
+
+
+def edited_fields(names, regions=REGIONS):
+    """Returns the set of fields (shortNames) that are modified by the edits
+    of the named regions"""
+    return {key for region in _regions(names, regions)
+            for key in region.action}
+
+
+def required_fields(names, regions=REGIONS):
+    """Returns the set of fields (shortNames) that are read or modified by
+    the edits of the named regions"""
+    return edited_fields(names, regions) | {
+        region.shape.field for region in _regions(names, regions)
+        if isinstance(region.shape, Threshold)
+    }
+
+
+def compile_edits(names, lats, lons, fields=None, regions=REGIONS):
+    """Compiles the regions (names in the registry, Regions or dicts, see
+    from_dict) into a list of (indices, action) tuples, where indices are
+    the indices of the selected cells in the flattened lats and lons (cell
+    centers). 'fields' are needed for regions defined by conditions on other
+    fields."""
+    points = Points(lats, lons)
+    return [
+        (region.shape.indices(points, fields), region.action)
+        for region in _regions(names, regions)
+    ]
+
+
+def apply(fields, names, lats, lons, regions=REGIONS):
+    """Applies the actions of the regions to 'fields' (a dict of arrays,
+    keyed by shortName, with the shape of lats and lons). Returns a new dict
+    with modified copies of all fields that are changed by any action.
+    Selections of conditional regions are evaluated on the original
+    fields."""
+    compiled = compile_edits(names, lats, lons, fields, regions)
+    modified = dict(fields)
+    for name in {key for _, action in compiled for key in action}:
+        if name not in fields:
+            raise ValueError(f'Region edits need field {name}')
+        # Each edit is a single indexed assignment, in the order of the
+        # regions, so that later regions take precedence
+        values = np.array(fields[name], dtype='float64')
+        for indices, action in compiled:
+            if name in action:
+                values.flat[indices] = action[name]
+        modified[name] = values
+    return modified
@@ -0,0 +1,4 @@
+from .weights import RemapGrid, Weights
+from .conservative import conservative_weights, overlap_areas
+from .nearest import distance_weights, nearest_neighbour_weights
+from .apply import Remapper, load_weights
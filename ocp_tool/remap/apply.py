@@ -0,0 +1,110 @@
+"""Offline application of OASIS remapping weights
+
+Weight files (rmp_*.nc, as written by OASIS or ocp_tool.oasis.write_weights)
+are loaded once into a CSR sparse matrix with one row per destination cell.
+Loaded matrices are cached per file (and modification time), so that
+repeated remappings with the same weights do not re-read the file. Cached
+matrices are shared, hence their arrays are read-only.
+"""
+import os
+import functools
+
+import numpy as np
+from netCDF4 import Dataset
+from scipy.sparse import csr_matrix
+
+
+@functools.lru_cache(maxsize=16)
+def _load_matrix(filename, mtime):
+    with Dataset(filename) as nc:
+        src_size = nc.dimensions['src_grid_size'].size
+        dst_size = nc.dimensions['dst_grid_size'].size
+        # SCRIP addresses are one-based, only the first weight is used for
+        # first-order remapping
+        src_address = nc.variables['src_address'][:].data - 1
+        dst_address = nc.variables['dst_address'][:].data - 1
+        weights = nc.variables['remap_matrix'][:, 0].data
+        dst_dims = tuple(nc.variables['dst_grid_dims'][:].data)
+    matrix = csr_matrix(
+        (weights, (dst_address, src_address)), shape=(dst_size, src_size)
+    )
+    # Bring the matrix into canonical form before freezing it, so that no
+    # later operation needs to sort or sum its entries in place
+    matrix.sum_duplicates()
+    for array in (matrix.data, matrix.indices, matrix.indptr):
+        array.flags.writeable = False
+    return matrix, dst_dims
+
+
+def load_weights(filename):
+    """Returns the weights in 'filename' as a (destination size x source
+    size) CSR matrix, together with the destination grid dimensions in OASIS
+    (Fortran) order. The matrix is shared with other callers and read-only,
+    copy it before modifying it."""
+    filename = os.path.abspath(filename)
+    return _load_matrix(filename, os.stat(filename).st_mtime_ns)
+
+
+class Remapper:
+    """Applies the remapping weights from an OASIS weight file to fields on
+    the source grid. Fields can be given in any shape with one value per
+    source cell, and are returned as flat vectors on the destination grid."""
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.matrix, self.dst_dims = load_weights(filename)
+
+    @property
+    def src_size(self):
+        return self.matrix.shape[1]
+
+    @property
+    def dst_size(self):
+        return self.matrix.shape[0]
+
+    def remap(self, field):
+        """Remaps a single field."""
+        field = np.asarray(field, dtype='float64')
+        if field.size != self.src_size:
+            raise ValueError(
+                f'Field size {field.size} does not match the source grid '
+                f'size {self.src_size} of {self.filename}'
+            )
+        return self.matrix @ field.ravel()
+
+    def remap_batch(self, fields):
+        """Remaps a batch of fields, stacked along the first dimension, with
+        a single sparse-dense matrix product. Returns a (nfields, dst_size)
+        array."""
+        fields = np.asarray(fields, dtype='float64')
+        fields = fields.reshape(fields.shape[0], -1)
+        if fields.shape[1] != self.src_size:
+            raise ValueError(
+                f'Field size {fields.shape[1]} does not match the source '
+                f'grid size {self.src_size} of {self.filename}'
+            )
+        return (self.matrix @ fields.T).T
+
+    def conservation_error(self, fields, src_areas, dst_areas, result=None):
+        """Relative difference between the area integrals of the remapped and
+        the original field(s). The areas would normally come from the
+        cell_areas() methods of the source and destination grids. Only source
+        cells that are used by the weights (i.e. not masked) are included in
+        the source integral. If the remapped field(s) are not given in
+        'result', they are computed. For a batch of fields, one value per
+        field is returned. Fields with more than one dimension, of which the
+        trailing ones hold one value per source cell, are a batch (also with
+        a single field, e.g. of shape (1, src_size))."""
+        fields = np.asarray(fields, dtype='float64')
+        batch = fields.ndim > 1 \
+            and np.prod(fields.shape[1:], dtype='int64') == self.src_size
+        if result is None:
+            result = self.remap_batch(fields) if batch else self.remap(fields)
+        src_areas = np.where(
+            self.matrix.getnnz(axis=0) > 0, np.ravel(src_areas), 0
+        )
+        dst_areas = np.ravel(dst_areas)
+        src_integral = fields.reshape(-1, self.src_size) @ src_areas
+        dst_integral = np.reshape(result, (-1, self.dst_size)) @ dst_areas
+        error = (dst_integral-src_integral)/src_integral
+        return error if batch else error[0]
@@ -0,0 +1,176 @@
+"""First-order conservative remapping weights
+
+The overlap of every pair of source and destination cells is computed by
+exact clipping of the spherical cell polygons. Candidate pairs are found with
+a KD-tree over the cell centers, the clipping itself is vectorized over all
+candidate pairs of a chunk of destination cells, and chunks are distributed
+over a pool of worker processes.
+"""
+import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+from .. import spherical
+from .weights import RemapGrid, Weights
+
+
+# Overlaps smaller than this fraction of the destination cell area are
+# considered round-off and discarded
+_AREA_TOLERANCE = 1e-10
+
+_NORMALIZATIONS = ('fracarea', 'destarea', 'none')
+
+# Source grid data of the current (worker) process, see _init_source()
+_source = None
+
+
+def _init_source(polys, index):
+    """Sets up the source polygons and a KD-tree over their centers in the
+    current process. With the 'fork' start method, the arguments are
+    inherited by the workers without being pickled."""
+    global _source
+    centers, radii = spherical.centers(polys[index])
+    _source = dict(
+        polys=polys,
+        index=index,
+        centers=centers,
+        radii=radii,
+        max_radius=radii.max(initial=0),
+        tree=cKDTree(centers),
+    )
+
+
+def _chunk_overlaps(dst_index, dst_polys):
+    """Computes the overlaps of a chunk of destination cells with all source
+    cells. Returns destination and source addresses and the overlap areas."""
+    src = _source
+    dst_centers, dst_radii = spherical.centers(dst_polys)
+
+    candidates = src['tree'].query_ball_point(
+        dst_centers, r=dst_radii+src['max_radius'], return_sorted=False
+    )
+    lengths = np.fromiter(map(len, candidates), dtype=int)
+    if lengths.sum() == 0:
+        return (np.empty(0, dtype=int),)*2 + (np.empty(0),)
+    d = np.repeat(np.arange(len(dst_index)), lengths)
+    s = np.concatenate(candidates).astype(int)
+
+    # Prune candidates whose bounding circles do not intersect
+    distance = np.linalg.norm(dst_centers[d]-src['centers'][s], axis=-1)
+    close = distance <= dst_radii[d]+src['radii'][s]
+    d, s = d[close], s[close]
+
+    areas = spherical.intersection_areas(
+        src['polys'][src['index'][s]], dst_polys[d]
+    )
+
+    keep = areas > _AREA_TOLERANCE*spherical.polygon_areas(dst_polys)[d]
+    return dst_index[d[keep]], src['index'][s[keep]], areas[keep]
+
+
+def overlap_areas(src_polys, dst_polys, src_active=None, dst_active=None,
+                  workers=None, chunk_size=20000):
+    """Computes all non-zero overlaps between the (active) cells of two
+    polygon arrays as returned by ocp_tool.spherical.polygons(). Returns
+    three vectors: destination addresses, source addresses and overlap areas
+    (on the unit sphere). 'workers' is the number of processes to use
+    (default: all CPUs)."""
+    src_index = np.flatnonzero(
+        np.ones(len(src_polys), dtype=bool)
+        if src_active is None else src_active
+    )
+    dst_index = np.flatnonzero(
+        np.ones(len(dst_polys), dtype=bool)
+        if dst_active is None else dst_active
+    )
+    if src_index.size == 0 or dst_index.size == 0:
+        return (np.empty(0, dtype=int),)*2 + (np.empty(0),)
+
+    chunks = [
+        dst_index[i:i+chunk_size]
+        for i in range(0, dst_index.size, chunk_size)
+    ]
+    workers = min(workers or os.cpu_count() or 1, len(chunks))
+
+    if workers == 1:
+        _init_source(src_polys, src_index)
+        results = [_chunk_overlaps(c, dst_polys[c]) for c in chunks]
+    else:
+        context = multiprocessing.get_context(
+            'fork' if 'fork' in multiprocessing.get_all_start_methods()
+            else None
+        )
+        with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=context,
+                initializer=_init_source,
+                initargs=(src_polys, src_index),
+             ) as pool:
+            results = list(
+                pool.map(
+                    _chunk_overlaps, chunks, (dst_polys[c] for c in chunks)
+                )
+            )
+
+    return tuple(np.concatenate(r) for r in zip(*results))
+
+
+def conservative_weights(
+    src_grid, dst_grid, *,
+    src_mask=None, dst_mask=None,
+    src_subgrid=None, dst_subgrid=None,
+    normalization='fracarea',
+    workers=None, chunk_size=20000,
+):
+    """Computes first-order conservative remapping weights between two grids
+    (any grid object from ocp_tool.grids). Masks follow the OASIS convention
+    (1 is masked) and default to the grids' cell_masks(), if available.
+    Subgrids (e.g. 'u' for ORCA) are passed on to the grid methods.
+
+    The normalization options correspond to SCRIP/OASIS:
+        fracarea - weights are divided by the unmasked overlap area of the
+                   destination cell
+        destarea - weights are divided by the destination cell area
+        none     - weights are the overlap areas (on the unit sphere)
+    """
+    if normalization not in _NORMALIZATIONS:
+        raise ValueError(f'Invalid normalization: {normalization}')
+
+    src = RemapGrid(src_grid, mask=src_mask, subgrid=src_subgrid)
+    dst = RemapGrid(dst_grid, mask=dst_mask, subgrid=dst_subgrid)
+
+    src_polys = spherical.polygons(src.corners)
+    dst_polys = spherical.polygons(dst.corners)
+    src_area = spherical.polygon_areas(src_polys)
+    dst_area = spherical.polygon_areas(dst_polys)
+
+    dst_address, src_address, areas = overlap_areas(
+        src_polys, dst_polys,
+        src_active=spherical.valid_corners(src.corners) & (src.mask == 0),
+        dst_active=spherical.valid_corners(dst.corners) & (dst.mask == 0),
+        workers=workers,
+        chunk_size=chunk_size,
+    )
+
+    src_overlap = np.bincount(src_address, areas, minlength=src.size)
+    dst_overlap = np.bincount(dst_address, areas, minlength=dst.size)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        src_frac = np.where(src_area > 0, src_overlap/src_area, 0)
+        dst_frac = np.where(dst_area > 0, dst_overlap/dst_area, 0)
+
+    if normalization == 'fracarea':
+        weights = areas/dst_overlap[dst_address]
+    elif normalization == 'destarea':
+        weights = areas/dst_area[dst_address]
+    else:
+        weights = areas
+
+    return Weights(
+        'CONSERV', src, dst, src_address, dst_address, weights,
+        normalization=normalization,
+        src_area=src_area, dst_area=dst_area,
+        src_frac=src_frac, dst_frac=dst_frac,
+    )
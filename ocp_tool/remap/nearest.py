@@ -0,0 +1,91 @@
+"""Nearest-neighbour and distance-weighted remapping weights
+
+Cell centers are placed on the unit sphere as 3-D Cartesian vectors and
+indexed with a KD-tree, in which the Euclidean (chord) distance is a
+monotonic function of the great circle distance. All destination points are
+queried in one call, which is parallelized by the KD-tree itself.
+"""
+import numpy as np
+from scipy.spatial import cKDTree
+
+from .. import spherical
+from .weights import RemapGrid, Weights
+
+
+# Destination points closer than this angle (radians) to a source point get
+# the value of that point only
+_COINCIDENCE = 1e-10
+
+
+def distance_weights(
+    src_grid, dst_grid, *,
+    nneighbours=4,
+    src_mask=None, dst_mask=None,
+    src_subgrid=None, dst_subgrid=None,
+    workers=-1,
+):
+    """Computes inverse distance weights of the 'nneighbours' nearest
+    unmasked source cells for every unmasked destination cell, as in the
+    OASIS DISTWGT method. Masks follow the OASIS convention (1 is masked) and
+    default to the grids' cell_masks(), if available. For OpenIFS grids, the
+    masks would typically be derived from the GRIB 'lsm' field.
+    'workers' is passed to the KD-tree query (-1 uses all CPUs)."""
+    if nneighbours < 1:
+        raise ValueError(f'Invalid number of neighbours: {nneighbours}')
+
+    src = RemapGrid(
+        src_grid, mask=src_mask, subgrid=src_subgrid, corners=False
+    )
+    dst = RemapGrid(
+        dst_grid, mask=dst_mask, subgrid=dst_subgrid, corners=False
+    )
+
+    src_index = np.flatnonzero(src.mask == 0)
+    dst_index = np.flatnonzero(dst.mask == 0)
+    nneighbours = min(nneighbours, src_index.size)
+    if nneighbours == 0 or dst_index.size == 0:
+        return Weights('DISTWGT', src, dst, [], [], [])
+
+    tree = cKDTree(spherical.to_xyz(src.lats[src_index], src.lons[src_index]))
+    chords, neighbours = tree.query(
+        spherical.to_xyz(dst.lats[dst_index], dst.lons[dst_index]),
+        k=nneighbours,
+        workers=workers,
+    )
+    chords = chords.reshape(dst_index.size, nneighbours)
+    neighbours = neighbours.reshape(dst_index.size, nneighbours)
+
+    angles = 2*np.arcsin(np.minimum(chords/2, 1))
+    with np.errstate(divide='ignore'):
+        weights = 1/angles
+    coincident = angles[:, 0] < _COINCIDENCE
+    weights[coincident, 0] = 1
+    weights[coincident, 1:] = 0
+    weights /= weights.sum(axis=1, keepdims=True)
+
+    link = weights > 0
+    return Weights(
+        'DISTWGT', src, dst,
+        src_address=src_index[neighbours[link]],
+        dst_address=np.repeat(dst_index, nneighbours).reshape(
+            dst_index.size, nneighbours
+        )[link],
+        weights=weights[link],
+    )
+
+
+def nearest_neighbour_weights(
+    src_grid, dst_grid, *,
+    src_mask=None, dst_mask=None,
+    src_subgrid=None, dst_subgrid=None,
+    workers=-1,
+):
+    """Computes nearest-neighbour remapping weights, i.e. distance weights
+    with a single neighbour (OASIS DISTWGT with 1 neighbour)."""
+    return distance_weights(
+        src_grid, dst_grid,
+        nneighbours=1,
+        src_mask=src_mask, dst_mask=dst_mask,
+        src_subgrid=src_subgrid, dst_subgrid=dst_subgrid,
+        workers=workers,
+    )
@@ -0,0 +1,71 @@
+import numpy as np
+
+
+class RemapGrid:
+    """Flattened view of a grid as needed for remapping: cell centers, masks
+    and (optionally) corners, one value per cell, together with the grid
+    dimensions in OASIS (Fortran) order. The mask follows the OASIS
+    convention, i.e. 1 means masked. If no mask is given, the grid's
+    cell_masks() method is used if it exists, otherwise nothing is masked."""
+
+    def __init__(self, grid, mask=None, subgrid=None, corners=True):
+        kwargs = {} if subgrid is None else {'subgrid': subgrid}
+
+        lats = np.asarray(grid.cell_latitudes(**kwargs))
+        self.shape = lats.shape
+        self.dims = (1, lats.size) if lats.ndim == 1 else lats.shape[::-1]
+        self.lats = lats.ravel()
+        self.lons = np.asarray(grid.cell_longitudes(**kwargs)).ravel()
+
+        if mask is None and hasattr(grid, 'cell_masks'):
+            mask = grid.cell_masks(**kwargs)
+        if mask is None:
+            self.mask = np.zeros(self.size, dtype='int32')
+        else:
+            self.mask = np.asarray(mask, dtype='int32').ravel()
+            if self.mask.size != self.size:
+                raise ValueError('Mask size does not match grid size')
+
+        if corners:
+            crn = np.asarray(grid.cell_corners(**kwargs))
+            self.corners = crn.reshape(2, crn.shape[1], self.size)
+        else:
+            self.corners = None
+
+    @property
+    def size(self):
+        return self.lats.size
+
+
+class Weights:
+    """Sparse remapping weights in SCRIP/OASIS form: each link connects a
+    (zero-based) source cell address to a destination cell address with a
+    weight, such that dst[dst_address] += weight*src[src_address]."""
+
+    map_methods = {
+        'CONSERV': 'Conservative remapping',
+        'DISTWGT': 'Distance weighted avg of nearest neighbors',
+    }
+
+    def __init__(
+        self, method, src, dst, src_address, dst_address, weights,
+        normalization=None,
+        src_area=None, dst_area=None, src_frac=None, dst_frac=None,
+    ):
+        if method not in self.map_methods:
+            raise ValueError(f'Invalid remapping method: {method}')
+        self.method = method
+        self.normalization = normalization
+        self.src = src
+        self.dst = dst
+        self.src_address = np.asarray(src_address, dtype='int64')
+        self.dst_address = np.asarray(dst_address, dtype='int64')
+        self.weights = np.asarray(weights, dtype='float64')
+        self.src_area = src_area
+        self.dst_area = dst_area
+        self.src_frac = src_frac
+        self.dst_frac = dst_frac
+
+    @property
+    def num_links(self):
+        return self.weights.size
@@ -0,0 +1,127 @@
+"""Editing of the runoff-mapper drainage basins, arrival points and masks
+
+When a basin is removed from the OpenIFS land-sea mask (see ocp_tool.regions),
+the runoff mapper has to drain it as well: the cells of the basin that do not
+belong to any drainage basin (id -2) are assigned a new basin id, and arrival
+points for that basin are added elsewhere, to close the global water budget.
+The boxes of the removed basins are shared with the land-sea mask edits in
+ocp_tool.regions, the additional arrival-point boxes are defined below.
+
+The runoff map (runoff_maps.nc) and the OASIS masks of the runoff mapper are
+regular in latitude and longitude, hence each box is a rectangular block of
+the 2-D fields. Only these blocks are read from and written to the files.
+"""
+from collections import namedtuple
+
+import numpy as np
+from netCDF4 import Dataset
+
+from .regions import Box, REGIONS
+
+
+# Runoff edits of a removed basin: the new drainage basin id, a list of
+# (Box, basin id) tuples for additional arrival points and whether the basin
+# becomes ocean in the runoff-mapper masks
+RunoffEdit = namedtuple('RunoffEdit', 'basin_id arrival_points mask_edit')
+
+# Taken from the original ocp-tool.py (modify_runoff_map, modify_runoff_lsm)
+RUNOFF_EDITS = {
+    'caspian-sea': RunoffEdit(
+        18,
+        # Artificial arrival points in the Amazon discharge area
+        [(Box(1, 2, 313, 314.5), 18)],
+        True,
+    ),
+    'black-sea': RunoffEdit(
+        23,
+        [(Box(38.5, 41, 25, 26.5), 23), (Box(38.5, 41, 23.5, 25), 28)],
+        False,
+    ),
+}
+
+
+def _block(box, lats, lons):
+    """Returns the (rows, columns) slices of the smallest block that contains
+    the box and the boolean mask of the box within that block, or None if
+    the box contains no cells"""
+    in_lats, in_lons = box.axes(lats, lons)
+    if not (in_lats.any() and in_lons.any()):
+        return None
+    rows = np.flatnonzero(in_lats)
+    cols = np.flatnonzero(in_lons)
+    rows = slice(rows[0], rows[-1]+1)
+    cols = slice(cols[0], cols[-1]+1)
+    return rows, cols, np.outer(in_lats[rows], in_lons[cols])
+
+
+def reassign_basin(drainage, arrival, mask, basin_id):
+    """Assigns cells in 'mask' without drainage basin (id -2) to basin_id,
+    these cells are no arrival points"""
+    cells = mask & (drainage == -2)
+    drainage[cells] = basin_id
+    arrival[cells] = -1
+
+
+def add_arrival_points(arrival, mask, basin_id):
+    """Makes all cells in 'mask' that can be arrival points (id not -1)
+    arrival points of basin_id"""
+    arrival[mask & (arrival != -1)] = basin_id
+
+
+def edit_maps(filename, basins, edits=RUNOFF_EDITS, regions=REGIONS):
+    """Edits the drainage_basin_id and arrival_point_id fields in a runoff
+    map file (in place) for the removed basins. Basins without runoff edits
+    are ignored."""
+    with Dataset(filename, 'r+') as nc:
+        nc.set_auto_mask(False)
+        lats = nc.variables['lat'][:]
+        lons = nc.variables['lon'][:]
+        drainage = nc.variables['drainage_basin_id']
+        arrival = nc.variables['arrival_point_id']
+
+        for basin in basins:
+            if basin not in edits:
+                continue
+            edit = edits[basin]
+            block = _block(regions[basin].shape, lats, lons)
+            if block is not None:
+                rows, cols, mask = block
+                drainage_block = drainage[rows, cols]
+                arrival_block = arrival[rows, cols]
+                reassign_basin(
+                    drainage_block, arrival_block, mask, edit.basin_id
+                )
+                drainage[rows, cols] = drainage_block
+                arrival[rows, cols] = arrival_block
+            for box, basin_id in edit.arrival_points:
+                block = _block(box, lats, lons)
+                if block is not None:
+                    rows, cols, mask = block
+                    arrival_block = arrival[rows, cols]
+                    add_arrival_points(arrival_block, mask, basin_id)
+                    arrival[rows, cols] = arrival_block
+
+
+def edit_masks(filename, basins, lats, lons, atm_name='RnfA',
+               ocean_name='RnfO', edits=RUNOFF_EDITS, regions=REGIONS):
+    """Edits the runoff-mapper masks in an OASIS masks file (in place): the
+    cells of removed basins are set to 0 in the atmosphere mask and to 1 in
+    the ocean mask (for basins with mask_edit). lats and lons are the
+    coordinate vectors of the (regular) runoff-mapper grid."""
+    with Dataset(filename, 'r+') as nc:
+        nc.set_auto_mask(False)
+        atm_mask = nc.variables[f'{atm_name}.msk']
+        ocean_mask = nc.variables[f'{ocean_name}.msk']
+        for basin in basins:
+            if basin not in edits or not edits[basin].mask_edit:
+                continue
+            block = _block(regions[basin].shape, lats, lons)
+            if block is None:
+                continue
+            rows, cols, mask = block
+            atm_block = atm_mask[rows, cols]
+            ocean_block = ocean_mask[rows, cols]
+            atm_block[mask] = 0
+            ocean_block[mask] = 1
+            atm_mask[rows, cols] = atm_block
+            ocean_mask[rows, cols] = ocean_block
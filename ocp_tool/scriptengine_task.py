@@ -1,10 +1,12 @@
 import logging
-import numpy as np
+import os
+import time
 
 import ocp_tool as ocpt
-import ocp_tool.grids
-import ocp_tool.grib
+import ocp_tool.diagnostics
+import ocp_tool.instrument
 import ocp_tool.oasis
+import ocp_tool.pipeline
 
 try:
     from scriptengine.tasks.core import Task, timed_runner
@@ -28,230 +30,236 @@ else:
             OCPTool.check_arguments(arguments)
             super().__init__(arguments)
 
+        def _per_resolution(self, name, context, nres, default=None):
+            """Returns a list with one value of argument 'name' for each of
+            'nres' OIFS resolutions. Scalar values are used for all."""
+            value = self.getarg(name, context, default=default)
+            if not isinstance(value, (list, tuple)):
+                return [value]*nres
+            if len(value) != nres:
+                self.log_error(
+                    f'Argument "{name}" must have one value per OIFS '
+                    f'grid type ({nres})'
+                )
+                raise ScriptEngineTaskRunError
+            return list(value)
+
         @timed_runner
         def run(self, context):
 
-            # OASIS grid name:
-            # <component><component_spec_1><component_spec_2><component_spec_3>
-            #
-            #   where component is:
-            #       I - OpenIFS
-            #       N - NEMO/SI3
-            #       R - Runoff-mapper
-            #       A - AMIP Forcing reader
-            #
-            # OpenIFS component spec:
-            # <grid_type><mask_type><resolution>
-            #   where grid_type is:
-            #       L - linear (TL) grid
-            #       C - cubic octahedral (Tco) grid
-            #   and mask_type is:
-            #       A - all atmosphere, nothing masked
-            #       L - land, ocean is masked
-            #       O - ocean, land is masked
-            #   and resolution is:
-            #       l - very low resolution
-            #       L - low resolution
-            #       M - medium (standard) resolution
-            #       H - high resolution
-            #       h - very high resolution
-            #       x - extremely high resolution
-            #
-            # NEMO componen spec:
-            #   <extend><subgrid><resolution>
-            #       where extend is
-            #           O - standard ORCA grids
-            #           E - extended eORCA grids
-            #       and subgrid is
-            #           T, U, V - t, u, v staggered subgrids
-            #       and resolution is
-            #           L - low resolution (ORCA2)
-            #           M - medium (standard) resolution (ORCA1)
-            #           H - high resolution (ORCA025)
-            #           h - very high resolution (ORCA012)
-            #           x - extremely high resolution (ORCA036)
+            workers = self.getarg('workers', context, default=None)
+            output_dir = self.getarg('output_dir', context, default=None)
 
-            oasis_grid_names = {
-                'TCO199': 'ICH',  # 2nd character to be inserted later
-                'TCO159': 'ICM',
-                'TL255': 'ILM',
-                'TCO95': 'ICL',
-                'TL159': 'ILL',
-                'TQ21': 'IQx',
-                'ORCA1L75t': 'NOTM',
-                'ORCA1L75u': 'NOUM',
-                'ORCA1L75v': 'NOVM',
-                'rnfm-atm': 'RNFA',
-                'amipfr': 'AMIP',
-            }
+            # In batch mode, oifs_grid_type is a list and each OIFS
+            # resolution is written to its own subdirectory of output_dir.
+            # The other components are built once and written to all.
+            oifs_grid_types = self.getarg('oifs_grid_type', context)
+            batch = isinstance(oifs_grid_types, (list, tuple))
+            if not batch:
+                oifs_grid_types = [oifs_grid_types]
+            nres = len(oifs_grid_types)
 
-            # Construct final name for atm grid in OASIS
-            def oifs_oasis_grid_name(grid_type, specifier):
-                return oasis_grid_names[grid_type][0] \
-                       + specifier + oasis_grid_names[grid_type][1:]
+            oifs_output_dirs = [
+                os.path.join(output_dir or '', grid_type) if batch
+                else output_dir
+                for grid_type in oifs_grid_types
+            ]
+            all_output_dirs = list(dict.fromkeys(oifs_output_dirs))
 
-            # OpenIFS grid(s)
-            oifs_grid_type = self.getarg('oifs_grid_type', context)
-            try:
-                oifs_grid = ocpt.grids.factory(oifs_grid_type)
-            except NotImplementedError:
-                self.log_error(
-                    'Invalid OIFS grid type: '
-                    f'{self.getarg("oifs_grid_type", context)}'
-                )
-                raise ScriptEngineTaskRunError
-            self.log_debug('Write OIFS grids to grids.nc')
-            ocpt.oasis.write_grid(
-                name=oifs_oasis_grid_name(oifs_grid_type, 'L'),
-                lats=oifs_grid.cell_latitudes(),
-                lons=oifs_grid.cell_longitudes(),
-                corners=oifs_grid.cell_corners(),
-                append=False
-            )
-            ocpt.oasis.write_grid(
-                name=oifs_oasis_grid_name(oifs_grid_type, 'O'),
-                lats=oifs_grid.cell_latitudes(),
-                lons=oifs_grid.cell_longitudes(),
-                corners=oifs_grid.cell_corners()
+            oifs_mask_files = self._per_resolution(
+                'oifs_mask_file', context, nres
             )
-            self.log_debug('Write OIFS areas to areas.nc')
-            self.log_debug(
-                f'OIFS grid area: {oifs_grid.cell_areas().sum():12.8e}'
+            oifs_mask_sources = self._per_resolution(
+                'oifs_mask_source', context, nres, default='grib'
             )
-            ocpt.oasis.write_area(
-                name=oifs_oasis_grid_name(oifs_grid_type, 'L'),
-                areas=oifs_grid.cell_areas(),
-                append=False
-            )
-            ocpt.oasis.write_area(
-                name=oifs_oasis_grid_name(oifs_grid_type, 'O'),
-                areas=oifs_grid.cell_areas()
-            )
-
-            oifs_mask_file = self.getarg('oifs_mask_file', context)
-            try:
-                oifs_masks = ocpt.grib.read(oifs_mask_file, ('lsm', 'cl'))
-            except (FileNotFoundError, PermissionError):
-                self.log_error(
-                    f'Could not open OIFS mask file "{oifs_mask_file}"'
+            oifs_modified_mask_files = [
+                # In batch mode, plain modified mask file names are placed
+                # in the resolution's output directory
+                os.path.join(out, name)
+                if batch and name is not None and not os.path.dirname(name)
+                else name
+                for out, name in zip(
+                    oifs_output_dirs,
+                    self._per_resolution(
+                        'oifs_modified_mask_file', context, nres
+                    )
                 )
-                raise ScriptEngineTaskRunError
-            oifs_lsm = np.where(
-                np.logical_or(
-                    oifs_masks['lsm'] > 0.5, oifs_masks['cl'] > 0.5
-                ), 0, 1
+            ]
+            # Regions to edit in the land-sea mask and soil type of all OIFS
+            # resolutions: names from the ocp_tool.regions registry or dicts
+            # with a box or polygon and an action (see regions.from_dict)
+            oifs_region_edits = self.getarg(
+                'oifs_region_edits', context, default=None
+            )
+            oifs_fill_inland_basins = self.getarg(
+                'oifs_fill_inland_basins', context, default=False
             )
-            self.log_debug('Write OIFS masks to masks.nc')
-            ocpt.oasis.write_mask(
-                name=oifs_oasis_grid_name(oifs_grid_type, 'L'),
-                masks=oifs_lsm,
-                append=False
+            nemo_grid_file = self.getarg(
+                'nemo_grid_file', context, default=None
             )
-            ocpt.oasis.write_mask(
-                name=oifs_oasis_grid_name(oifs_grid_type, 'O'),
-                masks=1-oifs_lsm
+            nemo_mask_file = self.getarg(
+                'nemo_mask_file', context, default=None
             )
 
-            # NEMO grid
-            nemo_grid_file = self.getarg('nemo_grid_file', context, default=None)
-            nemo_mask_file = self.getarg('nemo_mask_file', context, default=None)
-            if nemo_grid_file is not None:
-                try:
-                    nemo_grid = ocpt.grids.factory(
-                        'ORCA', nemo_grid_file, nemo_mask_file
+            # Each component builds its grids and masks independently, see
+            # ocp_tool.pipeline for the OASIS grid naming. Targets are the
+            # output directories for the products of each component.
+            components = {}
+            targets = {}
+            for grid_type, mask_file, mask_source, modified_mask_file, \
+                    out in zip(
+                        oifs_grid_types,
+                        oifs_mask_files,
+                        oifs_mask_sources,
+                        oifs_modified_mask_files,
+                        oifs_output_dirs,
+                    ):
+                label = f'OIFS {grid_type}' if batch else 'OIFS'
+                components[label] = (
+                    ocpt.pipeline.oifs,
+                    dict(
+                        grid_type=grid_type,
+                        mask_file=mask_file,
+                        mask_source=mask_source,
+                        nemo_grid_file=nemo_grid_file,
+                        nemo_mask_file=nemo_mask_file,
+                        modified_mask_file=modified_mask_file,
+                        region_edits=oifs_region_edits,
+                        fill_inland_basins=oifs_fill_inland_basins,
                     )
-                except (FileNotFoundError, PermissionError):
-                    self.log_error(
-                        f'Could not open NEMO grid file "{nemo_grid_file}"'
-                    )
-                    raise ScriptEngineTaskRunError
-                self.log_debug('Write NEMO grids, areas, masks')
-                self.log_debug(
-                    'NEMO t-grid area: '
-                    f'{nemo_grid.cell_areas(subgrid="t").sum():12.8e}'
-                )
-                self.log_debug(
-                    'NEMO u-grid area: '
-                    f'{nemo_grid.cell_areas(subgrid="u").sum():12.8e}'
                 )
-                self.log_debug(
-                    'NEMO v-grid area: '
-                    f'{nemo_grid.cell_areas(subgrid="v").sum():12.8e}'
+                targets[label] = [out]
+
+            if nemo_grid_file is not None:
+                components['NEMO'] = (
+                    ocpt.pipeline.nemo,
+                    dict(grid_file=nemo_grid_file, mask_file=nemo_mask_file)
                 )
-                for subgrid in ('t', 'u', 'v'):
-                    ocpt.oasis.write_grid(
-                        name=oasis_grid_names[nemo_grid.name+subgrid],
-                        lats=nemo_grid.cell_latitudes(subgrid=subgrid),
-                        lons=nemo_grid.cell_longitudes(subgrid=subgrid),
-                        corners=nemo_grid.cell_corners(subgrid=subgrid)
-                    )
-                    ocpt.oasis.write_area(
-                        name=oasis_grid_names[nemo_grid.name+subgrid],
-                        areas=nemo_grid.cell_areas(subgrid=subgrid)
-                    )
-                    ocpt.oasis.write_mask(
-                        name=oasis_grid_names[nemo_grid.name+subgrid],
-                        masks=nemo_grid.cell_masks(subgrid=subgrid)
-                    )
+                targets['NEMO'] = all_output_dirs
 
-            # Runoff-mapper grid
-            rnfm_grid = ocpt.grids.factory('F128')
-            self.log_debug('Write RNFM grid to grids.nc')
-            ocpt.oasis.write_grid(
-                name=oasis_grid_names['rnfm-atm'],
-                lats=rnfm_grid.cell_latitudes(),
-                lons=rnfm_grid.cell_longitudes(),
-                corners=rnfm_grid.cell_corners()
-            )
-            self.log_debug('Write RNFM areas to areas.nc')
-            self.log_debug(
-                f'RNFM grid area: {rnfm_grid.cell_areas().sum():12.8e}'
-            )
-            ocpt.oasis.write_area(
-                name=oasis_grid_names['rnfm-atm'],
-                areas=rnfm_grid.cell_areas()
-            )
-            self.log_debug('Write RNFM mask to masks.nc')
             if self.getarg('rnfm_mask_file', context, default=None):
                 self.log_error(
                     'Reading the RNFM mask from file is not implemented yet'
                 )
                 raise ScriptEngineTaskRunError
-            else:
-                ocpt.oasis.write_mask(
-                    name=oasis_grid_names['rnfm-atm'],
-                    masks=np.zeros((rnfm_grid.nlons, rnfm_grid.nlats))
-                )
+            components['RNFM'] = (ocpt.pipeline.rnfm, {})
+            targets['RNFM'] = all_output_dirs
 
-            # AMIP Forcing-reader grid
-            amipfr_grid = ocpt.grids.factory(
-                'regular_latlon',
-                nlats=180,
-                nlons=360
-            )
-            self.log_debug('Write AMIP-FR grid to grids.nc')
-            ocpt.oasis.write_grid(
-                name=oasis_grid_names['amipfr'],
-                lats=amipfr_grid.cell_latitudes(),
-                lons=amipfr_grid.cell_longitudes(),
-                corners=amipfr_grid.cell_corners()
-            )
-            self.log_debug('Write AMIP-FR areas to areas.nc')
-            self.log_debug(
-                f'AMIP-FR grid area: {amipfr_grid.cell_areas().sum():12.8e}'
-            )
-            ocpt.oasis.write_area(
-                name=oasis_grid_names['amipfr'],
-                areas=amipfr_grid.cell_areas()
-            )
-            self.log_debug('Write AMIP-FR mask to masks.nc')
             if self.getarg('amipfr_mask_file', context, default=None):
                 self.log_error(
                     'Reading the AMIP-FR mask from file is not implemented yet'
                 )
                 raise ScriptEngineTaskRunError
-            else:
-                ocpt.oasis.write_mask(
-                    name=oasis_grid_names['amipfr'],
-                    masks=np.zeros((amipfr_grid.nlats, amipfr_grid.nlons))
-                )
+            components['AMIP-FR'] = (ocpt.pipeline.amipfr, {})
+            targets['AMIP-FR'] = all_output_dirs
+
+            # Components run in a pool of 'workers' processes, the OIFS
+            # components share the remaining CPUs for the NEMO overlaps
+            oifs_workers = ocpt.pipeline.component_workers(
+                workers, len(components)
+            )
+            for func, kwargs in components.values():
+                if func is ocpt.pipeline.oifs:
+                    kwargs['workers'] = oifs_workers
+
+            for out in all_output_dirs:
+                if out:
+                    os.makedirs(out, exist_ok=True)
+                ocpt.pipeline.create_files(out)
+
+            # Cell areas from the grids ('grid') or from the spherical
+            # polygons of the cell corners ('corners'), consistent with
+            # conservative remapping
+            area_source = self.getarg('area_source', context, default='grid')
+            if area_source not in ('grid', 'corners'):
+                self.log_error(f'Invalid area source: {area_source}')
+                raise ScriptEngineTaskRunError
+
+            # Optional mask images, rendered in background processes once
+            # the products of a component have been written
+            plot_dir = self.getarg('plot_dir', context, default=None)
+            if plot_dir:
+                os.makedirs(plot_dir, exist_ok=True)
+            plots = {}
+            recorder = ocpt.instrument.Recorder()
+            try:
+                for label, products, elapsed, records in ocpt.pipeline.build(
+                        components, workers
+                ):
+                    self.log_info(f'{label} grids built in {elapsed:.2f} s')
+                    recorder.extend(records)
+                    start = time.perf_counter()
+                    writer = ocpt.instrument.Recorder(label)
+                    for product in products:
+                        if area_source == 'corners':
+                            areas = writer.call(
+                                f'oasis.polygon_areas({product.name})',
+                                ocpt.oasis.polygon_areas,
+                                product.corners,
+                                product.areas,
+                            )
+                            difference = ocpt.oasis.area_difference(
+                                areas, product.areas
+                            )
+                            self.log_info(
+                                f'{product.name} polygon areas, relative '
+                                'difference from grid areas: '
+                                f'max {difference.max:.2e}, '
+                                f'mean {difference.mean:.2e}, '
+                                f'total {difference.total:.2e}'
+                            )
+                            product = product._replace(areas=areas)
+                        self.log_debug(
+                            f'Write {product.name} grid, areas and masks '
+                            f'(grid area: {product.areas.sum():12.8e})'
+                        )
+                        for out in targets[label]:
+                            ocpt.pipeline.write(
+                                product, path=out, recorder=writer
+                            )
+                    recorder.extend(writer.records)
+                    if plot_dir:
+                        for product in products:
+                            plot = os.path.join(
+                                plot_dir, f'{product.name}.png'
+                            )
+                            plots[plot] = ocpt.diagnostics.in_background(
+                                ocpt.diagnostics.plot_fields,
+                                plot,
+                                product.lats,
+                                product.lons,
+                                [product.masks],
+                                categorical=True,
+                            )
+                    self.log_info(
+                        f'{label} grids written in '
+                        f'{time.perf_counter()-start:.2f} s'
+                    )
+            except ocpt.pipeline.ComponentError as e:
+                self.log_error(str(e))
+                raise ScriptEngineTaskRunError
+            finally:
+                for process in plots.values():
+                    process.join()
+            failed = [
+                plot for plot, process in plots.items()
+                if process.exitcode != 0
+            ]
+            if failed:
+                self.log_error(f'Mask plots failed: {", ".join(failed)}')
+                raise ScriptEngineTaskRunError
+
+            # Instrumentation report: optionally written to a JSON file next
+            # to the OASIS files and/or into the context
+            timing_report = self.getarg(
+                'timing_report', context, default=None
+            )
+            if timing_report:
+                timing_report = os.path.join(output_dir or '', timing_report)
+                self.log_debug(f'Write timing report to {timing_report}')
+                recorder.write(timing_report)
+            timing_context = self.getarg(
+                'timing_context', context, default=None
+            )
+            if timing_context:
+                return {timing_context: recorder.report()}
@@ -0,0 +1,210 @@
+"""Vectorized geometry of cells on the unit sphere
+
+Grid cells are handled as convex spherical polygons, given as arrays of
+Cartesian unit vectors with shape (ncells, nvertices, 3). Edges are great
+circle arcs between consecutive vertices. Where polygons have a varying
+number of vertices, a separate vector of vertex counts is used.
+
+Note that cell edges along latitude circles (as in Gaussian and regular
+lat-lon grids) are approximated by great circle arcs, which is exact for
+the meridional edges and converges with resolution for the zonal edges.
+"""
+import numpy as np
+
+
+def to_xyz(lats, lons):
+    """Converts latitudes and longitudes (in degrees) to Cartesian unit
+    vectors. The returned array has an additional last dimension of size 3."""
+    lats = np.radians(lats)
+    lons = np.radians(lons)
+    cos_lats = np.cos(lats)
+    return np.stack(
+        (cos_lats*np.cos(lons), cos_lats*np.sin(lons), np.sin(lats)),
+        axis=-1
+    )
+
+
+def to_latlon(xyz):
+    """Converts Cartesian vectors (last dimension of size 3) to latitudes and
+    longitudes in degrees, longitudes in [0, 360)."""
+    x, y, z = xyz[..., 0], xyz[..., 1], xyz[..., 2]
+    lats = np.degrees(np.arctan2(z, np.hypot(x, y)))
+    lons = np.degrees(np.arctan2(y, x)) % 360
+    return lats, lons
+
+
+def valid_corners(corners):
+    """Returns a boolean vector, one value per cell, that is False for cells
+    with undefined corners (such as the fill values in ORCA.cell_corners)."""
+    lats = corners[0].reshape(corners.shape[1], -1)
+    return np.all(np.abs(lats) <= 90, axis=0)
+
+
+def polygons(corners):
+    """Converts the output of any grid's cell_corners() method, i.e. an array
+    of shape (2, ncorners, *gridshape) with latitudes and longitudes, into a
+    flat (ncells, ncorners, 3) polygon array with counter-clockwise vertex
+    order. Cells with undefined corners are returned with all vertices at the
+    same (arbitrary) point, i.e. as polygons of zero area."""
+    ncorners = corners.shape[1]
+    lats = corners[0].reshape(ncorners, -1).T
+    lons = corners[1].reshape(ncorners, -1).T
+    invalid = ~valid_corners(corners)
+    lats = np.where(invalid[:, np.newaxis], 0, lats)
+    lons = np.where(invalid[:, np.newaxis], 0, lons)
+    polys = to_xyz(lats, lons)
+    clockwise = _signed_areas(polys) < 0
+    polys[clockwise] = polys[clockwise, ::-1]
+    return polys
+
+
+def _signed_areas(polys, counts=None):
+    """Spherical excess of polygons by fan triangulation around the first
+    vertex. Each triangle contributes its excess computed with the formula
+    of Van Oosterom and Strackee, which is positive for counter-clockwise
+    triangles. Vertices beyond 'counts' are ignored."""
+    a = polys[:, :1, :]
+    b = polys[:, 1:-1, :]
+    c = polys[:, 2:, :]
+    numer = np.einsum('...i,...i', a, np.cross(b, c))
+    denom = 1 \
+        + np.einsum('...i,...i', a, b) \
+        + np.einsum('...i,...i', b, c) \
+        + np.einsum('...i,...i', c, a)
+    excess = 2*np.arctan2(numer, denom)
+    if counts is not None:
+        excess[np.arange(2, polys.shape[1]) >= counts[:, np.newaxis]] = 0
+    return excess.sum(axis=1)
+
+
+def polygon_areas(polys, counts=None):
+    """Areas of spherical polygons on the unit sphere (in steradians)."""
+    return np.abs(_signed_areas(polys, counts))
+
+
+def corner_areas(corners, chunk_size=1 << 16):
+    """Areas (in steradians) of the cells given by the output of any grid's
+    cell_corners() method, as spherical polygons with great circle edges.
+    The excess of the fan triangles is computed as in _signed_areas, but on
+    separate coordinate arrays, in chunks of 'chunk_size' cells that fit
+    into the CPU cache. Returns an array with the shape of the grid, NaN for
+    cells with undefined corners."""
+    ncorners = corners.shape[1]
+    lats = np.radians(corners[0].reshape(ncorners, -1))
+    lons = np.radians(corners[1].reshape(ncorners, -1))
+    areas = np.empty(lats.shape[1])
+    for start in range(0, areas.size, chunk_size):
+        chunk = slice(start, start+chunk_size)
+        cos_lats = np.cos(lats[:, chunk])
+        x = cos_lats * np.cos(lons[:, chunk])
+        y = cos_lats * np.sin(lons[:, chunk])
+        z = np.sin(lats[:, chunk])
+        ax, ay, az = x[0], y[0], z[0]
+        excess = np.zeros(x.shape[1])
+        for k in range(1, ncorners-1):
+            bx, by, bz = x[k], y[k], z[k]
+            cx, cy, cz = x[k+1], y[k+1], z[k+1]
+            numer = ax*(by*cz-bz*cy) + ay*(bz*cx-bx*cz) + az*(bx*cy-by*cx)
+            denom = 1 + (ax*bx+ay*by+az*bz) + (bx*cx+by*cy+bz*cz) \
+                + (cx*ax+cy*ay+cz*az)
+            excess += np.arctan2(numer, denom)
+        areas[chunk] = 2*np.abs(excess)
+    areas[~valid_corners(corners)] = np.nan
+    return areas.reshape(corners.shape[2:])
+
+
+def centers(polys):
+    """Returns the normalized vertex mean of each polygon and the largest
+    chord distance between that center and any vertex of the polygon."""
+    c = polys.mean(axis=1)
+    c /= np.linalg.norm(c, axis=-1, keepdims=True)
+    radii = np.linalg.norm(polys - c[:, np.newaxis, :], axis=-1).max(axis=1)
+    return c, radii
+
+
+def clip(subjects, clippers):
+    """Intersects pairs of convex spherical polygons with the
+    Sutherland-Hodgman algorithm, vectorized over all pairs. The subject
+    polygons (npairs, nverts, 3) are successively clipped against the great
+    circles through the edges of the counter-clockwise clip polygons (npairs,
+    nclip, 3). Returns the intersection polygons (npairs, nout, 3) together
+    with the number of valid vertices of each (the remaining vertices are
+    undefined)."""
+    npairs = subjects.shape[0]
+    rows = np.arange(npairs)[:, np.newaxis]
+    polys = subjects
+    counts = np.full(npairs, subjects.shape[1])
+
+    nclip = clippers.shape[1]
+    for k in range(nclip):
+        normals = np.cross(clippers[:, k, :], clippers[:, (k+1) % nclip, :])
+        nverts = polys.shape[1]
+
+        dist = np.einsum('pvi,pi->pv', polys, normals)
+        current = np.arange(nverts)
+        previous = np.where(
+            current == 0, counts[:, np.newaxis]-1, current-1
+        )
+        active = current < counts[:, np.newaxis]
+        dist_prev = dist[rows, previous]
+        inside = dist >= 0
+        inside_prev = dist_prev >= 0
+
+        # Intersections of the edges (previous, current) with the great
+        # circle. Where an edge does not cross, the result is not used.
+        prev_verts = polys[rows, previous]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t = dist_prev / (dist_prev-dist)
+            cut = prev_verts + t[..., np.newaxis]*(polys-prev_verts)
+            cut /= np.linalg.norm(cut, axis=-1, keepdims=True)
+
+        # Each input vertex emits up to two output vertices: the
+        # intersection (if the edge crosses the great circle) followed by
+        # the vertex itself (if it is inside)
+        out = np.empty((npairs, 2*nverts, 3))
+        out[:, 0::2, :] = cut
+        out[:, 1::2, :] = polys
+        keep = np.empty((npairs, 2*nverts), dtype=bool)
+        keep[:, 0::2] = active & (inside != inside_prev)
+        keep[:, 1::2] = active & inside
+
+        # Compact the kept vertices to the front of each polygon
+        counts = keep.sum(axis=1)
+        position = np.cumsum(keep, axis=1) - 1
+        polys = np.zeros((npairs, max(counts.max(initial=0), 1), 3))
+        polys[np.nonzero(keep)[0], position[keep]] = out[keep]
+
+    return polys, counts
+
+
+def _edge_distances(polys, points):
+    """Signed distances (npairs, nedges, npoints) of points from the great
+    circle planes through the edges of counter-clockwise polygons. Points
+    inside the polygon have non-negative distances from all edges."""
+    normals = np.cross(polys, np.roll(polys, -1, axis=1))
+    return np.einsum('pki,pvi->pkv', normals, points)
+
+
+def intersection_areas(subjects, clippers):
+    """Computes the areas of the intersections of pairs of convex
+    counter-clockwise polygons. Pairs that are disjoint, or where one polygon
+    contains the other, are classified by the signs of the vertex-edge
+    distances, only the remaining pairs are actually clipped."""
+    areas = np.zeros(subjects.shape[0])
+
+    dist = _edge_distances(clippers, subjects)
+    subject_inside = np.all(dist >= 0, axis=(1, 2))
+    disjoint = np.any(np.all(dist < 0, axis=2), axis=1)
+    dist = _edge_distances(subjects, clippers)
+    clipper_inside = np.all(dist >= 0, axis=(1, 2))
+    disjoint |= np.any(np.all(dist < 0, axis=2), axis=1)
+
+    areas[subject_inside] = polygon_areas(subjects[subject_inside])
+    clipper_inside &= ~subject_inside
+    areas[clipper_inside] = polygon_areas(clippers[clipper_inside])
+
+    partial = ~(disjoint | subject_inside | clipper_inside)
+    polys, counts = clip(subjects[partial], clippers[partial])
+    areas[partial] = polygon_areas(polys, counts)
+
+    return areas
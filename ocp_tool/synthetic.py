@@ -0,0 +1,317 @@
+"""Synthetic input files for testing and benchmarking
+
+Generates structurally valid inputs of any size without external data:
+
+- ICMGG????INIT files (GRIB) with lsm, slt and cl on any reduced Gaussian
+  grid, e.g. the octahedral TCO grids of octahedral_grid(),
+- NEMO domain_cfg and mask files for ORCA-like tripolar grids of any shape.
+
+All fields derive from the same idealized continents (spherical caps, see
+land_fraction()), so masks of the atmosphere and ocean grids match where
+both resolve them. The continents include an inland lake ('Caspian'), which
+is water in the GRIB lsm (and lake cover cl) but land in the ocean grid.
+
+The ORCA-like grid is regular in latitude and longitude south of CAP_LAT.
+North of it, grid lines are nested ellipses in polar stereographic
+coordinates, which collapse to the segment between the two northern grid
+poles (on land, at POLE_LON and POLE_LON+180). This segment is the north
+fold with F-point pivot: the last T row mirrors the row before it, as in
+ORCA1. The first and last columns are the east-west halo. Note that
+ocp_tool.grids.ORCA only reads the registered ORCA shapes (ORCA1 and ORCA025
+with 75 levels).
+
+Files can be written with python -m ocp_tool.synthetic, see main().
+"""
+import argparse
+import functools
+import re
+
+import numpy as np
+import eccodes as ecc
+from netCDF4 import Dataset
+from numpy.polynomial.legendre import leggauss
+
+from . import spherical
+from .grids import ReducedGaussianGrid, factory
+from .grids.earth import RADIUS as EARTH_RADIUS
+
+
+# Idealized continents: center latitude, longitude and radius (degrees)
+CONTINENTS = (
+    (45, -100, 30),  # North America
+    (-15, -60, 20),  # South America
+    (72, -40, 10),  # Greenland
+    (5, 20, 28),  # Africa
+    (50, 80, 35),  # Eurasia
+    (-25, 135, 15),  # Australia
+    (-90, 0, 20),  # Antarctica
+)
+LAKES = (
+    (42, 50, 5),  # Caspian
+)
+
+# Geometry of the ORCA-like grid
+SOUTH_LAT = -78
+CAP_LAT = 20
+POLE_LON = 80
+POLE_DISTANCE = 0.5  # distance of the poles from the fold center, 0..1
+
+
+@functools.lru_cache(maxsize=None)
+def gaussian_latitudes(N):
+    """The 2N Gaussian latitudes (from north to south) of a grid with N
+    latitudes per hemisphere"""
+    nodes, _ = leggauss(2*N)
+    lats = np.degrees(np.arcsin(nodes))[::-1]
+    lats.flags.writeable = False
+    return lats
+
+
+def octahedral_nlons(N):
+    """Number of cells per latitude row (from north to south) of an
+    octahedral grid with N latitudes per hemisphere"""
+    half = 20 + 4*np.arange(N)
+    return np.concatenate((half, half[::-1]))
+
+
+def octahedral_grid(truncation):
+    """Returns the reduced Gaussian grid TCO<truncation> (cubic octahedral,
+    with truncation+1 latitudes per hemisphere)"""
+    N = truncation + 1
+    return ReducedGaussianGrid(
+        lats=gaussian_latitudes(N), nlons=octahedral_nlons(N)
+    )
+
+
+def grid(name):
+    """Returns the reduced Gaussian grid for 'name', which is TCO<truncation>
+    for any octahedral grid or the name of a packaged grid (e.g. TL159)"""
+    match = re.fullmatch(r'TCO(\d+)', name)
+    if match:
+        return octahedral_grid(int(match.group(1)))
+    reduced = factory(name)
+    if not isinstance(reduced, ReducedGaussianGrid):
+        raise ValueError(f'Not a reduced Gaussian grid: {name}')
+    return reduced
+
+
+def _fraction(lats, lons, caps, width):
+    """Fraction of cells (given by their centers) covered by the union of
+    spherical caps, with a linear transition of 'width' degrees"""
+    points = spherical.to_xyz(lats, lons)
+    fraction = np.zeros(np.shape(lats))
+    for lat, lon, radius in caps:
+        cosines = points @ spherical.to_xyz(lat, lon)
+        distance = np.degrees(np.arccos(np.clip(cosines, -1, 1)))
+        np.maximum(
+            fraction, np.clip(0.5 - (distance-radius)/width, 0, 1),
+            out=fraction
+        )
+    return fraction
+
+
+def land_fraction(lats, lons, lakes=True, width=1.0):
+    """Land fraction of the idealized continents at the cell centers. With
+    'lakes', lakes are water, otherwise land."""
+    land = _fraction(lats, lons, CONTINENTS, width)
+    if lakes:
+        land *= 1 - _fraction(lats, lons, LAKES, width)
+    return land
+
+
+def _icmgg_fields(lats, lons):
+    lsm = land_fraction(lats, lons)
+    # Soil types 1..7 in latitude bands on land, 0 on water
+    slt = np.where(lsm > 0.5, 1 + ((lats+90)//30) % 7, 0)
+    cl = _fraction(lats, lons, LAKES, 1.0)
+    return {'lsm': lsm, 'slt': slt, 'cl': cl}
+
+
+def write_icmgg_init(filename, reduced, shortnames=('lsm', 'slt', 'cl')):
+    """Writes a GRIB file (like ICMGG????INIT) with one message per
+    shortName (lsm, slt and/or cl) on the reduced Gaussian grid 'reduced'"""
+    fields = _icmgg_fields(
+        reduced.cell_latitudes(), reduced.cell_longitudes()
+    )
+    unknown = set(shortnames) - set(fields)
+    if unknown:
+        raise ValueError(f'Unknown shortNames: {", ".join(sorted(unknown))}')
+    nlons = np.asarray(reduced.nlons)
+    with open(filename, 'wb') as f:
+        for name in shortnames:
+            gid = ecc.codes_grib_new_from_samples('reduced_gg_pl_grib2')
+            try:
+                ecc.codes_set(gid, 'N', int(nlons.size//2))
+                ecc.codes_set(gid, 'Nj', int(nlons.size))
+                ecc.codes_set_array(gid, 'pl', nlons)
+                ecc.codes_set(
+                    gid, 'latitudeOfFirstGridPointInDegrees', reduced.lats[0]
+                )
+                ecc.codes_set(
+                    gid, 'latitudeOfLastGridPointInDegrees', reduced.lats[-1]
+                )
+                ecc.codes_set(
+                    gid, 'longitudeOfLastGridPointInDegrees',
+                    360 - 360/nlons.max()
+                )
+                ecc.codes_set(gid, 'shortName', name)
+                ecc.codes_set_values(gid, fields[name].astype('float64'))
+                ecc.codes_write(gid, f)
+            finally:
+                ecc.codes_release(gid)
+
+
+def _orca_points(nx, ny, i, j):
+    """Latitudes and longitudes of the ORCA-like grid at fractional column
+    and row indices (T-points at integers, U at i+1/2, V at j+1/2, F at
+    both)"""
+    fold = ny - 1.5
+    ncap = fold * (90-CAP_LAT) / (90-SOUTH_LAT)
+    start = fold - ncap
+    angle = 2*np.pi*(i-1)/(nx-2)
+
+    # Nested ellipses in polar stereographic coordinates, from the circle
+    # at CAP_LAT to the segment between the poles. Beyond the fold, the
+    # signed minor axis mirrors the points.
+    r0 = np.tan(np.radians(90-CAP_LAT)/2)
+    pole = POLE_DISTANCE * r0
+    distance = (fold-j) / ncap
+    x = (pole + (r0-pole)*np.abs(distance)) * np.cos(angle)
+    y = r0*distance * np.sin(angle)
+    cap_lats = 90 - 2*np.degrees(np.arctan(np.hypot(x, y)))
+    cap_lons = np.degrees(np.arctan2(y, x))
+
+    south_lats = SOUTH_LAT + (CAP_LAT-SOUTH_LAT)*j/start
+    south_lons = np.degrees(angle)
+
+    in_cap = j > start
+    lats = np.where(in_cap, cap_lats, south_lats)
+    lons = np.where(in_cap, cap_lons, south_lons) + POLE_LON
+    return lats, (lons+180) % 360 - 180
+
+
+def _orca_distance(nx, ny, i0, j0, i1, j1):
+    """Distances (m) between two sets of points of the ORCA-like grid"""
+    a = spherical.to_xyz(*_orca_points(nx, ny, i0, j0))
+    b = spherical.to_xyz(*_orca_points(nx, ny, i1, j1))
+    return EARTH_RADIUS * np.arctan2(
+        np.linalg.norm(np.cross(a, b), axis=-1),
+        np.einsum('...k,...k', a, b)
+    )
+
+
+def _fold_mirror(nx):
+    """Column indices of the T-points that the last row mirrors (for the
+    inner columns 1..nx-2)"""
+    return 1 + (1 - np.arange(1, nx-1)) % (nx-2)
+
+
+def write_domain_cfg(filename, nx=362, ny=292, nz=75):
+    """Writes a NEMO domain_cfg file for an ORCA-like tripolar grid of shape
+    (ny, nx), including the halo columns, with nz levels. Coordinates and
+    scale factors of all subgrids (t, u, v, f) are computed from the
+    analytic grid, top_level and bottom_level from the idealized continents
+    (without lakes)."""
+    if nx < 4 or ny < 4:
+        raise ValueError(f'Grid too small: {nx}x{ny}')
+    j, i = np.mgrid[0:ny, 0:nx].astype('float64')
+    offsets = {'t': (0, 0), 'u': (0.5, 0), 'v': (0, 0.5), 'f': (0.5, 0.5)}
+
+    with Dataset(filename, 'w') as nc:
+        nc.createDimension('t', None)
+        nc.createDimension('z', nz)
+        nc.createDimension('y', ny)
+        nc.createDimension('x', nx)
+
+        for name, value in (
+                ('jpiglo', nx), ('jpjglo', ny), ('jpkglo', nz),
+                ('jperio', 6),  # cyclic east-west, north fold F-point pivot
+        ):
+            nc.createVariable(name, 'i4')[...] = value
+
+        for subgrid, (di, dj) in offsets.items():
+            lats, lons = _orca_points(nx, ny, i+di, j+dj)
+            e1 = _orca_distance(nx, ny, i+di-0.5, j+dj, i+di+0.5, j+dj)
+            e2 = _orca_distance(nx, ny, i+di, j+dj-0.5, i+di, j+dj+0.5)
+            for name, values in (
+                    (f'glam{subgrid}', lons),
+                    (f'gphi{subgrid}', lats),
+                    (f'e1{subgrid}', e1),
+                    (f'e2{subgrid}', e2),
+            ):
+                nc.createVariable(name, 'f8', ('t', 'y', 'x'))[0] = values
+            if subgrid == 't':
+                nc.createVariable('nav_lon', 'f4', ('y', 'x'))[:] = lons
+                nc.createVariable('nav_lat', 'f4', ('y', 'x'))[:] = lats
+                ocean = land_fraction(lats, lons, lakes=False) < 0.5
+
+        # Make the halo and the fold row exact copies
+        ocean[:, 0] = ocean[:, -2]
+        ocean[:, -1] = ocean[:, 1]
+        ocean[-1, 1:-1] = ocean[-2, _fold_mirror(nx)]
+
+        nc.createVariable('top_level', 'i4', ('t', 'y', 'x'))[0] = ocean
+        nc.createVariable('bottom_level', 'i4', ('t', 'y', 'x'))[0] = \
+            ocean*nz
+
+
+def write_nemo_masks(filename, domain_cfg):
+    """Writes a NEMO mask file (tmaskutil, umaskutil, vmaskutil, 1 for
+    ocean) derived from top_level of a domain_cfg file"""
+    with Dataset(domain_cfg) as nc:
+        tmask = (nc.variables['top_level'][0, ...].data > 0).astype('i4')
+    umask = tmask * np.roll(tmask, -1, axis=1)
+    vmask = tmask * np.append(tmask[1:], tmask[-1:], axis=0)
+    with Dataset(filename, 'w') as nc:
+        nc.createDimension('t', None)
+        nc.createDimension('y', tmask.shape[0])
+        nc.createDimension('x', tmask.shape[1])
+        for name, mask in (
+                ('tmaskutil', tmask),
+                ('umaskutil', umask),
+                ('vmaskutil', vmask),
+        ):
+            nc.createVariable(name, 'i1', ('t', 'y', 'x'))[0] = mask
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m ocp_tool.synthetic',
+        description='Write synthetic input files for testing',
+    )
+    subparsers = parser.add_subparsers(dest='kind', required=True)
+    icmgg = subparsers.add_parser(
+        'icmgg', help='ICMGG INIT file (GRIB) with lsm, slt and cl'
+    )
+    icmgg.add_argument('file', help='GRIB file to write')
+    icmgg.add_argument(
+        '--grid', required=True,
+        help='TCO<truncation> or the name of a packaged reduced Gaussian grid'
+    )
+    nemo = subparsers.add_parser(
+        'nemo', help='NEMO domain_cfg (and mask) file of an ORCA-like grid'
+    )
+    nemo.add_argument('file', help='domain_cfg file to write')
+    nemo.add_argument(
+        '--shape', default='362x292', metavar='NXxNY',
+        help='number of columns and rows, including the halo '
+             '(default: %(default)s)'
+    )
+    nemo.add_argument(
+        '--levels', type=int, default=75,
+        help='number of levels (default: %(default)s)'
+    )
+    nemo.add_argument('--masks', help='mask file to write')
+    args = parser.parse_args(args)
+
+    if args.kind == 'icmgg':
+        write_icmgg_init(args.file, grid(args.grid))
+    else:
+        nx, ny = (int(n) for n in args.shape.lower().split('x'))
+        write_domain_cfg(args.file, nx, ny, args.levels)
+        if args.masks:
+            write_nemo_masks(args.masks, args.file)
+
+
+if __name__ == '__main__':
+    main()
@@ -7,10 +7,16 @@ setuptools.setup(
     author_email='jan.streffing@awi.de',
     description='Tool to generate OASIS files for coupling OpenIFS, FESOM2, and NEMO',
     url='https://github.com/JanStreffing/ocp-tool',
-    packages=setuptools.find_packages(),
-    python_requires='>=3.6',
+    packages=setuptools.find_packages(
+        exclude=['benchmarks', 'benchmarks.*']
+    ),
+    package_data={
+        'ocp_tool.grids.oifs': ['definitions.npz'],
+    },
+    python_requires='>=3.7',
     install_requires=[
         'numpy',
+        'scipy',
         'netcdf4',
         'eccodes',
     ],
@@ -0,0 +1,51 @@
+"""Cell areas from corner polygons (ocp_tool.oasis.polygon_areas, with great
+circle edges) against the latitude band areas of regular lat/lon grids"""
+import numpy as np
+import pytest
+
+from ocp_tool import oasis
+from ocp_tool.grids import RegularLatLonGrid
+from ocp_tool.grids.earth import RADIUS as EARTH_RADIUS
+
+
+def _segment(lats, dlon):
+    """Area (steradians) between the latitude circle at 'lats' (>= 0) and
+    the great circle through two of its points 'dlon' apart, i.e. the
+    sector of the cap north of lats minus the spherical triangle of the
+    pole and the two points"""
+    sector = dlon * (1 - np.sin(lats))
+    t = np.tan((np.pi/2 - lats)/2)**2
+    triangle = 2*np.arctan2(t*np.sin(dlon), 1 + t*np.cos(dlon))
+    return sector - triangle
+
+
+@pytest.mark.parametrize('nlats, nlons', [(18, 36), (90, 180), (180, 360)])
+def test_regular_latlon(nlats, nlons):
+    grid = RegularLatLonGrid(nlats=nlats, nlons=nlons)
+    polygon = oasis.polygon_areas(grid.cell_corners()) / EARTH_RADIUS**2
+    band = grid.cell_areas() / EARTH_RADIUS**2
+
+    # The polygons tile the sphere
+    np.testing.assert_allclose(polygon.sum(), 4*np.pi, rtol=1e-12)
+
+    # Great circle edges bulge poleward: the polygon gains the segment at
+    # its poleward edge and loses the one at its equatorward edge
+    corners = np.radians(grid.cell_corners()[0])
+    upper = np.abs(corners[0])
+    lower = np.abs(corners[2])
+    poleward = np.maximum(upper, lower)
+    equatorward = np.minimum(upper, lower)
+    dlon = np.radians(360/nlons)
+    expected = band + _segment(poleward, dlon) - _segment(equatorward, dlon)
+    np.testing.assert_allclose(polygon, expected, rtol=1e-9, atol=1e-15)
+    assert np.abs(polygon/band - 1).max() > 1e-6
+
+
+def test_area_difference():
+    reference = np.array([1., 2., 4., 0., np.nan])
+    areas = np.array([1.1, 2., 3., 5., 1.])
+    difference = oasis.area_difference(areas, reference)
+    assert difference.max == pytest.approx(0.25)
+    assert difference.mean == pytest.approx(0.35/3)
+    assert difference.total == pytest.approx(6.1/7 - 1)
+    assert np.isnan(oasis.area_difference(areas, np.zeros(5)).max)
@@ -0,0 +1,67 @@
+"""Tests of the basin detection in ocp_tool.basins on small structured grids
+and on the synthetic TCO95 and ORCA1 grids of ocp_tool.synthetic, whose only
+enclosed water body is the lake in synthetic.LAKES"""
+import numpy as np
+
+from ocp_tool import basins, grids, spherical, synthetic
+
+
+def test_label_structured():
+    wet = np.array([
+        [1, 1, 0, 0, 1],
+        [0, 0, 0, 1, 1],
+        [1, 0, 1, 0, 1],
+    ], dtype=bool)
+    labels, sizes = basins.label(
+        basins.structured_adjacency(wet.shape), wet
+    )
+    # The first and last columns are connected (periodic)
+    np.testing.assert_array_equal(sizes, [7, 1])
+    assert labels[0, 0] == labels[0, 4] == labels[2, 0] == 0
+    assert labels[2, 2] == 1
+    np.testing.assert_array_equal(labels[~wet], -1)
+
+    _, sizes = basins.label(
+        basins.structured_adjacency(wet.shape, periodic=False), wet
+    )
+    np.testing.assert_array_equal(sizes, [4, 2, 1, 1])
+
+
+def test_label_reduced_gaussian():
+    reduced = synthetic.octahedral_grid(95)
+    lats = reduced.cell_latitudes()
+    lons = reduced.cell_longitudes()
+    wet = synthetic.land_fraction(lats, lons) < 0.5
+    labels, sizes = basins.label(basins.adjacency(reduced), wet)
+    assert sizes.size == 2
+    assert sizes.sum() == wet.sum()
+    np.testing.assert_array_equal(np.bincount(labels[wet]), sizes)
+
+
+def test_inland_basins(tmp_path):
+    atm_grid = synthetic.octahedral_grid(95)
+    atm_lats = atm_grid.cell_latitudes()
+    atm_lons = atm_grid.cell_longitudes()
+    atm_wet = synthetic.land_fraction(atm_lats, atm_lons) < 0.5
+
+    domain_cfg = tmp_path / 'domain_cfg.nc'
+    synthetic.write_domain_cfg(str(domain_cfg))
+    ocean_grid = grids.factory('ORCA', str(domain_cfg))
+    ocean_wet = ocean_grid.cell_masks() == 0
+    _, ocean_sizes = basins.label(basins.adjacency(ocean_grid), ocean_wet)
+    assert ocean_sizes.size == 1
+
+    ocean, lake = basins.inland_basins(
+        atm_grid, atm_wet, ocean_grid, ocean_wet
+    )
+    assert ocean.ocean_label == 0
+    assert lake.ocean_label is None
+    assert ocean.size + lake.size == atm_wet.sum()
+    assert lake.size == lake.cells.size
+
+    # All lake cells lie within the lake of the synthetic continents
+    lake_lat, lake_lon, lake_radius = synthetic.LAKES[0]
+    cosines = spherical.to_xyz(
+        atm_lats[lake.cells], atm_lons[lake.cells]
+    ) @ spherical.to_xyz(lake_lat, lake_lon)
+    assert np.all(np.degrees(np.arccos(cosines)) < lake_radius + 1)
@@ -0,0 +1,39 @@
+"""Importing ocp_tool.grids stays lightweight: no netCDF, GRIB or scipy
+modules, and a short import time (measured in a fresh interpreter)"""
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+# Only needed for ORCA grids, GRIB files or remapping
+HEAVY_MODULES = ('netCDF4', 'eccodes', 'gribapi', 'scipy')
+
+# Generous limit (seconds), the import takes about 0.1 s
+MAX_IMPORT_TIME = 2.0
+
+SCRIPT = f'''
+import json, sys, time
+start = time.perf_counter()
+import ocp_tool.grids
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    'elapsed': elapsed,
+    'loaded': [m for m in {HEAVY_MODULES!r} if m in sys.modules],
+}}))
+'''
+
+
+def test_import_grids():
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(
+        filter(None, (ROOT, env.get('PYTHONPATH')))
+    )
+    result = json.loads(subprocess.run(
+        [sys.executable, '-c', SCRIPT],
+        check=True, capture_output=True, text=True, env=env,
+    ).stdout)
+    assert not result['loaded'], \
+        f'Importing ocp_tool.grids loads {", ".join(result["loaded"])}'
+    assert result['elapsed'] < MAX_IMPORT_TIME
@@ -0,0 +1,123 @@
+"""Regression tests of ocp_tool.grids.legacy against the cell-by-cell loops
+of the original ocp-tool.py (extract_grid_data, calculate_corner_latlon and
+calculate_area), which are kept here as the reference"""
+import os
+
+import numpy as np
+import pytest
+
+from ocp_tool.grids import ReducedGaussianGrid
+from ocp_tool.grids import legacy
+
+INPUT = os.path.join(os.path.dirname(__file__), '..', 'input')
+EARTH_RADIUS = 6371. * 1e3
+
+
+def read_grid_lines(grid_file):
+    with open(os.path.join(INPUT, grid_file)) as f:
+        return f.readlines()
+
+
+def extract_grid_data(lines):
+    lons_list = []
+    lats_list = []
+    numlons_list = []
+    dlon_list = []
+    lat_list = []
+    for line in lines[3:]:
+        _, red_points, _, lat = (float(z) for z in line.split())
+        dlon = float(360)/red_points
+        lons = np.arange(0, 360-0.000000001, dlon)
+        numlons_list.append(int(red_points))
+        dlon_list.append(dlon)
+        lat_list.append(lat)
+        lons_list.extend(lons)
+        lats_list.extend([lat]*len(lons))
+    return lons_list, lats_list, numlons_list, dlon_list, lat_list
+
+
+def _dlat(ii, lat_list):
+    lat = lat_list[ii]
+    if ii == 0:
+        return 90 - lat, (lat - lat_list[ii+1]) / 2.
+    if ii == len(lat_list)-1:
+        return (lat_list[ii-1] - lat) / 2., lat + 90
+    return (lat_list[ii-1] - lat) / 2., (lat - lat_list[ii+1]) / 2.
+
+
+def calculate_corner_latlon(lats_list, lons_list, numlons_list, dlon_list,
+                            lat_list):
+    center_lons = np.array(lons_list, dtype='float32')[np.newaxis, :]
+    center_lats = np.array(lats_list, dtype='float32')[np.newaxis, :]
+    nx = center_lons.shape[1]
+    crn_lons = np.zeros((4, 1, nx))
+    crn_lats = np.zeros((4, 1, nx))
+    kk = 0
+    for ii, ni in enumerate(numlons_list):
+        dlon = dlon_list[ii]
+        lat = lat_list[ii]
+        lons = np.arange(0, 360, dlon)
+        dlat_n, dlat_s = _dlat(ii, lat_list)
+        for jj in range(ni):
+            crn_lons[0, 0, kk] = lons[jj] + dlon/2.
+            crn_lats[0, 0, kk] = lat + dlat_n/2.
+            crn_lons[1, 0, kk] = lons[jj] - dlon/2.
+            crn_lats[1, 0, kk] = lat + dlat_n/2.
+            crn_lons[2, 0, kk] = lons[jj] - dlon/2.
+            crn_lats[2, 0, kk] = lat - dlat_s/2.
+            crn_lons[3, 0, kk] = lons[jj] + dlon/2.
+            crn_lats[3, 0, kk] = lat - dlat_s/2.
+            kk += 1
+    center_lons = np.where(center_lons > 180, center_lons - 360, center_lons)
+    crn_lons = np.where(crn_lons > 180, crn_lons - 360, crn_lons)
+    return center_lats, center_lons, crn_lats, crn_lons
+
+
+def calculate_area(center_lons, numlons_list, dlon_list, lat_list):
+    gridcell_area = np.zeros((1, center_lons.shape[1]))
+    kk = 0
+    for ii, ni in enumerate(numlons_list):
+        dlon = dlon_list[ii]
+        lat = lat_list[ii]
+        dlat_n, dlat_s = _dlat(ii, lat_list)
+        dx = dlon * np.pi/180. * EARTH_RADIUS * np.cos(np.pi/180. * lat)
+        dy = (dlat_n + dlat_s) * np.pi/180. * EARTH_RADIUS
+        area = dx * dy
+        for jj in range(ni):
+            gridcell_area[0, kk] = area
+            kk += 1
+    return gridcell_area
+
+
+@pytest.mark.parametrize('grid_file', [
+    'gaussian_grids_linear_reduced/n80_reduced.txt',  # TL159
+    'gaussian_grids_octahedral_reduced/o96_reduced.txt',  # TCO95
+])
+def test_geometry_matches_original(grid_file):
+    lines = read_grid_lines(grid_file)
+    lons_list, lats_list, numlons_list, dlon_list, lat_list = \
+        extract_grid_data(lines)
+    center_lats, center_lons, crn_lats, crn_lons = calculate_corner_latlon(
+        lats_list, lons_list, numlons_list, dlon_list, lat_list
+    )
+    areas = calculate_area(center_lons, numlons_list, dlon_list, lat_list)
+
+    grid_table = np.loadtxt(lines[3:], ndmin=2)
+    grid = ReducedGaussianGrid(lats=grid_table[:, 3],
+                               nlons=grid_table[:, 1].astype(int))
+    geometry = legacy.geometry(grid)
+
+    for expected, actual in (
+            (center_lats, geometry.center_lats),
+            (center_lons, geometry.center_lons),
+            (crn_lats, geometry.crn_lats),
+            (crn_lons, geometry.crn_lons),
+            (areas, geometry.areas),
+    ):
+        assert actual.dtype == expected.dtype
+        np.testing.assert_array_equal(actual, expected)
+    assert np.all(np.abs(geometry.crn_lons) <= 180)
+
+    point_lats, point_lons = legacy.point_coordinates(grid)
+    np.testing.assert_array_equal(point_lats, lats_list)
+    np.testing.assert_array_equal(point_lons, lons_list)
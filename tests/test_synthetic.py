@@ -0,0 +1,75 @@
+"""The synthetic input files of ocp_tool.synthetic load with the readers
+used by the tool"""
+import numpy as np
+
+from ocp_tool import grib, grids, synthetic
+from ocp_tool.grids.earth import RADIUS as EARTH_RADIUS
+
+
+def _lon_difference(a, b):
+    return np.abs((a - b + 180) % 360 - 180)
+
+
+def test_domain_cfg(tmp_path):
+    domain_cfg = str(tmp_path / 'domain_cfg.nc')
+    masks = str(tmp_path / 'masks.nc')
+    synthetic.write_domain_cfg(domain_cfg)
+    synthetic.write_nemo_masks(masks, domain_cfg)
+
+    orca = grids.factory('ORCA', domain_cfg, masks)
+    assert orca.name == 'ORCA1L75'
+    lats = orca.cell_latitudes()
+    lons = orca.cell_longitudes()
+    assert lats.shape == lons.shape == (292, 362)
+    assert lats.min() == synthetic.SOUTH_LAT and lats.max() < 90
+
+    # East-west halo and north fold (F-point pivot) of the T-points
+    assert _lon_difference(lons[:, 0], lons[:, -2]).max() < 1e-9
+    assert _lon_difference(lons[:, -1], lons[:, 1]).max() < 1e-9
+    mirror = synthetic._fold_mirror(362)
+    np.testing.assert_allclose(lats[-1, 1:-1], lats[-2, mirror], atol=1e-9)
+    assert _lon_difference(lons[-1, 1:-1], lons[-2, mirror]).max() < 1e-9
+
+    for subgrid in ('t', 'u', 'v'):
+        cell_masks = orca.cell_masks(subgrid)
+        assert cell_masks.shape == (292, 362)
+        assert set(np.unique(cell_masks)) == {0, 1}
+        # V-cells on the fold collapse at the grid poles, which are on land
+        areas = orca.cell_areas(subgrid)
+        assert np.all(areas >= 0)
+        assert np.all(areas[cell_masks == 0] > 0)
+        assert orca.cell_corners(subgrid).shape == (2, 4, 292, 362)
+
+    # Without halo and fold rows, the cells cover the sphere north of
+    # SOUTH_LAT
+    area = orca.cell_areas()[:-1, 1:-1].sum()
+    np.testing.assert_allclose(
+        area / (4*np.pi*EARTH_RADIUS**2),
+        (1 + np.sin(np.radians(-synthetic.SOUTH_LAT))) / 2,
+        rtol=0.02
+    )
+
+
+def test_icmgg_init(tmp_path):
+    reduced = synthetic.octahedral_grid(95)
+    filename = str(tmp_path / 'ICMGGsyntINIT')
+    synthetic.write_icmgg_init(filename, reduced)
+
+    size = reduced.cell_latitudes().size
+    fields = grib.read(filename, ('lsm', 'cl', 'slt'))
+    for name, values in fields.items():
+        assert values is not None and values.size == size, name
+    assert 0 <= fields['lsm'].min() and fields['lsm'].max() <= 1
+    assert 0 <= fields['cl'].min() and fields['cl'].max() <= 1
+    assert fields['cl'].max() > 0.5
+    np.testing.assert_allclose(
+        fields['lsm'],
+        synthetic.land_fraction(
+            reduced.cell_latitudes(), reduced.cell_longitudes()
+        ),
+        atol=1e-6
+    )
+
+    read_back = grib.read_grid(filename)
+    np.testing.assert_array_equal(read_back.nlons, reduced.nlons)
+    np.testing.assert_allclose(read_back.lats, reduced.lats, atol=1e-9)